@@ -0,0 +1,43 @@
+"""use_lz4_compression_for_rss_posts_content
+
+Revision ID: 5d2e8b7c4a19
+Revises: 8852fda0d953
+Create Date: 2026-10-16 10:12:44.318207
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2e8b7c4a19"
+down_revision: Union[str, Sequence[str], None] = "8852fda0d953"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Newly written values are TOASTed with lz4; existing rows are
+    # recompressed the next time they are updated. Servers built without
+    # lz4 reject SET COMPRESSION lz4, so they keep the default.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM pg_settings
+                WHERE name = 'default_toast_compression' AND 'lz4' = ANY(enumvals)
+            ) THEN
+                ALTER TABLE rss_posts ALTER COLUMN content SET COMPRESSION lz4;
+            END IF;
+        END $$;
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE rss_posts ALTER COLUMN content SET COMPRESSION default")
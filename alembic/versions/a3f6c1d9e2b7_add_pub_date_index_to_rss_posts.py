@@ -0,0 +1,29 @@
+"""add_pub_date_index_to_rss_posts
+
+Revision ID: a3f6c1d9e2b7
+Revises: 5d2e8b7c4a19
+Create Date: 2026-10-16 11:02:17.550381
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a3f6c1d9e2b7"
+down_revision: Union[str, Sequence[str], None] = "5d2e8b7c4a19"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Serves the "recent" stats count and date range lookups
+    op.create_index("idx_rss_posts_pub_date", "rss_posts", ["pub_date"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_rss_posts_pub_date", table_name="rss_posts")
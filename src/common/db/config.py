@@ -1,6 +1,8 @@
 """Database configuration for asyncpg."""
 
 import os
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -10,14 +12,28 @@ if env_path.exists():
     load_dotenv(env_path)
 
 
+@dataclass(frozen=True, slots=True)
 class Settings:
-    def __init__(self):
-        self.dsn = os.getenv("DATABASE_DSN")
-        if self.dsn is None:
+    """Database settings."""
+
+    dsn: str
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Read settings from the environment."""
+        dsn = os.getenv("DATABASE_DSN")
+        if dsn is None:
             raise EnvironmentError("DATABASE_DSN not set")
+        return cls(dsn=dsn)
 
     def get_dsn(self) -> str:
         return self.dsn
 
 
-settings = Settings()
+@cache
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading the environment only once."""
+    return Settings.from_env()
+
+
+settings = get_settings()
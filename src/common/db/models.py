@@ -1,12 +1,47 @@
 """Data models for RSS posts (dataclass representations)."""
 
-from dataclasses import dataclass, asdict
+import re
+from dataclasses import dataclass, fields
 from datetime import datetime
 from typing import Optional
 from email.utils import parsedate_to_datetime
 
 
-@dataclass
+def _parse_iso_datetime(date_str: str) -> datetime:
+    """Parse an ISO 8601 datetime, accepting a trailing "Z"."""
+    return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+
+
+# The RFC 2822 shape RSS feeds emit, e.g. 'Fri, 09 Jan 2026 10:15:06 +0000'
+_RFC2822_REGEX = re.compile(
+    r"(?:[A-Za-z]{3}, )?(\d{1,2}) ([A-Za-z]{3}) (\d{4}) (\d{2}):(\d{2})(?::(\d{2}))?"
+    r"(?: (?:[+-]\d{4}|[A-Za-z]{1,5}))?"
+)
+_MONTHS = {
+    month: number
+    for number, month in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), 1
+    )
+}
+
+
+def _parse_rfc2822_datetime(date_str: str) -> datetime:
+    """Parse the common RFC 2822 form into a naive datetime in its own local time.
+
+    Equivalent to parsedate_to_datetime() with the offset dropped, without its
+    general-purpose tokenizer. Other shapes raise ValueError.
+    """
+    match = _RFC2822_REGEX.fullmatch(date_str)
+    if match is None:
+        raise ValueError(f"Not an RFC 2822 date: {date_str}")
+    day, month, year, hour, minute, second = match.groups()
+    month_number = _MONTHS.get(month.lower())
+    if month_number is None:
+        raise ValueError(f"Unknown month in date: {date_str}")
+    return datetime(int(year), month_number, int(day), int(hour), int(minute), int(second or 0))
+
+
+@dataclass(slots=True)
 class TelegramChannel:
     """Dataclass representation of a Telegram channel."""
 
@@ -18,8 +53,8 @@ class TelegramChannel:
     updated_at: Optional[datetime] = None
 
     def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary (a shallow copy of the fields)."""
+        return {name: getattr(self, name) for name in _TELEGRAM_CHANNEL_FIELDS}
 
     @staticmethod
     def from_row(row: dict) -> "TelegramChannel":
@@ -34,7 +69,7 @@ class TelegramChannel:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RSSPost:
     """Dataclass representation of an RSS post."""
 
@@ -64,16 +99,19 @@ class RSSPost:
         """
         dt = None
 
-        # Try RFC 2822 format first (common in RSS feeds)
-        try:
-            dt = parsedate_to_datetime(date_str)
-        except (ValueError, TypeError):
-            pass
+        # ISO 8601 starts with the year, RFC 2822 (common in RSS feeds) usually
+        # with the weekday; try the likely format first to skip a failed parse.
+        # parsedate_to_datetime() stays as the fallback for RFC 2822 variants
+        # the fast regex does not cover (two-digit years, odd spacing, ...)
+        if date_str[:1].isdigit():
+            parsers = (_parse_iso_datetime, _parse_rfc2822_datetime, parsedate_to_datetime)
+        else:
+            parsers = (_parse_rfc2822_datetime, parsedate_to_datetime, _parse_iso_datetime)
 
-        # Try ISO 8601 format
-        if dt is None:
+        for parse in parsers:
             try:
-                dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+                dt = parse(date_str)
+                break
             except (ValueError, TypeError):
                 pass
 
@@ -88,8 +126,8 @@ class RSSPost:
         return dt
 
     def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary (a shallow copy of the fields)."""
+        return {name: getattr(self, name) for name in _RSS_POST_FIELDS}
 
     @staticmethod
     def from_row(row: dict) -> "RSSPost":
@@ -104,3 +142,8 @@ class RSSPost:
             created_at=row.get("created_at"),
             updated_at=row.get("updated_at"),
         )
+
+
+# Field names, resolved once rather than by asdict() on every call
+_TELEGRAM_CHANNEL_FIELDS = tuple(f.name for f in fields(TelegramChannel))
+_RSS_POST_FIELDS = tuple(f.name for f in fields(RSSPost))
@@ -1,27 +1,72 @@
 """Repository layer for RSS posts database operations."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 from datetime import datetime
 from .session import db
 from .models import RSSPost, TelegramChannel
+from ..utils.channel_cache import CHANNELS_INVALIDATE, ChannelCache
+
+# Batches larger than this are written with COPY instead of executemany
+_COPY_THRESHOLD = 50
+_CREATE_MANY_COLUMNS = ["link", "content", "pub_date", "media"]
+_CREATE_MANY_COLUMN_LIST = ", ".join(_CREATE_MANY_COLUMNS)
+
+
+async def _load_channels() -> List[TelegramChannel]:
+    """Load all channels, ordered by name, into the channel cache."""
+    query = """
+        SELECT * FROM telegram_channels 
+        ORDER BY channel_name ASC
+    """
+    return [TelegramChannel.from_row(row) for row in await db.fetch(query)]
+
+
+# In-process channel cache behind TelegramChannelRepository; writes made by
+# other processes reach it through the listener db.connect() registers
+_channel_cache = ChannelCache(_load_channels)
+db.add_listener(CHANNELS_INVALIDATE, _channel_cache.on_notify)
 
 
 class TelegramChannelRepository:
-    """Repository for Telegram channel operations."""
+    """Repository for Telegram channel operations.
+
+    get_all() is served from an in-process cache that it loads on first use
+    and reloads after 60 seconds; lookups by ID or name use the same cache
+    once it is loaded. Writes expire the cache here and, via NOTIFY, in every
+    other connected process.
+    """
+
+    @staticmethod
+    async def warm_cache() -> None:
+        """Load all channels into the in-process cache."""
+        await _channel_cache.warm()
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached channels and stop serving lookups from the cache."""
+        _channel_cache.clear()
+
+    @staticmethod
+    async def _invalidate(channel_id: int) -> None:
+        """Expire a channel in this and every listening process's cache."""
+        _channel_cache.expire(channel_id)
+        await db.execute("SELECT pg_notify($1, $2)", CHANNELS_INVALIDATE, str(channel_id))
 
     @staticmethod
     async def get_all() -> List[TelegramChannel]:
-        """Get all Telegram channels."""
-        query = """
-            SELECT * FROM telegram_channels 
-            ORDER BY channel_name ASC
+        """Get all Telegram channels, ordered by name.
+
+        Returns a new list on every call, so callers may modify it.
         """
-        rows = await db.fetch(query)
-        return [TelegramChannel.from_row(row) for row in rows]
+        return await _channel_cache.all()
 
     @staticmethod
     async def get_by_id(channel_id: int) -> Optional[TelegramChannel]:
         """Get channel by ID."""
+        cached = await _channel_cache.get(channel_id)
+        if cached is not None:
+            return cached
+
         query = "SELECT * FROM telegram_channels WHERE channel_id = $1"
         row = await db.fetchrow(query, channel_id)
         return TelegramChannel.from_row(row) if row else None
@@ -29,6 +74,10 @@ class TelegramChannelRepository:
     @staticmethod
     async def get_by_name(channel_name: str) -> Optional[TelegramChannel]:
         """Get channel by name."""
+        cached = await _channel_cache.find_by_name(channel_name)
+        if cached is not None:
+            return cached
+
         query = "SELECT * FROM telegram_channels WHERE channel_name = $1"
         row = await db.fetchrow(query, channel_name)
         return TelegramChannel.from_row(row) if row else None
@@ -47,16 +96,16 @@ class TelegramChannelRepository:
             INSERT INTO telegram_channels (
                 channel_id, channel_name, description, url
             ) VALUES ($1, $2, $3, $4)
-            RETURNING channel_id
         """
-        channel_id = await db.fetchval(
+        await db.execute(
             query,
             channel.channel_id,
             channel.channel_name,
             channel.description,
             channel.url,
         )
-        return channel_id
+        await TelegramChannelRepository._invalidate(channel.channel_id)
+        return channel.channel_id
 
     @staticmethod
     async def update(channel: TelegramChannel) -> None:
@@ -76,41 +125,92 @@ class TelegramChannelRepository:
             channel.description,
             channel.url,
         )
+        await TelegramChannelRepository._invalidate(channel.channel_id)
 
     @staticmethod
     async def delete(channel_id: int) -> None:
         """Delete a Telegram channel."""
         query = "DELETE FROM telegram_channels WHERE channel_id = $1"
         await db.execute(query, channel_id)
+        await TelegramChannelRepository._invalidate(channel_id)
 
 
 class RSSPostRepository:
     """Repository for RSS post operations."""
 
     @staticmethod
-    async def create(post: RSSPost) -> str:
-        """Create a new RSS post.
+    async def create(post: RSSPost) -> Optional[str]:
+        """Create a new RSS post, skipping it if the link is already stored.
 
         Args:
             post: RSSPost dataclass instance
 
         Returns:
-            Link of created post
+            Link of created post, or None if it already existed
         """
         query = """
             INSERT INTO rss_posts (
                 link, content, pub_date, media
             ) VALUES ($1, $2, $3, $4)
+            ON CONFLICT (link) DO NOTHING
             RETURNING link
         """
-        link = await db.fetchval(
+        return await db.fetchval(
             query,
             post.link,
             post.content,
             post.pub_date,
             post.media,
         )
-        return link
+
+    @staticmethod
+    async def create_many(posts: List[RSSPost]) -> int:
+        """Create many RSS posts in one round trip.
+
+        Small batches are sent as arrays and unnested in one INSERT; larger
+        ones are streamed with COPY into a staging table and moved over in
+        one INSERT. Links that are already stored (e.g. written by a
+        concurrent run after filter_existing()) are skipped instead of
+        failing the batch.
+
+        Args:
+            posts: RSSPost dataclass instances
+
+        Returns:
+            Number of posts actually inserted (skipped links are not counted)
+        """
+        if not posts:
+            return 0
+
+        records = [(post.link, post.content, post.pub_date, post.media) for post in posts]
+        async with db.transaction() as conn:
+            if len(records) <= _COPY_THRESHOLD:
+                query = f"""
+                    INSERT INTO rss_posts ({_CREATE_MANY_COLUMN_LIST})
+                    SELECT * FROM unnest($1::text[], $2::text[], $3::timestamptz[], $4::text[])
+                    ON CONFLICT (link) DO NOTHING
+                """
+                result = await conn.execute(query, *zip(*records))
+            else:
+                # COPY has no ON CONFLICT, so stage the rows and let the
+                # INSERT skip existing links
+                await conn.execute(f"""
+                    CREATE TEMP TABLE rss_posts_staging ON COMMIT DROP AS
+                    SELECT {_CREATE_MANY_COLUMN_LIST} FROM rss_posts WITH NO DATA
+                """)
+                await conn.copy_records_to_table(
+                    "rss_posts_staging", records=records, columns=_CREATE_MANY_COLUMNS
+                )
+                result = await conn.execute(f"""
+                    INSERT INTO rss_posts ({_CREATE_MANY_COLUMN_LIST})
+                    SELECT {_CREATE_MANY_COLUMN_LIST} FROM rss_posts_staging
+                    ON CONFLICT (link) DO NOTHING
+                """)
+                # ON COMMIT DROP only fires at the outermost commit, so drop it
+                # now in case the caller is already inside a transaction
+                await conn.execute("DROP TABLE rss_posts_staging")
+        # Status tag is "INSERT 0 <rows>"
+        return int(result.split()[-1])
 
     @staticmethod
     async def get_by_link(link: str) -> Optional[RSSPost]:
@@ -119,6 +219,20 @@ class RSSPostRepository:
         row = await db.fetchrow(query, link)
         return RSSPost.from_row(row) if row else None
 
+    @staticmethod
+    async def get_by_link_many(links: List[str]) -> Dict[str, RSSPost]:
+        """Get posts for many links in one query.
+
+        Args:
+            links: Post links to look up
+
+        Returns:
+            Mapping of link to RSSPost for links that exist
+        """
+        query = "SELECT * FROM rss_posts WHERE link = ANY($1::text[])"
+        rows = await db.fetch(query, links)
+        return {row["link"]: RSSPost.from_row(row) for row in rows}
+
     @staticmethod
     async def get_all(
         limit: int = 100,
@@ -184,7 +298,7 @@ class RSSPostRepository:
         query = """
             SELECT 
                 COUNT(*) as total,
-                COUNT(CASE WHEN pub_date >= NOW() - INTERVAL '7 days' THEN 1 END) as recent
+                COUNT(*) FILTER (WHERE pub_date >= NOW() - INTERVAL '7 days') as recent
             FROM rss_posts
         """
         row = await db.fetchrow(query)
@@ -193,6 +307,23 @@ class RSSPostRepository:
             "recent": row["recent"] or 0,
         }
 
+    @staticmethod
+    async def filter_existing(links: List[str]) -> Set[str]:
+        """Return the subset of links that are already stored.
+
+        Only links are read, so this is the cheap way to deduplicate a
+        batch of candidates before create_many().
+
+        Args:
+            links: Candidate post links
+
+        Returns:
+            Set of links that already exist
+        """
+        query = "SELECT link FROM rss_posts WHERE link = ANY($1::text[])"
+        rows = await db.fetch(query, links)
+        return {row["link"] for row in rows}
+
     @staticmethod
     async def exists_by_link(link: str) -> bool:
         """Check if post with given link exists."""
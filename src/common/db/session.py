@@ -1,7 +1,8 @@
 """Database connection and session management using asyncpg."""
 
 import asyncpg
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, List, Optional, Tuple
 from .config import settings
 from .schema import CREATE_POSTS_TABLE, CREATE_INDEXES
 
@@ -11,18 +12,48 @@ class Database:
 
     def __init__(self):
         self.pool: Optional[asyncpg.Pool] = None
-
-    async def connect(self) -> None:
-        """Create connection pool."""
+        # LISTEN runs on its own connection: pooled connections drop their
+        # listeners when they are released
+        self.listener: Optional[asyncpg.Connection] = None
+        self._listeners: List[Tuple[str, Callable]] = []
+
+    def add_listener(self, channel: str, callback: Callable) -> None:
+        """Subscribe a callback to a NOTIFY channel from the next connect() on.
+
+        Args:
+            channel: NOTIFY channel name
+            callback: asyncpg listener, called as (connection, pid, channel, payload)
+        """
+        self._listeners.append((channel, callback))
+
+    async def connect(self, min_size: int = 5, max_size: int = 20) -> None:
+        """Create connection pool.
+
+        Args:
+            min_size: Connections opened up front and kept open
+            max_size: Upper bound on connections under load
+        """
         self.pool = await asyncpg.create_pool(
             dsn=settings.get_dsn(),
-            min_size=5,
-            max_size=20,
+            min_size=min_size,
+            max_size=max_size,
             command_timeout=60,
+            # Pooled connections are long-lived; keep every repository query
+            # prepared so repeat calls skip Parse/Describe
+            statement_cache_size=1024,
+            max_cached_statement_lifetime=0,
         )
 
+        if self._listeners:
+            self.listener = await asyncpg.connect(dsn=settings.get_dsn())
+            for channel, callback in self._listeners:
+                await self.listener.add_listener(channel, callback)
+
     async def disconnect(self) -> None:
-        """Close connection pool."""
+        """Close connection pool and the listener connection."""
+        if self.listener:
+            await self.listener.close()
+            self.listener = None
         if self.pool:
             await self.pool.close()
 
@@ -37,13 +68,31 @@ class Database:
             # Create indexes
             await conn.execute(CREATE_INDEXES)
 
-    async def execute(self, query: str, *args) -> None:
-        """Execute a query without returning results."""
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[asyncpg.Connection]:
+        """Acquire a connection and run the enclosed statements in one transaction.
+
+        Statements executed on the yielded connection are committed together,
+        paying a single commit instead of one per statement.
+        """
+        if not self.pool:
+            raise RuntimeError("Database not connected. Call connect() first.")
+
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                yield conn
+
+    async def execute(self, query: str, *args) -> str:
+        """Execute a query without returning rows.
+
+        Returns:
+            Command status tag, e.g. "DELETE 5"
+        """
         if not self.pool:
             raise RuntimeError("Database not connected. Call connect() first.")
 
         async with self.pool.acquire() as conn:
-            await conn.execute(query, *args)
+            return await conn.execute(query, *args)
 
     async def fetch(self, query: str, *args) -> list:
         """Fetch multiple rows."""
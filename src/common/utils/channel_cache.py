@@ -0,0 +1,80 @@
+"""In-process cache of Telegram channels shared by the repository layers."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# NOTIFY channel used to keep per-process channel caches in sync
+CHANNELS_INVALIDATE = "channels_invalidate"
+
+
+class ChannelCache:
+    """Channels keyed by channel_id, in the order ``load`` returns them.
+
+    The cache is loaded on first use of all() and reloaded once it is older
+    than ``ttl`` seconds or after a channel has been expired. get() and
+    find_by_name() only answer from a loaded cache and return None
+    otherwise, so callers fall back to the database.
+    """
+
+    def __init__(self, load: Callable[[], Awaitable[List[Any]]], ttl: float = 60.0):
+        self._load = load
+        self._ttl = ttl
+        self._channels: Dict[int, Any] = {}
+        self._lock = asyncio.Lock()
+        self._expires_at: Optional[float] = None
+        self._version = 0
+
+    async def warm(self) -> None:
+        """Load all channels into the cache."""
+        version = self._version
+        channels = await self._load()
+        async with self._lock:
+            self._channels.clear()
+            self._channels.update({channel.channel_id: channel for channel in channels})
+            # A channel changed while loading: reload again on next use
+            fresh = version == self._version
+            self._expires_at = time.monotonic() + self._ttl if fresh else 0.0
+
+    def clear(self) -> None:
+        """Drop all cached channels and stop answering lookups until reloaded."""
+        self._channels.clear()
+        self._expires_at = None
+
+    def expire(self, channel_id: Optional[int] = None) -> None:
+        """Drop a changed channel (or all of them) and reload on next use."""
+        self._version += 1
+        if channel_id is not None:
+            self._channels.pop(channel_id, None)
+        else:
+            self._channels.clear()
+        if self._expires_at is not None:
+            self._expires_at = 0.0
+
+    def on_notify(self, connection, pid, channel, payload: str) -> None:
+        """asyncpg listener: expire the channel another process changed."""
+        self.expire(int(payload) if payload else None)
+
+    async def refresh_if_stale(self) -> None:
+        """Reload a loaded cache once it has expired."""
+        if self._expires_at is not None and time.monotonic() >= self._expires_at:
+            await self.warm()
+
+    async def all(self) -> List[Any]:
+        """Return all channels as a new list, loading the cache if needed."""
+        if self._expires_at is None or time.monotonic() >= self._expires_at:
+            await self.warm()
+        return list(self._channels.values())
+
+    async def get(self, channel_id: int) -> Optional[Any]:
+        """Return a cached channel by ID."""
+        await self.refresh_if_stale()
+        return self._channels.get(channel_id)
+
+    async def find_by_name(self, channel_name: str) -> Optional[Any]:
+        """Return a cached channel by name."""
+        await self.refresh_if_stale()
+        for channel in self._channels.values():
+            if channel.channel_name == channel_name:
+                return channel
+        return None
@@ -0,0 +1,22 @@
+"""Event loop selection for service entry points."""
+
+import asyncio
+from typing import Any, Coroutine
+
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion, on uvloop when it is installed.
+
+    uvloop is not available on Windows; there the stdlib loop is used.
+
+    Args:
+        main: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
@@ -2,6 +2,8 @@
 
 import html
 import re
+from functools import lru_cache
+from typing import Tuple
 
 
 # Compiled regex patterns for better performance
@@ -20,20 +22,70 @@ ACTION_LINK_REGEX = re.compile(
     r'<(?:a|span)[^>]*class="message_media_view_in_telegram"[^>]*>.*?</(?:a|span)>', re.DOTALL
 )
 
+# Replace line breaks with newlines
+BR_TAG_REGEX = re.compile(r"<br(?: ?/)?>")
+
 # Remove img tags
 IMG_TAG_REGEX = re.compile(r"<img[^>]*/?>", re.IGNORECASE)
 
 # Remove link tags but extract href
 LINK_HREF_REGEX = re.compile(r'<a[^>]*href="([^"]*)"[^>]*>', re.IGNORECASE)
 
+# Remove closing link tags
+LINK_CLOSE_REGEX = re.compile(r"</a>")
+
 # Remove emoji tags and keep the emoji
 EMOJI_REGEX = re.compile(
-    r"<tg-emoji[^>]*>.*?<b>([^<]*)</b>.*?</tg-emoji>", re.DOTALL | re.IGNORECASE
+    r"<tg-emoji[^>]*>.*?<b>(?P<emoji>[^<]*)</b>.*?</tg-emoji>", re.DOTALL | re.IGNORECASE
 )
 
 # Remove HTML tags
 HTML_TAG_REGEX = re.compile(r"<[^>]+>")
 
+# Image URLs from <img src="...">
+IMG_SRC_REGEX = re.compile(r'<img[^>]+src="([^"]+)"', re.IGNORECASE)
+
+# Video poster URLs from <video poster="...">
+VIDEO_POSTER_REGEX = re.compile(r'<video[^>]+poster="([^"]+)"', re.IGNORECASE)
+
+# Markup rewrites applied by clean_content, in order of precedence; None keeps the emoji
+_MARKUP_RULES = (
+    (UNSUPPORTED_MEDIA_REGEX, ""),
+    (MEDIA_LABEL_REGEX, ""),
+    (ACTION_LINK_REGEX, ""),
+    (BR_TAG_REGEX, "\n"),
+    (IMG_TAG_REGEX, ""),
+    (LINK_HREF_REGEX, ""),
+    (LINK_CLOSE_REGEX, ""),
+    (EMOJI_REGEX, None),
+)
+
+
+def _scoped(regex: re.Pattern) -> str:
+    """Return a markup pattern, minus its leading "<", as a group with its own flags."""
+    flags = "".join(
+        letter for flag, letter in ((re.IGNORECASE, "i"), (re.DOTALL, "s")) if regex.flags & flag
+    )
+    return f"(?{flags}:{regex.pattern.removeprefix('<')})"
+
+
+# All markup rules as a single alternation, so the content is scanned once.
+# Every rule starts with "<", which is matched up front so that the engine can
+# skip ahead to the next tag; the branches are then tried in rule order
+MARKUP_REGEX = re.compile(
+    "<(?:"
+    + "|".join(f"(?P<rule{i}>{_scoped(regex)})" for i, (regex, _) in enumerate(_MARKUP_RULES))
+    + ")"
+)
+_MARKUP_REPLACEMENTS = {f"rule{i}": repl for i, (_, repl) in enumerate(_MARKUP_RULES)}
+
+
+def _replace_markup(match: re.Match) -> str:
+    """Return the replacement for a MARKUP_REGEX match."""
+    replacement = _MARKUP_REPLACEMENTS[match.lastgroup]
+    return match["emoji"] if replacement is None else replacement
+
+
 # Normalize multiple spaces (but not newlines)
 SPACE_REGEX = re.compile(r"[ \t]+")
 
@@ -44,6 +96,9 @@ NEWLINE_REGEX = re.compile(r"\n{3,}")
 NEWLINE_SPACE_REGEX = re.compile(r"[ \t]*\n[ \t]*")
 
 
+# Feeds are re-fetched on every run and repeat the same items, so cleaned
+# results are memoized; clean_content is a pure function of its input
+@lru_cache(maxsize=1024)
 def clean_content(html_content: str) -> str:
     """
     Clean up HTML content by:
@@ -64,33 +119,18 @@ def clean_content(html_content: str) -> str:
 
     # First, unescape HTML entities to handle double-encoded content
     # (e.g., &lt;div&gt; becomes <div>)
-    content = html.unescape(html_content)
-
-    # Remove unsupported media messages
-    content = UNSUPPORTED_MEDIA_REGEX.sub("", content)
-
-    # Remove media not supported labels
-    content = MEDIA_LABEL_REGEX.sub("", content)
-
-    # Remove action links like "VIEW IN TELEGRAM"
-    content = ACTION_LINK_REGEX.sub("", content)
-
-    # Replace line breaks with newlines
-    content = content.replace("<br/>", "\n")
-    content = content.replace("<br>", "\n")
-    content = content.replace("<br />", "\n")
+    return _clean_unescaped(html.unescape(html_content))
 
-    # Remove img tags (they've been extracted)
-    content = IMG_TAG_REGEX.sub("", content)
 
-    # Remove link tags but keep the text content
-    content = LINK_HREF_REGEX.sub("", content)
-    content = content.replace("</a>", "")
+def _clean_unescaped(content: str) -> str:
+    """Clean HTML content whose entities have already been unescaped once."""
+    # Drop unsupported media and action links, turn line breaks into newlines,
+    # and unwrap links and emoji in one pass
+    content = MARKUP_REGEX.sub(_replace_markup, content)
 
-    # Remove emoji tags and keep the emoji
-    content = EMOJI_REGEX.sub(r"\1", content)
-
-    # Remove all remaining HTML tags (replace with space to avoid word concatenation)
+    # Remove remaining HTML tags (replace with space to avoid word concatenation).
+    # This stays a separate pass: in the combined pattern a "<" left in the
+    # text would let it swallow the line breaks and tags that follow
     content = HTML_TAG_REGEX.sub(" ", content)
 
     # Unescape HTML entities again (for any remaining entities in text content)
@@ -151,27 +191,36 @@ def extract_media_urls(html_content: str) -> list[str]:
     if not html_content:
         return []
 
-    media_urls = []
-
     # Unescape HTML entities first
-    content = html.unescape(html_content)
+    return _extract_unescaped(html.unescape(html_content))
 
-    # Extract image URLs from <img src="...">
-    img_pattern = re.compile(r'<img[^>]+src="([^"]+)"', re.IGNORECASE)
-    img_matches = img_pattern.findall(content)
-    media_urls.extend(img_matches)
 
-    # Extract video poster URLs from <video poster="...">
-    video_pattern = re.compile(r'<video[^>]+poster="([^"]+)"', re.IGNORECASE)
-    video_matches = video_pattern.findall(content)
-    media_urls.extend(video_matches)
+def _extract_unescaped(content: str) -> list[str]:
+    """Extract media URLs from HTML content whose entities are already unescaped."""
+    media_urls = IMG_SRC_REGEX.findall(content)
+    media_urls.extend(VIDEO_POSTER_REGEX.findall(content))
 
     # Remove duplicates while preserving order
-    seen = set()
-    unique_urls = []
-    for url in media_urls:
-        if url not in seen:
-            seen.add(url)
-            unique_urls.append(url)
-
-    return unique_urls
+    return list(dict.fromkeys(media_urls))
+
+
+@lru_cache(maxsize=1024)
+def clean_and_extract(html_content: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Clean HTML content and extract its media URLs in one call.
+
+    Equivalent to (clean_content(html), extract_media_urls(html)), but the
+    entities are unescaped once for both. Results are memoized like
+    clean_content's, so the URLs come back as a tuple.
+
+    Args:
+        html_content: Raw HTML content string
+
+    Returns:
+        Tuple of (cleaned text content, media URLs)
+    """
+    if not html_content:
+        return "", ()
+
+    content = html.unescape(html_content)
+    return _clean_unescaped(content), tuple(_extract_unescaped(content))
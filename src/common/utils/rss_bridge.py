@@ -1,13 +1,20 @@
 """RSS Bridge utilities for building Telegram channel RSS feeds."""
 
-from urllib.parse import urlencode
+from urllib.parse import quote_plus, urlencode
+
+_DEFAULT_BRIDGE = "TelegramBridge"
+_DEFAULT_FORMAT = "Mrss"
+
+# Query string for the default bridge and format, split around the username
+_DEFAULT_QUERY_HEAD = urlencode({"action": "display", "username": ""})
+_DEFAULT_QUERY_TAIL = "&" + urlencode({"bridge": _DEFAULT_BRIDGE, "format": _DEFAULT_FORMAT})
 
 
 def build_rss_bridge_url(
     channel_name: str,
     base_url: str = "https://rss-bridge.org/bridge01/",
-    bridge: str = "TelegramBridge",
-    format: str = "Mrss",
+    bridge: str = _DEFAULT_BRIDGE,
+    format: str = _DEFAULT_FORMAT,
 ) -> str:
     """
     Build an RSS bridge URL for a Telegram channel.
@@ -21,6 +28,9 @@ def build_rss_bridge_url(
     Returns:
         Complete RSS bridge URL
     """
+    if bridge == _DEFAULT_BRIDGE and format == _DEFAULT_FORMAT:
+        return f"{base_url}?{_DEFAULT_QUERY_HEAD}{quote_plus(channel_name)}{_DEFAULT_QUERY_TAIL}"
+
     params = {
         "action": "display",
         "username": channel_name,
@@ -6,7 +6,7 @@ Run with: python -m src.digest_publisher
 import asyncio
 import logging
 from typing import List, Dict
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from collections import defaultdict
 
 from telegram import Bot
@@ -40,41 +40,36 @@ def prepare_posts_for_prompt(posts: List[RSSPost], section_title: str = "Posts")
         return ""
 
     # Group posts by date
-    posts_by_date: Dict[str, List[RSSPost]] = defaultdict(list)
+    posts_by_date: Dict[date, List[RSSPost]] = defaultdict(list)
+    undated_posts: List[RSSPost] = []
     for post in posts:
         if post.pub_date:
-            date_key = post.pub_date.strftime("%Y-%m-%d")
-            posts_by_date[date_key].append(post)
+            posts_by_date[post.pub_date.date()].append(post)
         else:
             # Posts without date go to "Unknown Date"
-            posts_by_date["Unknown Date"].append(post)
+            undated_posts.append(post)
 
-    # Sort dates in descending order (newest first)
-    sorted_dates = sorted([d for d in posts_by_date.keys() if d != "Unknown Date"], reverse=True)
-    if "Unknown Date" in posts_by_date:
-        sorted_dates.append("Unknown Date")
+    # Days in descending order (newest first), with a readable header each
+    days = [
+        (day.strftime("%A, %B %d, %Y"), posts_by_date[day])
+        for day in sorted(posts_by_date, reverse=True)
+    ]
+    if undated_posts:
+        days.append(("Unknown Date", undated_posts))
 
     formatted_posts = [f"\n=== {section_title} ==="]
 
     post_counter = 1
-    for date_key in sorted_dates:
-        day_posts = posts_by_date[date_key]
-
+    for day_name, day_posts in days:
         # Add day header
-        if date_key == "Unknown Date":
-            formatted_posts.append(f"\n## {date_key} ({len(day_posts)} posts)")
-        else:
-            # Convert to more readable format
-            date_obj = datetime.strptime(date_key, "%Y-%m-%d")
-            day_name = date_obj.strftime("%A, %B %d, %Y")
-            formatted_posts.append(f"\n## {day_name} ({len(day_posts)} posts)")
+        formatted_posts.append(f"\n## {day_name} ({len(day_posts)} posts)")
 
         # Add posts for this day
         for post in day_posts:
             post_info = [f"\n--- Post {post_counter} ---"]
 
             if post.pub_date:
-                post_info.append(f"Time: {post.pub_date.strftime('%H:%M')}")
+                post_info.append(f"Time: {post.pub_date.time().isoformat('minutes')}")
 
             if post.content:
                 # Truncate very long content
@@ -182,6 +177,10 @@ async def generate_ai_digest(posts: List[RSSPost], client: AsyncOpenAI) -> str:
         return f"❌ Failed to generate digest: {str(e)}\n\nFound {len(posts)} posts from the last {digest_publisher_settings.days_back} days."
 
 
+# Characters that need to be escaped in MarkdownV2, mapped to their escapes
+_MARKDOWN_V2_ESCAPES = str.maketrans({char: f"\\{char}" for char in "_*[]()~`>#+-=|{}.!"})
+
+
 def escape_markdown_v2(text: str) -> str:
     """
     Escape special characters for Telegram MarkdownV2.
@@ -192,30 +191,7 @@ def escape_markdown_v2(text: str) -> str:
     Returns:
         Escaped text
     """
-    # Characters that need to be escaped in MarkdownV2
-    special_chars = [
-        "_",
-        "*",
-        "[",
-        "]",
-        "(",
-        ")",
-        "~",
-        "`",
-        ">",
-        "#",
-        "+",
-        "-",
-        "=",
-        "|",
-        "{",
-        "}",
-        ".",
-        "!",
-    ]
-    for char in special_chars:
-        text = text.replace(char, f"\\{char}")
-    return text
+    return text.translate(_MARKDOWN_V2_ESCAPES)
 
 
 def format_post_for_telegram(post: RSSPost) -> str:
@@ -272,10 +248,11 @@ def create_digest(posts: List[RSSPost]) -> str:
     lines.append(escape_markdown_v2("=" * 40))
     lines.append("")
 
+    separator = "\n" + escape_markdown_v2("-" * 40) + "\n"
     for i, post in enumerate(posts, 1):
         lines.append(format_post_for_telegram(post))
         if i < len(posts):
-            lines.append("\n" + escape_markdown_v2("-" * 40) + "\n")
+            lines.append(separator)
 
     return "\n".join(lines)
 
@@ -315,7 +315,9 @@ Is this an event?"""
                             )
                         continue
 
-                    # Update the database
+                    # Update the database. These single-post writes commit one
+                    # by one; bulk operations should open a transaction
+                    # explicitly (see db.transaction()) so they share one commit.
                     is_event = classification.get("is_event", False)
                     classification_data = {
                         "confidence": classification.get("confidence", 0.0),
@@ -3,11 +3,18 @@
 import sys
 import asyncio
 import logging
-import json
-from typing import Tuple
+import os
+import orjson
+from typing import List, Tuple
 from feed.core.parser import RSSParser
+from feed.models.feed import RSSItem
 from feed.db.session import db
-from feed.db.repository import RSSPostRepository, TelegramChannelRepository
+from feed.db.repository import (
+    EventRepository,
+    OpenAIRequestLogRepository,
+    RSSPostRepository,
+    TelegramChannelRepository,
+)
 from feed.db.models import RSSPost, TelegramChannel
 from feed.utils.rss_bridge import build_rss_bridge_url
 from feed.openai_worker import OpenAIWorker
@@ -18,6 +25,77 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Channels processed at once; keep within the DB pool (20) and the feed
+# fetcher's connection pool (32)
+CHANNEL_CONCURRENCY = int(os.getenv("RSS_CONCURRENCY", "16"))
+
+
+async def save_feed_items(
+    items: List[RSSItem],
+) -> Tuple[List[Tuple[int, RSSPost]], int, int, int]:
+    """
+    Save the new items of a parsed feed in one batch.
+
+    Items with empty content, already stored links and links repeated within
+    the feed are skipped.
+
+    Args:
+        items: Parsed feed items
+
+    Returns:
+        Tuple of (saved, skipped_count, empty_count, error_count), where saved
+        holds (position in the feed, RSSPost) for every stored item
+    """
+    skipped_count = 0
+    error_count = 0
+    empty_count = 0
+
+    # Look up which items are already stored in one query
+    existing = await RSSPostRepository.filter_existing([item.link for item in items])
+
+    # Collect new items with their feed position, then save them in one batch
+    new_posts = {}
+    for i, item in enumerate(items, 1):
+        try:
+            # Skip if content is empty
+            if not item.description or not item.description.strip():
+                logger.debug(f"Skipping item with empty content: {item.link}")
+                empty_count += 1
+                continue
+
+            # Check if item already exists (in the database or earlier in this feed)
+            if item.link in new_posts or item.link in existing:
+                logger.debug(f"Skipping existing item: {item.link}")
+                skipped_count += 1
+                continue
+
+            # Convert RSSItem to RSSPost
+            media_json = orjson.dumps(item.media_urls).decode() if item.media_urls else None
+            new_posts[item.link] = (
+                i,
+                RSSPost(
+                    link=item.link,
+                    content=item.description,
+                    pub_date=item.pub_date,
+                    media=media_json,
+                ),
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to prepare item {item.link}: {e}")
+            error_count += 1
+
+    # Save to database
+    saved = list(new_posts.values())
+    try:
+        await RSSPostRepository.create_many([post for _, post in saved])
+    except Exception as e:
+        logger.error(f"Failed to save items: {e}")
+        error_count += len(saved)
+        saved = []
+
+    return saved, skipped_count, empty_count, error_count
+
 
 async def process_channel(
     channel: TelegramChannel, parser: RSSParser
@@ -42,45 +120,15 @@ async def process_channel(
         rss_url = build_rss_bridge_url(channel.channel_name)
         logger.info(f"Processing channel: {channel.channel_name} ({rss_url})")
 
-        # Parse the RSS feed
-        feed = parser.parse_url(rss_url)
+        # Parse the RSS feed in a thread so other channels can proceed meanwhile
+        feed = await asyncio.to_thread(parser.parse_url, rss_url)
         logger.info(
             f"✓ Channel: {channel.channel_name} - Feed: {feed.title} - Items: {len(feed.items)}"
         )
 
-        # Save items to database
-        for item in feed.items:
-            try:
-                # Skip if content is empty
-                if not item.description or not item.description.strip():
-                    logger.debug(f"Skipping item with empty content: {item.link}")
-                    empty_count += 1
-                    continue
-
-                # Check if item already exists
-                existing = await RSSPostRepository.get_by_link(item.link)
-                if existing:
-                    logger.debug(f"Skipping existing item: {item.link}")
-                    skipped_count += 1
-                    continue
-
-                # Convert RSSItem to RSSPost
-                media_json = json.dumps(item.media_urls) if item.media_urls else None
-                post = RSSPost(
-                    link=item.link,
-                    content=item.description,
-                    pub_date=item.pub_date,
-                    media=media_json,
-                )
-
-                # Save to database
-                await RSSPostRepository.create(post)
-                saved_count += 1
-                logger.debug(f"Saved: {item.link}")
-
-            except Exception as e:
-                logger.error(f"Failed to save item {item.link}: {e}")
-                error_count += 1
+        saved, skipped_count, empty_count, error_count = await save_feed_items(feed.items)
+        saved_count = len(saved)
+        logger.debug(f"Saved {saved_count} items for {channel.channel_name}")
 
     except Exception as e:
         logger.error(f"Failed to process channel {channel.channel_name}: {e}", exc_info=True)
@@ -110,8 +158,14 @@ async def process_all_channels():
         # Create parser instance
         parser = RSSParser()
 
-        # Process all channels in parallel
-        tasks = [process_channel(channel, parser) for channel in channels]
+        # Process channels in parallel, at most CHANNEL_CONCURRENCY at a time
+        semaphore = asyncio.Semaphore(CHANNEL_CONCURRENCY)
+
+        async def process_bounded(channel: TelegramChannel):
+            async with semaphore:
+                return await process_channel(channel, parser)
+
+        tasks = [process_bounded(channel) for channel in channels]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Calculate totals and display summary
@@ -120,9 +174,8 @@ async def process_all_channels():
         total_empty = 0
         total_errors = 0
 
-        print("\n" + "=" * 80)
-        print("SUMMARY BY CHANNEL")
-        print("=" * 80)
+        # Build the summary and write it in one go
+        lines = ["\n" + "=" * 80, "SUMMARY BY CHANNEL", "=" * 80]
 
         for result in results:
             if isinstance(result, Exception):
@@ -136,25 +189,26 @@ async def process_all_channels():
             total_empty += empty
             total_errors += errors
 
-            print(f"\n{channel_name}:")
-            print(f"  ✓ Saved: {saved}")
-            print(f"  ⊘ Skipped (already exists): {skipped}")
+            lines.append(f"\n{channel_name}:")
+            lines.append(f"  ✓ Saved: {saved}")
+            lines.append(f"  ⊘ Skipped (already exists): {skipped}")
             if empty > 0:
-                print(f"  ⊘ Skipped (empty content): {empty}")
+                lines.append(f"  ⊘ Skipped (empty content): {empty}")
             if errors > 0:
-                print(f"  ✗ Errors: {errors}")
+                lines.append(f"  ✗ Errors: {errors}")
 
-        print("\n" + "=" * 80)
-        print("OVERALL TOTALS")
-        print("=" * 80)
-        print(f"✓ Total Saved: {total_saved}")
-        print(f"⊘ Total Skipped (already exists): {total_skipped}")
+        lines.append("\n" + "=" * 80)
+        lines.append("OVERALL TOTALS")
+        lines.append("=" * 80)
+        lines.append(f"✓ Total Saved: {total_saved}")
+        lines.append(f"⊘ Total Skipped (already exists): {total_skipped}")
         if total_empty > 0:
-            print(f"⊘ Total Skipped (empty content): {total_empty}")
+            lines.append(f"⊘ Total Skipped (empty content): {total_empty}")
         if total_errors > 0:
-            print(f"✗ Total Errors: {total_errors}")
-        print(f"📡 Channels Processed: {len(channels)}")
-        print("=" * 80)
+            lines.append(f"✗ Total Errors: {total_errors}")
+        lines.append(f"📡 Channels Processed: {len(channels)}")
+        lines.append("=" * 80)
+        print("\n".join(lines))
 
     except Exception as e:
         logger.error(f"Error: {e}", exc_info=True)
@@ -170,54 +224,17 @@ async def process_single_url(url: str):
     parser = RSSParser()
 
     try:
-        # Parse the RSS feed
-        feed = parser.parse_url(url)
+        # Fetch and parse the feed in a thread while the database pool connects
+        feed, _ = await asyncio.gather(asyncio.to_thread(parser.parse_url, url), db.connect())
+        logger.info("Connected to database")
         print(f"✓ Feed: {feed.title}")
         print(f"✓ Items: {len(feed.items)}")
         print(f"✓ Link: {feed.link}\n")
 
-        # Connect to database
-        await db.connect()
-        logger.info("Connected to database")
-
-        saved_count = 0
-        skipped_count = 0
-        error_count = 0
-        empty_count = 0
-
-        # Save items to database
-        for i, item in enumerate(feed.items, 1):
-            try:
-                # Skip if content is empty
-                if not item.description or not item.description.strip():
-                    logger.debug(f"Skipping item with empty content: {item.link}")
-                    empty_count += 1
-                    continue
-
-                # Check if item already exists
-                existing = await RSSPostRepository.get_by_link(item.link)
-                if existing:
-                    logger.debug(f"Skipping existing item: {item.link}")
-                    skipped_count += 1
-                    continue
-
-                # Convert RSSItem to RSSPost
-                media_json = json.dumps(item.media_urls) if item.media_urls else None
-                post = RSSPost(
-                    link=item.link,
-                    content=item.description,
-                    pub_date=item.pub_date,
-                    media=media_json,
-                )
-
-                # Save to database
-                await RSSPostRepository.create(post)
-                saved_count += 1
-                print(f"  {i}. Saved: {item.link}")
-
-            except Exception as e:
-                logger.error(f"Failed to save item {item.link}: {e}")
-                error_count += 1
+        saved, skipped_count, empty_count, error_count = await save_feed_items(feed.items)
+        saved_count = len(saved)
+        for i, post in saved:
+            print(f"  {i}. Saved: {post.link}")
 
         # Summary
         print(f"\n✓ Saved: {saved_count}")
@@ -236,6 +253,33 @@ async def process_single_url(url: str):
         logger.info("Disconnected from database")
 
 
+async def show_stats():
+    """Print post, OpenAI request and event statistics."""
+    # Independent aggregates; run them concurrently on separate pool connections
+    post_stats, request_stats, event_count = await asyncio.gather(
+        RSSPostRepository.get_stats(),
+        OpenAIRequestLogRepository.get_stats(),
+        EventRepository.count(),
+    )
+
+    print("=" * 80)
+    print("POSTS")
+    print(f"  Total: {post_stats['total']}")
+    print(f"  Processed: {post_stats['processed']}")
+    print(f"  Unprocessed: {post_stats['unprocessed']}")
+    print(f"  Events: {post_stats['events']}")
+    print("OPENAI REQUESTS")
+    print(f"  Total: {request_stats['total']}")
+    print(f"  Completed: {request_stats['completed']}")
+    print(f"  Failed: {request_stats['failed']}")
+    print(f"  Pending: {request_stats['pending']}")
+    print(f"  Total tokens: {request_stats['total_tokens']}")
+    print(f"  Total cost: ${request_stats['total_cost']:.6f}")
+    print("EVENTS")
+    print(f"  Total: {event_count}")
+    print("=" * 80)
+
+
 async def async_main():
     """Async main CLI entrypoint."""
     if len(sys.argv) < 2:
@@ -245,6 +289,8 @@ async def async_main():
         print("  python -m feed <rss_url>          # Process single RSS URL")
         print("  python -m feed openai-classify    # Run OpenAI event classification")
         print("  python -m feed openai-check <batch_id>  # Check batch status")
+        print("  python -m feed stats              # Show post, request and event stats")
+        print("  python -m feed stats-reconcile    # Recompute post stats counters")
         sys.exit(1)
 
     command = sys.argv[1]
@@ -275,6 +321,20 @@ async def async_main():
             print("=" * 80)
         finally:
             await db.disconnect()
+    elif command == "stats":
+        await db.connect()
+        try:
+            await show_stats()
+        finally:
+            await db.disconnect()
+    elif command == "stats-reconcile":
+        await db.connect()
+        try:
+            await RSSPostRepository.reconcile_stats()
+            stats = await RSSPostRepository.get_stats()
+            print(f"Reconciled post stats: {stats}")
+        finally:
+            await db.disconnect()
     elif command.startswith("http"):
         # URL provided - process single RSS feed
         await process_single_url(command)
@@ -1,14 +1,48 @@
 """Data models for RSS posts (dataclass representations)."""
 
-from dataclasses import dataclass, asdict
+import re
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Sequence
 from email.utils import parsedate_to_datetime
 from decimal import Decimal
-import json
 
 
-@dataclass
+def _parse_iso_datetime(date_str: str) -> datetime:
+    """Parse an ISO 8601 datetime, accepting a trailing "Z"."""
+    return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+
+
+# The RFC 2822 shape RSS feeds emit, e.g. 'Fri, 09 Jan 2026 10:15:06 +0000'
+_RFC2822_REGEX = re.compile(
+    r"(?:[A-Za-z]{3}, )?(\d{1,2}) ([A-Za-z]{3}) (\d{4}) (\d{2}):(\d{2})(?::(\d{2}))?"
+    r"(?: (?:[+-]\d{4}|[A-Za-z]{1,5}))?"
+)
+_MONTHS = {
+    month: number
+    for number, month in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), 1
+    )
+}
+
+
+def _parse_rfc2822_datetime(date_str: str) -> datetime:
+    """Parse the common RFC 2822 form into a naive datetime in its own local time.
+
+    Equivalent to parsedate_to_datetime() with the offset dropped, without its
+    general-purpose tokenizer. Other shapes raise ValueError.
+    """
+    match = _RFC2822_REGEX.fullmatch(date_str)
+    if match is None:
+        raise ValueError(f"Not an RFC 2822 date: {date_str}")
+    day, month, year, hour, minute, second = match.groups()
+    month_number = _MONTHS.get(month.lower())
+    if month_number is None:
+        raise ValueError(f"Unknown month in date: {date_str}")
+    return datetime(int(year), month_number, int(day), int(hour), int(minute), int(second or 0))
+
+
+@dataclass(slots=True)
 class TelegramChannel:
     """Dataclass representation of a Telegram channel."""
 
@@ -20,8 +54,8 @@ class TelegramChannel:
     updated_at: Optional[datetime] = None
 
     def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary (a shallow copy of the fields)."""
+        return {name: getattr(self, name) for name in _TELEGRAM_CHANNEL_FIELDS}
 
     @staticmethod
     def from_row(row: dict) -> "TelegramChannel":
@@ -35,8 +69,17 @@ class TelegramChannel:
             updated_at=row.get("updated_at"),
         )
 
+    @classmethod
+    def from_rows(cls, rows: Sequence) -> List["TelegramChannel"]:
+        """Create TelegramChannels from rows selected in field order.
 
-@dataclass
+        Rows are unpacked positionally, skipping per-column key lookups;
+        the query must list the columns in dataclass field order.
+        """
+        return [cls(*row) for row in rows]
+
+
+@dataclass(slots=True)
 class RSSPost:
     """Dataclass representation of an RSS post."""
 
@@ -68,16 +111,19 @@ class RSSPost:
         """
         dt = None
 
-        # Try RFC 2822 format first (common in RSS feeds)
-        try:
-            dt = parsedate_to_datetime(date_str)
-        except (ValueError, TypeError):
-            pass
+        # ISO 8601 starts with the year, RFC 2822 (common in RSS feeds) usually
+        # with the weekday; try the likely format first to skip a failed parse.
+        # parsedate_to_datetime() stays as the fallback for RFC 2822 variants
+        # the fast regex does not cover (two-digit years, odd spacing, ...)
+        if date_str[:1].isdigit():
+            parsers = (_parse_iso_datetime, _parse_rfc2822_datetime, parsedate_to_datetime)
+        else:
+            parsers = (_parse_rfc2822_datetime, parsedate_to_datetime, _parse_iso_datetime)
 
-        # Try ISO 8601 format
-        if dt is None:
+        for parse in parsers:
             try:
-                dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+                dt = parse(date_str)
+                break
             except (ValueError, TypeError):
                 pass
 
@@ -92,25 +138,15 @@ class RSSPost:
         return dt
 
     def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary (a shallow copy of the fields)."""
+        return {name: getattr(self, name) for name in _RSS_POST_FIELDS}
 
     @staticmethod
     def from_row(row: dict) -> "RSSPost":
         """Create RSSPost from database row.
 
-        Note: asyncpg returns JSONB fields as already-parsed dictionaries/lists,
-        but if they come as strings, we parse them.
+        JSON columns arrive already parsed by the pool's orjson type codecs.
         """
-
-        # Helper to parse JSON if it's a string, otherwise return as-is
-        def parse_json(value):
-            if value is None:
-                return None
-            if isinstance(value, str):
-                return json.loads(value)
-            return value
-
         return RSSPost(
             link=row["link"],
             content=row["content"],
@@ -118,14 +154,41 @@ class RSSPost:
             media=row.get("media"),
             is_processed=row.get("is_processed", False),
             is_event=row.get("is_event"),
-            classification_data=parse_json(row.get("classification_data")),
+            classification_data=row.get("classification_data"),
             created_at=row.get("created_at"),
             updated_at=row.get("updated_at"),
             classified_at=row.get("classified_at"),
         )
 
+    @classmethod
+    def from_rows(cls, rows: Sequence) -> List["RSSPost"]:
+        """Create RSSPosts from rows selected in field order.
 
-@dataclass
+        Rows are unpacked positionally, skipping per-column key lookups;
+        the query must list the columns in dataclass field order. Database
+        rows already carry a datetime pub_date, so __init__ and its
+        __post_init__ parsing are bypassed.
+        """
+        posts = []
+        for row in rows:
+            post = object.__new__(cls)
+            (
+                post.link,
+                post.content,
+                post.pub_date,
+                post.media,
+                post.is_processed,
+                post.is_event,
+                post.classification_data,
+                post.created_at,
+                post.updated_at,
+                post.classified_at,
+            ) = row
+            posts.append(post)
+        return posts
+
+
+@dataclass(slots=True)
 class OpenAIRequestLog:
     """Dataclass representation of an OpenAI request log."""
 
@@ -148,21 +211,12 @@ class OpenAIRequestLog:
     completed_at: Optional[datetime] = None
 
     def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary (a shallow copy of the fields)."""
+        return {name: getattr(self, name) for name in _OPENAI_REQUEST_LOG_FIELDS}
 
     @staticmethod
     def from_row(row: dict) -> "OpenAIRequestLog":
         """Create OpenAIRequestLog from database row."""
-
-        # Helper to parse JSON if it's a string, otherwise return as-is
-        def parse_json(value):
-            if value is None:
-                return None
-            if isinstance(value, str):
-                return json.loads(value)
-            return value
-
         return OpenAIRequestLog(
             id=row.get("id"),
             batch_id=row.get("batch_id"),
@@ -170,8 +224,8 @@ class OpenAIRequestLog:
             request_type=row["request_type"],
             model=row["model"],
             endpoint=row["endpoint"],
-            request_data=parse_json(row.get("request_data")),
-            response_data=parse_json(row.get("response_data")),
+            request_data=row.get("request_data"),
+            response_data=row.get("response_data"),
             status=row["status"],
             status_code=row.get("status_code"),
             tokens_used=row.get("tokens_used"),
@@ -183,8 +237,17 @@ class OpenAIRequestLog:
             completed_at=row.get("completed_at"),
         )
 
+    @classmethod
+    def from_rows(cls, rows: Sequence) -> List["OpenAIRequestLog"]:
+        """Create OpenAIRequestLogs from rows selected in field order.
 
-@dataclass
+        Rows are unpacked positionally, skipping per-column key lookups;
+        the query must list the columns in dataclass field order.
+        """
+        return [cls(*row) for row in rows]
+
+
+@dataclass(slots=True)
 class Event:
     """Dataclass representation of an event."""
 
@@ -202,21 +265,12 @@ class Event:
     updated_at: Optional[datetime] = None
 
     def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary (a shallow copy of the fields)."""
+        return {name: getattr(self, name) for name in _EVENT_FIELDS}
 
     @staticmethod
     def from_row(row: dict) -> "Event":
         """Create Event from database row."""
-
-        # Helper to parse JSON if it's a string, otherwise return as-is
-        def parse_json(value):
-            if value is None:
-                return None
-            if isinstance(value, str):
-                return json.loads(value)
-            return value
-
         return Event(
             id=row.get("id"),
             post_link=row["post_link"],
@@ -227,7 +281,23 @@ class Event:
             location=row.get("location"),
             event_type=row.get("event_type"),
             confidence=row.get("confidence"),
-            additional_data=parse_json(row.get("additional_data")),
+            additional_data=row.get("additional_data"),
             created_at=row.get("created_at"),
             updated_at=row.get("updated_at"),
         )
+
+    @classmethod
+    def from_rows(cls, rows: Sequence) -> List["Event"]:
+        """Create Events from rows selected in field order.
+
+        Rows are unpacked positionally, skipping per-column key lookups;
+        the query must list the columns in dataclass field order.
+        """
+        return [cls(*row) for row in rows]
+
+
+# Field names, resolved once rather than by asdict() on every call
+_TELEGRAM_CHANNEL_FIELDS = tuple(f.name for f in fields(TelegramChannel))
+_RSS_POST_FIELDS = tuple(f.name for f in fields(RSSPost))
+_OPENAI_REQUEST_LOG_FIELDS = tuple(f.name for f in fields(OpenAIRequestLog))
+_EVENT_FIELDS = tuple(f.name for f in fields(Event))
@@ -1,37 +1,293 @@
 """Repository layer for RSS posts database operations."""
 
-from typing import List, Optional
+from dataclasses import fields
+from functools import lru_cache
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
 from datetime import datetime
 from decimal import Decimal
-import json
+import asyncio
+import asyncpg
+from common.utils.channel_cache import CHANNELS_INVALIDATE, ChannelCache
 from .session import db
 from .models import RSSPost, TelegramChannel, OpenAIRequestLog, Event
 
+# Explicit column lists in dataclass field order, so list queries can build
+# models positionally via from_rows()
+_CHANNEL_COLUMNS = ", ".join(f.name for f in fields(TelegramChannel))
+_POST_COLUMNS = ", ".join(f.name for f in fields(RSSPost))
+_LOG_COLUMNS = ", ".join(f.name for f in fields(OpenAIRequestLog))
+_EVENT_COLUMNS = ", ".join(f.name for f in fields(Event))
+
+# Batches larger than this are written with COPY instead of executemany
+_COPY_THRESHOLD = 50
+_CREATE_MANY_COLUMNS = [
+    "link",
+    "content",
+    "pub_date",
+    "media",
+    "is_processed",
+    "is_event",
+    "classification_data",
+]
+_CREATE_MANY_COLUMN_LIST = ", ".join(_CREATE_MANY_COLUMNS)
+
+_LOG_COPY_COLUMNS = [
+    "batch_id",
+    "custom_id",
+    "request_type",
+    "model",
+    "endpoint",
+    "request_data",
+    "response_data",
+    "status",
+    "status_code",
+    "tokens_used",
+    "cost_estimate",
+    "error_message",
+    "post_link",
+]
+
+_UPDATE_LOG_STATUS_QUERY = """
+    UPDATE openai_request_logs 
+    SET status = $2,
+        response_data = $3,
+        status_code = $4,
+        tokens_used = $5,
+        cost_estimate = $6::float8,
+        error_message = $7,
+        completed_at = CASE
+            WHEN $2 IN ('completed', 'failed') THEN CURRENT_TIMESTAMP
+            ELSE NULL
+        END,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = $1
+"""
+
+
+def _build_posts_query(is_processed: Optional[bool], is_event: Optional[bool], keyset: bool) -> str:
+    """Build the RSSPostRepository.get_all statement for one filter combination."""
+    query = f"SELECT {_POST_COLUMNS} FROM rss_posts WHERE 1=1"
+    param_count = 1
+
+    if is_processed is not None:
+        query += " AND is_processed" if is_processed else " AND NOT is_processed"
+
+    if is_event is not None:
+        query += " AND is_event" if is_event else " AND NOT is_event"
+
+    if keyset:
+        query += f" AND (created_at, link) < (${param_count}, ${param_count + 1})"
+        param_count += 2
+
+    return query + (
+        f" ORDER BY created_at DESC, link DESC LIMIT ${param_count} OFFSET ${param_count + 1}"
+    )
+
+
+# get_all statements keyed by (is_processed, is_event, keyset), built once
+_GET_POSTS_QUERIES = {
+    (is_processed, is_event, keyset): _build_posts_query(is_processed, is_event, keyset)
+    for is_processed in (None, True, False)
+    for is_event in (None, True, False)
+    for keyset in (False, True)
+}
+
+
+def _build_logs_query(by_status: bool, by_request_type: bool, keyset: bool) -> str:
+    """Build the OpenAIRequestLogRepository.get_all statement for one filter combination."""
+    query = f"SELECT {_LOG_COLUMNS} FROM openai_request_logs WHERE 1=1"
+    param_count = 1
+
+    if by_status:
+        query += f" AND status = ${param_count}"
+        param_count += 1
+
+    if by_request_type:
+        query += f" AND request_type = ${param_count}"
+        param_count += 1
+
+    if keyset:
+        query += f" AND (created_at, id) < (${param_count}, ${param_count + 1})"
+        param_count += 2
+
+    return query + (
+        f" ORDER BY created_at DESC, id DESC LIMIT ${param_count} OFFSET ${param_count + 1}"
+    )
+
+
+# OpenAIRequestLogRepository.get_all statements keyed by
+# (by_status, by_request_type, keyset), built once
+_GET_LOGS_QUERIES = {
+    (by_status, by_request_type, keyset): _build_logs_query(by_status, by_request_type, keyset)
+    for by_status in (False, True)
+    for by_request_type in (False, True)
+    for keyset in (False, True)
+}
+
+
+async def _load_channels() -> List[TelegramChannel]:
+    """Load all channels, ordered by name, into the channel cache."""
+    query = f"""
+        SELECT {_CHANNEL_COLUMNS} FROM telegram_channels 
+        ORDER BY channel_name ASC
+    """
+    return TelegramChannel.from_rows(await db.fetch(query))
+
+
+# In-process channel cache behind TelegramChannelRepository; writes made by
+# other processes reach it through the listener db.connect() registers
+_channel_cache = ChannelCache(_load_channels)
+db.add_listener(CHANNELS_INVALIDATE, _channel_cache.on_notify)
+
+
+class _UpdateBatcher:
+    """Coalesce concurrent single-row updates into one bulk statement.
+
+    Items submitted within ``flush_interval`` seconds of each other (up to
+    ``max_batch``) are handed to ``flush`` together; each submitter waits
+    until the batch containing its item has been written. The drain task
+    exits once the queue is empty and is restarted by the next submit.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[tuple]], Awaitable[None]],
+        flush_interval: float = 0.02,
+        max_batch: int = 256,
+    ):
+        self.flush = flush
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, *item) -> None:
+        """Queue an item and wait until it has been flushed."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._abandon()
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._drain(self._queue))
+
+        future = loop.create_future()
+        self._queue.put_nowait((item, future))
+        await future
+
+    async def drain(self) -> None:
+        """Wait until every queued item has been flushed (e.g. before shutdown)."""
+        if self._task is not None and not self._task.done():
+            await asyncio.shield(self._task)
+
+    def _abandon(self) -> None:
+        """Cancel a drain task left on another event loop.
+
+        The task cancels the futures of everything still queued on it, so
+        its submitters don't wait forever. A closed loop has no waiters left.
+        """
+        if self._task is None or self._task.done():
+            return
+        old_loop = self._task.get_loop()
+        if not old_loop.is_closed():
+            old_loop.call_soon_threadsafe(self._task.cancel)
+
+    @staticmethod
+    def _fail(pending: List[tuple], error: BaseException) -> None:
+        """Resolve the futures of unflushed items with ``error``."""
+        for _, future in pending:
+            if future.done():
+                continue
+            if isinstance(error, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(error)
+
+    async def _drain(self, queue: asyncio.Queue) -> None:
+        """Flush batches until the queue runs dry."""
+        loop = asyncio.get_running_loop()
+        batch: List[tuple] = []
+        try:
+            while not queue.empty():
+                batch = [queue.get_nowait()]
+                deadline = loop.time() + self.flush_interval
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except TimeoutError:
+                        break
+
+                try:
+                    await self.flush([item for item, _ in batch])
+                except Exception as e:
+                    self._fail(batch, e)
+                else:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_result(None)
+                batch = []
+        except BaseException as e:
+            # Cancelled (or interrupted) mid-batch: nothing left will be
+            # flushed, so release every waiter before propagating
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            self._fail(batch, e)
+            raise
+
 
 class TelegramChannelRepository:
-    """Repository for Telegram channel operations."""
+    """Repository for Telegram channel operations.
+
+    get_all() is served from an in-process cache that it loads on first use
+    and reloads after 60 seconds; lookups by ID or name use the same cache
+    once it is loaded. Writes expire the cache here and, via NOTIFY, in every
+    other connected process.
+    """
+
+    @staticmethod
+    async def warm_cache() -> None:
+        """Load all channels into the in-process cache."""
+        await _channel_cache.warm()
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached channels and stop serving lookups from the cache."""
+        _channel_cache.clear()
+
+    @staticmethod
+    async def _invalidate(channel_id: int) -> None:
+        """Expire a channel in this and every listening process's cache."""
+        _channel_cache.expire(channel_id)
+        await db.execute("SELECT pg_notify($1, $2)", CHANNELS_INVALIDATE, str(channel_id))
 
     @staticmethod
     async def get_all() -> List[TelegramChannel]:
-        """Get all Telegram channels."""
-        query = """
-            SELECT * FROM telegram_channels 
-            ORDER BY channel_name ASC
+        """Get all Telegram channels, ordered by name.
+
+        Returns a new list on every call, so callers may modify it.
         """
-        rows = await db.fetch(query)
-        return [TelegramChannel.from_row(row) for row in rows]
+        return await _channel_cache.all()
 
     @staticmethod
     async def get_by_id(channel_id: int) -> Optional[TelegramChannel]:
         """Get channel by ID."""
-        query = "SELECT * FROM telegram_channels WHERE channel_id = $1"
+        cached = await _channel_cache.get(channel_id)
+        if cached is not None:
+            return cached
+
+        query = f"SELECT {_CHANNEL_COLUMNS} FROM telegram_channels WHERE channel_id = $1"
         row = await db.fetchrow(query, channel_id)
         return TelegramChannel.from_row(row) if row else None
 
     @staticmethod
     async def get_by_name(channel_name: str) -> Optional[TelegramChannel]:
         """Get channel by name."""
-        query = "SELECT * FROM telegram_channels WHERE channel_name = $1"
+        cached = await _channel_cache.find_by_name(channel_name)
+        if cached is not None:
+            return cached
+
+        query = f"SELECT {_CHANNEL_COLUMNS} FROM telegram_channels WHERE channel_name = $1"
         row = await db.fetchrow(query, channel_name)
         return TelegramChannel.from_row(row) if row else None
 
@@ -49,16 +305,16 @@ class TelegramChannelRepository:
             INSERT INTO telegram_channels (
                 channel_id, channel_name, description, url
             ) VALUES ($1, $2, $3, $4)
-            RETURNING channel_id
         """
-        channel_id = await db.fetchval(
+        await db.execute(
             query,
             channel.channel_id,
             channel.channel_name,
             channel.description,
             channel.url,
         )
-        return channel_id
+        await TelegramChannelRepository._invalidate(channel.channel_id)
+        return channel.channel_id
 
     @staticmethod
     async def update(channel: TelegramChannel) -> None:
@@ -78,35 +334,38 @@ class TelegramChannelRepository:
             channel.description,
             channel.url,
         )
+        await TelegramChannelRepository._invalidate(channel.channel_id)
 
     @staticmethod
     async def delete(channel_id: int) -> None:
         """Delete a Telegram channel."""
         query = "DELETE FROM telegram_channels WHERE channel_id = $1"
         await db.execute(query, channel_id)
+        await TelegramChannelRepository._invalidate(channel_id)
 
 
 class RSSPostRepository:
     """Repository for RSS post operations."""
 
     @staticmethod
-    async def create(post: RSSPost) -> str:
-        """Create a new RSS post.
+    async def create(post: RSSPost) -> Optional[str]:
+        """Create a new RSS post, skipping it if the link is already stored.
 
         Args:
             post: RSSPost dataclass instance
 
         Returns:
-            Link of created post
+            Link of created post, or None if it already existed
         """
         query = """
             INSERT INTO rss_posts (
                 link, content, pub_date, media,
                 is_processed, is_event, classification_data
             ) VALUES ($1, $2, $3, $4, $5, $6, $7)
+            ON CONFLICT (link) DO NOTHING
             RETURNING link
         """
-        link = await db.fetchval(
+        return await db.fetchval(
             query,
             post.link,
             post.content,
@@ -114,72 +373,189 @@ class RSSPostRepository:
             post.media,
             post.is_processed,
             post.is_event,
-            json.dumps(post.classification_data) if post.classification_data else None,
+            post.classification_data or None,
         )
-        return link
+
+    @staticmethod
+    async def create_many(posts: List[RSSPost]) -> int:
+        """Create many RSS posts in one round trip.
+
+        Small batches are sent as arrays and unnested in one INSERT; larger
+        ones are streamed with COPY into a staging table and moved over in
+        one INSERT. Links that are already stored (e.g. written by a
+        concurrent run after filter_existing()) are skipped instead of
+        failing the batch.
+
+        Args:
+            posts: RSSPost dataclass instances
+
+        Returns:
+            Number of posts actually inserted (skipped links are not counted)
+        """
+        if not posts:
+            return 0
+
+        records = [
+            (
+                post.link,
+                post.content,
+                post.pub_date,
+                post.media,
+                post.is_processed,
+                post.is_event,
+                post.classification_data or None,
+            )
+            for post in posts
+        ]
+        async with db.transaction() as conn:
+            if len(records) <= _COPY_THRESHOLD:
+                query = f"""
+                    INSERT INTO rss_posts ({_CREATE_MANY_COLUMN_LIST})
+                    SELECT * FROM unnest(
+                        $1::text[], $2::text[], $3::timestamptz[], $4::text[],
+                        $5::boolean[], $6::boolean[], $7::jsonb[]
+                    )
+                    ON CONFLICT (link) DO NOTHING
+                """
+                result = await conn.execute(query, *zip(*records))
+            else:
+                # COPY has no ON CONFLICT, so stage the rows and let the
+                # INSERT skip existing links
+                await conn.execute(f"""
+                    CREATE TEMP TABLE rss_posts_staging ON COMMIT DROP AS
+                    SELECT {_CREATE_MANY_COLUMN_LIST} FROM rss_posts WITH NO DATA
+                """)
+                await conn.copy_records_to_table(
+                    "rss_posts_staging", records=records, columns=_CREATE_MANY_COLUMNS
+                )
+                result = await conn.execute(f"""
+                    INSERT INTO rss_posts ({_CREATE_MANY_COLUMN_LIST})
+                    SELECT {_CREATE_MANY_COLUMN_LIST} FROM rss_posts_staging
+                    ON CONFLICT (link) DO NOTHING
+                """)
+                # ON COMMIT DROP only fires at the outermost commit, so drop it
+                # now in case the caller is already inside a transaction
+                await conn.execute("DROP TABLE rss_posts_staging")
+        # Status tag is "INSERT 0 <rows>"
+        return int(result.split()[-1])
 
     @staticmethod
     async def get_by_link(link: str) -> Optional[RSSPost]:
         """Get post by link (URL)."""
-        query = "SELECT * FROM rss_posts WHERE link = $1"
+        query = f"SELECT {_POST_COLUMNS} FROM rss_posts WHERE link = $1"
         row = await db.fetchrow(query, link)
         return RSSPost.from_row(row) if row else None
 
+    @staticmethod
+    async def get_by_link_many(links: List[str]) -> Dict[str, RSSPost]:
+        """Get posts for many links in one query.
+
+        Args:
+            links: Post links to look up
+
+        Returns:
+            Mapping of link to RSSPost for links that exist
+        """
+        query = f"SELECT {_POST_COLUMNS} FROM rss_posts WHERE link = ANY($1::text[])"
+        rows = await db.fetch(query, links)
+        return {post.link: post for post in RSSPost.from_rows(rows)}
+
     @staticmethod
     async def get_all(
         limit: int = 100,
         offset: int = 0,
         is_processed: Optional[bool] = None,
         is_event: Optional[bool] = None,
+        after: Optional[Tuple[datetime, str]] = None,
     ) -> List[RSSPost]:
         """Get posts with optional filters.
 
+        The boolean filters are inlined as literals rather than bound
+        parameters so the planner can match the partial indexes on
+        (is_processed, is_event) in every cached plan.
+
         Args:
             limit: Maximum number of posts to return
             offset: Number of posts to skip
             is_processed: Filter by processed status (None = no filter)
             is_event: Filter by event status (None = no filter)
+            after: Keyset cursor (created_at, link) of the last post on the
+                previous page; use instead of offset for deep pages
 
         Returns:
             List of RSSPost instances
         """
-        query = "SELECT * FROM rss_posts WHERE 1=1"
-        params = []
-        param_count = 1
-
-        if is_processed is not None:
-            query += f" AND is_processed = ${param_count}"
-            params.append(is_processed)
-            param_count += 1
-
-        if is_event is not None:
-            query += f" AND is_event = ${param_count}"
-            params.append(is_event)
-            param_count += 1
-
-        query += f" ORDER BY created_at DESC LIMIT ${param_count} OFFSET ${param_count + 1}"
-        params.extend([limit, offset])
+        query = _GET_POSTS_QUERIES[(is_processed, is_event, after is not None)]
+        params = [*after, limit, offset] if after is not None else [limit, offset]
 
         rows = await db.fetch(query, *params)
-        return [RSSPost.from_row(row) for row in rows]
+        return RSSPost.from_rows(rows)
 
     @staticmethod
     async def get_unprocessed(limit: int = 100) -> List[RSSPost]:
         """Get unprocessed posts."""
+        query = f"""
+            SELECT {_POST_COLUMNS} FROM rss_posts 
+            WHERE is_processed = FALSE 
+            ORDER BY created_at ASC 
+            LIMIT $1
+        """
+        rows = await db.fetch(query, limit)
+        return RSSPost.from_rows(rows)
+
+    @staticmethod
+    async def get_unprocessed_links(limit: int = 100) -> List[str]:
+        """Get links of unprocessed posts, oldest first.
+
+        Served by an index-only scan on idx_rss_posts_unprocessed_by_date.
+
+        Args:
+            limit: Maximum number of links to return
+
+        Returns:
+            List of post links
+        """
         query = """
-            SELECT * FROM rss_posts 
+            SELECT link FROM rss_posts 
             WHERE is_processed = FALSE 
             ORDER BY created_at ASC 
             LIMIT $1
         """
         rows = await db.fetch(query, limit)
-        return [RSSPost.from_row(row) for row in rows]
+        return [row["link"] for row in rows]
+
+    @staticmethod
+    async def iter_unprocessed(
+        limit: Optional[int] = None, prefetch: int = 1000
+    ) -> AsyncIterator[RSSPost]:
+        """Stream unprocessed posts through a server-side cursor.
+
+        Rows are fetched in chunks of ``prefetch``, so memory stays bounded
+        regardless of how many posts are pending.
+
+        Args:
+            limit: Maximum number of posts to yield (None for all)
+            prefetch: Number of rows fetched per round trip
+
+        Yields:
+            RSSPost instances in creation order
+        """
+        query = f"""
+            SELECT {_POST_COLUMNS} FROM rss_posts 
+            WHERE is_processed = FALSE 
+            ORDER BY created_at ASC 
+            LIMIT $1
+        """
+        async with db.transaction() as conn:
+            async for row in conn.cursor(query, limit, prefetch=prefetch):
+                yield RSSPost.from_row(row)
 
     @staticmethod
     async def mark_as_processed(
         link: str,
         is_event: bool,
         classification_data: Optional[dict] = None,
+        conn: Optional[asyncpg.Connection] = None,
     ) -> None:
         """Mark a post as processed and set classification.
 
@@ -187,7 +563,16 @@ class RSSPostRepository:
             link: Link of the post
             is_event: Whether the post is an event
             classification_data: Optional classification metadata
+            conn: Optional connection to run on (e.g. one from db.transaction())
+
+        Without ``conn`` the update is coalesced with concurrent calls into a
+        single bulk UPDATE; the call returns once that batch is written.
         """
+        data = classification_data or None
+        if conn is None:
+            await _processed_batcher.submit(link, is_event, data)
+            return
+
         query = """
             UPDATE rss_posts 
             SET is_processed = TRUE, 
@@ -197,12 +582,45 @@ class RSSPostRepository:
                 updated_at = CURRENT_TIMESTAMP
             WHERE link = $1
         """
-        await db.execute(
-            query,
-            link,
-            is_event,
-            json.dumps(classification_data) if classification_data else None,
-        )
+        await conn.execute(query, link, is_event, data)
+
+    @staticmethod
+    async def flush_pending() -> None:
+        """Wait for batched mark_as_processed writes to reach the database.
+
+        Call before closing the pool so writes from cancelled callers are
+        not lost.
+        """
+        await _processed_batcher.drain()
+
+    @staticmethod
+    async def mark_many_processed(
+        updates: List[tuple], conn: Optional[asyncpg.Connection] = None
+    ) -> None:
+        """Mark many posts as processed with a single UPDATE.
+
+        Args:
+            updates: (link, is_event, classification_data) tuples
+            conn: Optional connection to run on (e.g. one from db.transaction())
+        """
+        if not updates:
+            return
+
+        # Last write wins for links given more than once
+        latest = {link: (link, is_event, data or None) for link, is_event, data in updates}
+        links, events, data = zip(*latest.values())
+        query = """
+            UPDATE rss_posts AS p
+            SET is_processed = TRUE, 
+                is_event = v.is_event, 
+                classification_data = v.classification_data,
+                classified_at = CURRENT_TIMESTAMP,
+                updated_at = CURRENT_TIMESTAMP
+            FROM unnest($1::text[], $2::boolean[], $3::jsonb[])
+                AS v(link, is_event, classification_data)
+            WHERE p.link = v.link
+        """
+        await (conn or db).execute(query, list(links), list(events), list(data))
 
     @staticmethod
     async def mark_as_unprocessed(link: str) -> None:
@@ -233,7 +651,7 @@ class RSSPostRepository:
             query,
             link,
             is_event,
-            json.dumps(classification_data) if classification_data else None,
+            classification_data or None,
         )
 
     @staticmethod
@@ -244,23 +662,86 @@ class RSSPostRepository:
 
     @staticmethod
     async def get_stats() -> dict:
-        """Get database statistics."""
-        query = """
-            SELECT 
-                COUNT(*) as total,
-                SUM(CASE WHEN is_processed = TRUE THEN 1 ELSE 0 END) as processed,
-                SUM(CASE WHEN is_event = TRUE THEN 1 ELSE 0 END) as events,
-                SUM(CASE WHEN is_processed = FALSE THEN 1 ELSE 0 END) as unprocessed
-            FROM rss_posts
+        """Get database statistics.
+
+        Reads the trigger-maintained counters in rss_post_stats instead of
+        scanning rss_posts; see reconcile_stats() for healing drift. Databases
+        without the counters (e.g. not set up via init_schema) are counted
+        directly.
         """
-        row = await db.fetchrow(query)
+        if await db.fetchval("SELECT to_regclass('rss_post_stats')") is None:
+            query = """
+                SELECT 
+                    COUNT(*) as total,
+                    COUNT(*) FILTER (WHERE is_processed) as processed,
+                    COUNT(*) FILTER (WHERE is_event) as events,
+                    COUNT(*) FILTER (WHERE NOT is_processed) as unprocessed
+                FROM rss_posts
+            """
+            row = await db.fetchrow(query)
+            return {
+                "total": row["total"] or 0,
+                "processed": row["processed"] or 0,
+                "events": row["events"] or 0,
+                "unprocessed": row["unprocessed"] or 0,
+            }
+
+        rows = await db.fetch("SELECT key, value FROM rss_post_stats")
+        counters = {row["key"]: row["value"] for row in rows}
+        total = counters.get("total", 0)
+        processed = counters.get("processed", 0)
         return {
-            "total": row["total"] or 0,
-            "processed": row["processed"] or 0,
-            "events": row["events"] or 0,
-            "unprocessed": row["unprocessed"] or 0,
+            "total": total,
+            "processed": processed,
+            "events": counters.get("events", 0),
+            "unprocessed": total - processed,
         }
 
+    @staticmethod
+    async def reconcile_stats() -> None:
+        """Recompute the rss_post_stats counters from an exact count.
+
+        Intended to run periodically (e.g. nightly); blocks writers to
+        rss_posts while counting so the result is consistent.
+        """
+        query = """
+            WITH counts AS (
+                SELECT 
+                    COUNT(*) as total,
+                    COUNT(*) FILTER (WHERE is_processed) as processed,
+                    COUNT(*) FILTER (WHERE is_event) as events
+                FROM rss_posts
+            )
+            UPDATE rss_post_stats 
+            SET value = CASE key
+                WHEN 'total' THEN counts.total
+                WHEN 'processed' THEN counts.processed
+                WHEN 'events' THEN counts.events
+                ELSE value
+            END
+            FROM counts
+        """
+        async with db.transaction() as conn:
+            await conn.execute("LOCK TABLE rss_posts IN SHARE MODE")
+            await conn.execute(query)
+
+    @staticmethod
+    async def filter_existing(links: List[str]) -> Set[str]:
+        """Return the subset of links that are already stored.
+
+        Only links are read, so this is the cheap way to deduplicate a
+        batch of candidates before create_many().
+
+        Args:
+            links: Candidate post links
+
+        Returns:
+            Set of links that already exist
+        """
+        query = "SELECT link FROM rss_posts WHERE link = ANY($1::text[])"
+        rows = await db.fetch(query, links)
+        return {row["link"] for row in rows}
+
     @staticmethod
     async def exists_by_link(link: str) -> bool:
         """Check if post with given link exists."""
@@ -269,6 +750,9 @@ class RSSPostRepository:
         return result is not None
 
 
+_processed_batcher = _UpdateBatcher(RSSPostRepository.mark_many_processed)
+
+
 class OpenAIRequestLogRepository:
     """Repository for OpenAI request log operations."""
 
@@ -297,8 +781,8 @@ class OpenAIRequestLogRepository:
             log.request_type,
             log.model,
             log.endpoint,
-            json.dumps(log.request_data) if log.request_data else None,
-            json.dumps(log.response_data) if log.response_data else None,
+            log.request_data or None,
+            log.response_data or None,
             log.status,
             log.status_code,
             log.tokens_used,
@@ -308,6 +792,44 @@ class OpenAIRequestLogRepository:
         )
         return log_id
 
+    @staticmethod
+    async def create_many(logs: List[OpenAIRequestLog], batch_id: Optional[str] = None) -> int:
+        """Create many log entries with a single binary COPY.
+
+        Args:
+            logs: OpenAIRequestLog dataclass instances
+            batch_id: Optional batch ID to store instead of each entry's own
+
+        Returns:
+            Number of log entries written
+        """
+        if not logs:
+            return 0
+
+        records = [
+            (
+                batch_id or log.batch_id,
+                log.custom_id,
+                log.request_type,
+                log.model,
+                log.endpoint,
+                log.request_data or None,
+                log.response_data or None,
+                log.status,
+                log.status_code,
+                log.tokens_used,
+                log.cost_estimate,
+                log.error_message,
+                log.post_link,
+            )
+            for log in logs
+        ]
+        async with db.transaction() as conn:
+            await conn.copy_records_to_table(
+                "openai_request_logs", records=records, columns=_LOG_COPY_COLUMNS
+            )
+        return len(records)
+
     @staticmethod
     async def update_status(
         log_id: int,
@@ -315,8 +837,9 @@ class OpenAIRequestLogRepository:
         response_data: Optional[dict] = None,
         status_code: Optional[int] = None,
         tokens_used: Optional[int] = None,
-        cost_estimate: Optional[Decimal] = None,
+        cost_estimate: Optional[Union[Decimal, float]] = None,
         error_message: Optional[str] = None,
+        conn: Optional[asyncpg.Connection] = None,
     ) -> None:
         """Update log entry status.
 
@@ -328,55 +851,69 @@ class OpenAIRequestLogRepository:
             tokens_used: Number of tokens used
             cost_estimate: Estimated cost
             error_message: Error message if failed
+            conn: Optional connection to run on (e.g. one from db.transaction())
         """
-        query = """
-            UPDATE openai_request_logs 
-            SET status = $2,
-                response_data = $3,
-                status_code = $4,
-                tokens_used = $5,
-                cost_estimate = $6,
-                error_message = $7,
-                completed_at = $8,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE id = $1
-        """
-        completed_at = datetime.now() if status in ["completed", "failed"] else None
-        await db.execute(
-            query,
+        await (conn or db).execute(
+            _UPDATE_LOG_STATUS_QUERY,
             log_id,
             status,
-            json.dumps(response_data) if response_data else None,
+            response_data or None,
             status_code,
             tokens_used,
             cost_estimate,
             error_message,
-            completed_at,
         )
 
+    @staticmethod
+    async def update_status_many(
+        updates: List[dict], conn: Optional[asyncpg.Connection] = None
+    ) -> None:
+        """Update many log entries with a single executemany.
+
+        Args:
+            updates: Dicts with update_status() keyword arguments (log_id and
+                status required)
+            conn: Optional connection to run on (e.g. one from db.transaction())
+        """
+        if not updates:
+            return
+        records = [
+            (
+                u["log_id"],
+                u["status"],
+                u.get("response_data") or None,
+                u.get("status_code"),
+                u.get("tokens_used"),
+                u.get("cost_estimate"),
+                u.get("error_message"),
+            )
+            for u in updates
+        ]
+        await (conn or db).executemany(_UPDATE_LOG_STATUS_QUERY, records)
+
     @staticmethod
     async def get_by_id(log_id: int) -> Optional[OpenAIRequestLog]:
         """Get log entry by ID."""
-        query = "SELECT * FROM openai_request_logs WHERE id = $1"
+        query = f"SELECT {_LOG_COLUMNS} FROM openai_request_logs WHERE id = $1"
         row = await db.fetchrow(query, log_id)
         return OpenAIRequestLog.from_row(row) if row else None
 
     @staticmethod
     async def get_by_batch_id(batch_id: str) -> List[OpenAIRequestLog]:
         """Get all log entries for a batch."""
-        query = """
-            SELECT * FROM openai_request_logs 
+        query = f"""
+            SELECT {_LOG_COLUMNS} FROM openai_request_logs 
             WHERE batch_id = $1 
             ORDER BY created_at DESC
         """
         rows = await db.fetch(query, batch_id)
-        return [OpenAIRequestLog.from_row(row) for row in rows]
+        return OpenAIRequestLog.from_rows(rows)
 
     @staticmethod
     async def get_by_custom_id(custom_id: str) -> Optional[OpenAIRequestLog]:
         """Get log entry by custom_id."""
-        query = """
-            SELECT * FROM openai_request_logs 
+        query = f"""
+            SELECT {_LOG_COLUMNS} FROM openai_request_logs 
             WHERE custom_id = $1 
             ORDER BY created_at DESC 
             LIMIT 1
@@ -390,6 +927,7 @@ class OpenAIRequestLogRepository:
         offset: int = 0,
         status: Optional[str] = None,
         request_type: Optional[str] = None,
+        after: Optional[Tuple[datetime, int]] = None,
     ) -> List[OpenAIRequestLog]:
         """Get log entries with optional filters.
 
@@ -398,29 +936,20 @@ class OpenAIRequestLogRepository:
             offset: Number of entries to skip
             status: Filter by status
             request_type: Filter by request type
+            after: Keyset cursor (created_at, id) of the last entry on the
+                previous page; use instead of offset for deep pages
 
         Returns:
             List of OpenAIRequestLog instances
         """
-        query = "SELECT * FROM openai_request_logs WHERE 1=1"
-        params = []
-        param_count = 1
-
-        if status is not None:
-            query += f" AND status = ${param_count}"
-            params.append(status)
-            param_count += 1
-
-        if request_type is not None:
-            query += f" AND request_type = ${param_count}"
-            params.append(request_type)
-            param_count += 1
-
-        query += f" ORDER BY created_at DESC LIMIT ${param_count} OFFSET ${param_count + 1}"
-        params.extend([limit, offset])
+        query = _GET_LOGS_QUERIES[(status is not None, request_type is not None, after is not None)]
+        params = [value for value in (status, request_type) if value is not None]
+        if after is not None:
+            params.extend(after)
+        params += [limit, offset]
 
         rows = await db.fetch(query, *params)
-        return [OpenAIRequestLog.from_row(row) for row in rows]
+        return OpenAIRequestLog.from_rows(rows)
 
     @staticmethod
     async def get_stats() -> dict:
@@ -428,9 +957,9 @@ class OpenAIRequestLogRepository:
         query = """
             SELECT 
                 COUNT(*) as total,
-                SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
-                SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed,
-                SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
+                COUNT(*) FILTER (WHERE status = 'completed') as completed,
+                COUNT(*) FILTER (WHERE status = 'failed') as failed,
+                COUNT(*) FILTER (WHERE status = 'pending') as pending,
                 SUM(tokens_used) as total_tokens,
                 SUM(cost_estimate) as total_cost
             FROM openai_request_logs
@@ -445,26 +974,56 @@ class OpenAIRequestLogRepository:
             "total_cost": float(row["total_cost"]) if row["total_cost"] else 0.0,
         }
 
+    @staticmethod
+    async def ensure_partitions(months_ahead: int = 2) -> None:
+        """Create monthly log partitions for the current and upcoming months.
+
+        Args:
+            months_ahead: Number of months after the current one to prepare
+        """
+        # The helper only exists on databases initialized via init_schema()
+        if await db.fetchval("SELECT to_regproc('ensure_openai_request_log_partitions')"):
+            await db.execute("SELECT ensure_openai_request_log_partitions($1)", months_ahead)
+
     @staticmethod
     async def delete_old_logs(days: int = 30) -> int:
         """Delete logs older than specified days.
 
+        Monthly partitions that lie entirely before the cutoff are detached
+        and dropped; remaining old rows (partial months, default partition or
+        a non-partitioned table) are removed with DELETE. Upcoming partitions
+        are created on the way, so running this regularly keeps them ahead.
+
         Args:
             days: Number of days to keep logs
 
         Returns:
             Number of deleted rows
         """
-        query = (
-            """
+        await OpenAIRequestLogRepository.ensure_partitions()
+
+        partitions_query = """
+            SELECT c.relname FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'openai_request_logs'::regclass
+              AND c.relname ~ '^openai_request_logs_y[0-9]{4}m[0-9]{2}$'
+              AND to_date(right(c.relname, 7), 'YYYY"m"MM') + INTERVAL '1 month'
+                  <= NOW() - make_interval(days => $1)
+        """
+        deleted = 0
+        for row in await db.fetch(partitions_query, days):
+            partition = row["relname"]
+            deleted += await db.fetchval(f'SELECT COUNT(*) FROM "{partition}"')
+            await db.execute(f'ALTER TABLE openai_request_logs DETACH PARTITION "{partition}"')
+            await db.execute(f'DROP TABLE "{partition}"')
+
+        query = """
             DELETE FROM openai_request_logs 
-            WHERE created_at < NOW() - INTERVAL '%s days'
+            WHERE created_at < NOW() - make_interval(days => $1)
         """
-            % days
-        )
-        result = await db.execute(query)
+        result = await db.execute(query, days)
         # Parse result like "DELETE 5" to get count
-        return int(result.split()[-1]) if result else 0
+        return deleted + (int(result.split()[-1]) if result else 0)
 
 
 class EventRepository:
@@ -497,27 +1056,80 @@ class EventRepository:
             event.location,
             event.event_type,
             event.confidence,
-            json.dumps(event.additional_data) if event.additional_data else None,
+            event.additional_data or None,
         )
         return event_id
 
+    @staticmethod
+    async def create_many(events: List[Event], conn: Optional[asyncpg.Connection] = None) -> int:
+        """Create many events with a single executemany.
+
+        Args:
+            events: Event dataclass instances
+            conn: Optional connection to run on (e.g. one from db.transaction())
+
+        Returns:
+            Number of events written
+        """
+        if not events:
+            return 0
+        query = """
+            INSERT INTO events (
+                post_link, title, summary, event_date, event_date_is_approximate,
+                location, event_type, confidence, additional_data
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+        """
+        records = [
+            (
+                event.post_link,
+                event.title,
+                event.summary,
+                event.event_date,
+                event.event_date_is_approximate,
+                event.location,
+                event.event_type,
+                event.confidence,
+                event.additional_data or None,
+            )
+            for event in events
+        ]
+        await (conn or db).executemany(query, records)
+        return len(records)
+
     @staticmethod
     async def get_by_id(event_id: int) -> Optional[Event]:
         """Get event by ID."""
-        query = "SELECT * FROM events WHERE id = $1"
+        query = f"SELECT {_EVENT_COLUMNS} FROM events WHERE id = $1"
         row = await db.fetchrow(query, event_id)
         return Event.from_row(row) if row else None
 
     @staticmethod
     async def get_by_post_link(post_link: str) -> Optional[Event]:
         """Get event by post link."""
-        query = "SELECT * FROM events WHERE post_link = $1"
+        query = f"SELECT {_EVENT_COLUMNS} FROM events WHERE post_link = $1"
         row = await db.fetchrow(query, post_link)
         return Event.from_row(row) if row else None
 
+    @staticmethod
+    async def get_by_post_link_many(post_links: List[str]) -> Dict[str, Event]:
+        """Get events for many post links in one query.
+
+        Args:
+            post_links: Post links to look up
+
+        Returns:
+            Mapping of post link to Event for links that have one
+        """
+        query = f"SELECT {_EVENT_COLUMNS} FROM events WHERE post_link = ANY($1::text[])"
+        rows = await db.fetch(query, post_links)
+        return {row["post_link"]: Event.from_row(row) for row in rows}
+
     @staticmethod
     async def get_all(
-        limit: int = 100, offset: int = 0, order_by: str = "event_date"
+        limit: int = 100,
+        offset: int = 0,
+        order_by: str = "event_date",
+        after: Optional[Tuple[datetime, int]] = None,
     ) -> List[Event]:
         """Get all events with pagination.
 
@@ -525,22 +1137,36 @@ class EventRepository:
             limit: Maximum number of events to return
             offset: Number of events to skip
             order_by: Field to order by (event_date, created_at, confidence)
+            after: Keyset cursor (created_at, id) of the last event on the
+                previous page; only valid with order_by="created_at"
 
         Returns:
             List of Event instances
         """
+        if after is not None:
+            if order_by != "created_at":
+                raise ValueError("Keyset pagination requires order_by='created_at'")
+            query = f"""
+                SELECT {_EVENT_COLUMNS} FROM events 
+                WHERE (created_at, id) < ($3, $4)
+                ORDER BY created_at DESC, id DESC
+                LIMIT $1 OFFSET $2
+            """
+            rows = await db.fetch(query, limit, offset, *after)
+            return Event.from_rows(rows)
+
         # Validate order_by to prevent SQL injection
         valid_order_fields = ["event_date", "created_at", "confidence", "id"]
         if order_by not in valid_order_fields:
             order_by = "event_date"
 
         query = f"""
-            SELECT * FROM events 
+            SELECT {_EVENT_COLUMNS} FROM events 
             ORDER BY {order_by} DESC NULLS LAST
             LIMIT $1 OFFSET $2
         """
         rows = await db.fetch(query, limit, offset)
-        return [Event.from_row(row) for row in rows]
+        return Event.from_rows(rows)
 
     @staticmethod
     async def get_upcoming_events(limit: int = 50) -> List[Event]:
@@ -552,14 +1178,14 @@ class EventRepository:
         Returns:
             List of Event instances
         """
-        query = """
-            SELECT * FROM events 
+        query = f"""
+            SELECT {_EVENT_COLUMNS} FROM events 
             WHERE event_date >= CURRENT_TIMESTAMP
             ORDER BY event_date ASC
             LIMIT $1
         """
         rows = await db.fetch(query, limit)
-        return [Event.from_row(row) for row in rows]
+        return Event.from_rows(rows)
 
     @staticmethod
     async def get_by_type(event_type: str, limit: int = 100) -> List[Event]:
@@ -572,14 +1198,14 @@ class EventRepository:
         Returns:
             List of Event instances
         """
-        query = """
-            SELECT * FROM events 
+        query = f"""
+            SELECT {_EVENT_COLUMNS} FROM events 
             WHERE event_type = $1
             ORDER BY event_date DESC NULLS LAST
             LIMIT $2
         """
         rows = await db.fetch(query, event_type, limit)
-        return [Event.from_row(row) for row in rows]
+        return Event.from_rows(rows)
 
     @staticmethod
     async def update(event: Event) -> None:
@@ -616,7 +1242,7 @@ class EventRepository:
             event.location,
             event.event_type,
             event.confidence,
-            json.dumps(event.additional_data) if event.additional_data else None,
+            event.additional_data or None,
         )
 
     @staticmethod
@@ -635,6 +1261,75 @@ class EventRepository:
         query = "SELECT COUNT(*) FROM events"
         return await db.fetchval(query)
 
+    @staticmethod
+    async def approx_count() -> int:
+        """Get the planner's estimate of the number of events.
+
+        Reads pg_class.reltuples instead of scanning the table; accuracy
+        depends on how recently the table was analyzed. Falls back to an
+        exact count if it has never been analyzed.
+        """
+        query = "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass('events')"
+        estimate = await db.fetchval(query)
+        if estimate is None or estimate < 0:
+            return await EventRepository.count()
+        return estimate
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _build_search_sql(mask: Tuple[bool, bool, bool, bool, bool]) -> str:
+        """Build the search SQL for a given set of present filters.
+
+        The SQL depends only on which filters are set, so it is built once per
+        mask and the identical text keeps hitting the statement cache.
+
+        Args:
+            mask: Presence of (query_text, event_type, location, date_from, date_to)
+        """
+        templates = (
+            "(title ILIKE ${n} OR summary ILIKE ${n})",
+            "event_type = ${n}",
+            "location ILIKE ${n}",
+            "event_date >= ${n}",
+            "event_date <= ${n}",
+        )
+        conditions = []
+        param_count = 0
+        for present, template in zip(mask, templates):
+            if present:
+                param_count += 1
+                conditions.append(template.format(n=param_count))
+
+        where_clause = " AND ".join(conditions) if conditions else "TRUE"
+        return f"""
+            SELECT {_EVENT_COLUMNS} FROM events 
+            WHERE {where_clause}
+            ORDER BY event_date DESC NULLS LAST
+            LIMIT ${param_count + 1}
+        """
+
+    @staticmethod
+    def _build_search_query(
+        query_text: Optional[str],
+        event_type: Optional[str],
+        location: Optional[str],
+        date_from: Optional[datetime],
+        date_to: Optional[datetime],
+        limit: Optional[int],
+    ) -> Tuple[str, list]:
+        """Build the SQL and parameters shared by search() and iter_search()."""
+        values = (
+            f"%{query_text}%" if query_text else None,
+            event_type or None,
+            f"%{location}%" if location else None,
+            date_from or None,
+            date_to or None,
+        )
+        mask = tuple(value is not None for value in values)
+        params = [value for value in values if value is not None]
+        params.append(limit)
+        return EventRepository._build_search_sql(mask), params
+
     @staticmethod
     async def search(
         query_text: Optional[str] = None,
@@ -657,44 +1352,42 @@ class EventRepository:
         Returns:
             List of Event instances
         """
-        conditions = []
-        params = []
-        param_count = 0
-
-        if query_text:
-            param_count += 1
-            conditions.append(f"(title ILIKE ${param_count} OR summary ILIKE ${param_count})")
-            params.append(f"%{query_text}%")
-
-        if event_type:
-            param_count += 1
-            conditions.append(f"event_type = ${param_count}")
-            params.append(event_type)
-
-        if location:
-            param_count += 1
-            conditions.append(f"location ILIKE ${param_count}")
-            params.append(f"%{location}%")
+        query, params = EventRepository._build_search_query(
+            query_text, event_type, location, date_from, date_to, limit
+        )
+        rows = await db.fetch(query, *params)
+        return Event.from_rows(rows)
 
-        if date_from:
-            param_count += 1
-            conditions.append(f"event_date >= ${param_count}")
-            params.append(date_from)
+    @staticmethod
+    async def iter_search(
+        query_text: Optional[str] = None,
+        event_type: Optional[str] = None,
+        location: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        prefetch: int = 256,
+    ) -> AsyncIterator[Event]:
+        """Stream search results through a server-side cursor.
 
-        if date_to:
-            param_count += 1
-            conditions.append(f"event_date <= ${param_count}")
-            params.append(date_to)
+        Takes the same filters as search(), but yields events as they are
+        fetched instead of building a list; limit defaults to no limit.
 
-        where_clause = " AND ".join(conditions) if conditions else "TRUE"
-        param_count += 1
-        params.append(limit)
+        Args:
+            query_text: Text to search in title and summary
+            event_type: Filter by event type
+            location: Filter by location
+            date_from: Filter events from this date
+            date_to: Filter events until this date
+            limit: Maximum number of results (None for all)
+            prefetch: Number of rows fetched per round trip
 
-        query = f"""
-            SELECT * FROM events 
-            WHERE {where_clause}
-            ORDER BY event_date DESC NULLS LAST
-            LIMIT ${param_count}
+        Yields:
+            Event instances
         """
-        rows = await db.fetch(query, *params)
-        return [Event.from_row(row) for row in rows]
+        query, params = EventRepository._build_search_query(
+            query_text, event_type, location, date_from, date_to, limit
+        )
+        async with db.transaction() as conn:
+            async for row in conn.cursor(query, *params, prefetch=prefetch):
+                yield Event.from_row(row)
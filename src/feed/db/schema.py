@@ -22,7 +22,254 @@ CREATE TABLE IF NOT EXISTS rss_posts (
 # Create indexes for common queries
 CREATE_INDEXES = """
 CREATE INDEX IF NOT EXISTS idx_rss_posts_link ON rss_posts(link);
-CREATE INDEX IF NOT EXISTS idx_rss_posts_is_processed ON rss_posts(is_processed);
+-- Low-cardinality boolean; superseded by the partial indexes below
+DROP INDEX IF EXISTS idx_rss_posts_is_processed;
 CREATE INDEX IF NOT EXISTS idx_rss_posts_is_event ON rss_posts(is_event);
 CREATE INDEX IF NOT EXISTS idx_rss_posts_created_at ON rss_posts(created_at);
+CREATE INDEX IF NOT EXISTS idx_rss_posts_created_at_link ON rss_posts(created_at DESC, link DESC);
+CREATE INDEX IF NOT EXISTS idx_rss_posts_unprocessed ON rss_posts(link) WHERE NOT is_processed;
+CREATE INDEX IF NOT EXISTS idx_rss_posts_events ON rss_posts(link) WHERE is_event;
+CREATE INDEX IF NOT EXISTS idx_rss_posts_unprocessed_by_date
+    ON rss_posts(created_at ASC) INCLUDE (link) WHERE NOT is_processed;
+CREATE INDEX IF NOT EXISTS idx_rss_posts_processed_event_created
+    ON rss_posts(created_at DESC) WHERE is_processed AND is_event;
+CREATE INDEX IF NOT EXISTS idx_rss_posts_processed_not_event_created
+    ON rss_posts(created_at DESC) WHERE is_processed AND NOT is_event;
+CREATE INDEX IF NOT EXISTS idx_rss_posts_unprocessed_event_created
+    ON rss_posts(created_at DESC) WHERE NOT is_processed AND is_event;
+CREATE INDEX IF NOT EXISTS idx_rss_posts_unprocessed_not_event_created
+    ON rss_posts(created_at DESC) WHERE NOT is_processed AND NOT is_event;
 """
+
+# Running counters for RSSPostRepository.get_stats, maintained by triggers so
+# reading stats does not scan rss_posts. Unprocessed is derived as
+# total - processed.
+CREATE_STATS_TABLE = """
+CREATE TABLE IF NOT EXISTS rss_post_stats (
+    key VARCHAR(32) PRIMARY KEY,
+    value BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO rss_post_stats (key, value)
+SELECT 'total', COUNT(*) FROM rss_posts
+UNION ALL
+SELECT 'processed', COUNT(*) FILTER (WHERE is_processed) FROM rss_posts
+UNION ALL
+SELECT 'events', COUNT(*) FILTER (WHERE is_event) FROM rss_posts
+ON CONFLICT (key) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION rss_post_stats_apply() RETURNS trigger AS $$
+DECLARE
+    d_total BIGINT := 0;
+    d_processed BIGINT := 0;
+    d_events BIGINT := 0;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        UPDATE rss_post_stats SET value = 0 WHERE value <> 0;
+        RETURN NULL;
+    END IF;
+
+    -- One aggregate per statement over its transition tables
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        SELECT COUNT(*), COUNT(*) FILTER (WHERE is_processed), COUNT(*) FILTER (WHERE is_event)
+        INTO d_total, d_processed, d_events
+        FROM new_rows;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        SELECT
+            d_total - COUNT(*),
+            d_processed - COUNT(*) FILTER (WHERE is_processed),
+            d_events - COUNT(*) FILTER (WHERE is_event)
+        INTO d_total, d_processed, d_events
+        FROM old_rows;
+    END IF;
+
+    -- Only touch (and lock) the counters that actually change
+    UPDATE rss_post_stats AS s
+    SET value = s.value + d.delta
+    FROM (VALUES ('total', d_total), ('processed', d_processed), ('events', d_events))
+        AS d(key, delta)
+    WHERE s.key = d.key AND d.delta <> 0;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Statement-level triggers: a batch insert or bulk update adjusts each
+-- counter once instead of rewriting every counter row per post. Transition
+-- tables allow a single event per trigger, hence one trigger per operation.
+DROP TRIGGER IF EXISTS rss_post_stats_insert_delete ON rss_posts;
+DROP TRIGGER IF EXISTS rss_post_stats_insert ON rss_posts;
+DROP TRIGGER IF EXISTS rss_post_stats_delete ON rss_posts;
+DROP TRIGGER IF EXISTS rss_post_stats_update ON rss_posts;
+
+CREATE TRIGGER rss_post_stats_insert
+    AFTER INSERT ON rss_posts
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION rss_post_stats_apply();
+
+CREATE TRIGGER rss_post_stats_delete
+    AFTER DELETE ON rss_posts
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION rss_post_stats_apply();
+
+CREATE TRIGGER rss_post_stats_update
+    AFTER UPDATE ON rss_posts
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION rss_post_stats_apply();
+
+CREATE OR REPLACE TRIGGER rss_post_stats_truncate
+    AFTER TRUNCATE ON rss_posts
+    FOR EACH STATEMENT EXECUTE FUNCTION rss_post_stats_apply();
+"""
+
+# OpenAI request logs, range-partitioned by month so retention can drop whole
+# partitions. Rows outside the pre-created months land in the default partition.
+# Databases that already have the unpartitioned table (alembic revisions
+# b52b9c7d4e9e..7fbaf00cc52f) keep it as is: the partition DDL below is skipped
+# for them and delete_old_logs() falls back to DELETE.
+CREATE_REQUEST_LOGS_TABLE = """
+CREATE TABLE IF NOT EXISTS openai_request_logs (
+    id SERIAL,
+    batch_id VARCHAR(255),
+    custom_id VARCHAR(255),
+    request_type VARCHAR(50) NOT NULL,
+    model VARCHAR(100) NOT NULL,
+    endpoint VARCHAR(255) NOT NULL,
+    request_data JSONB,
+    response_data JSONB,
+    status VARCHAR(50) NOT NULL,
+    status_code INTEGER,
+    tokens_used INTEGER,
+    cost_estimate NUMERIC(10, 6),
+    error_message TEXT,
+    post_link VARCHAR(2048),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    completed_at TIMESTAMP,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_class
+        WHERE oid = to_regclass('openai_request_logs') AND relkind = 'p'
+    ) THEN
+        CREATE TABLE IF NOT EXISTS openai_request_logs_default
+            PARTITION OF openai_request_logs DEFAULT;
+    END IF;
+END $$;
+
+CREATE INDEX IF NOT EXISTS idx_openai_logs_batch_id ON openai_request_logs(batch_id);
+CREATE INDEX IF NOT EXISTS idx_openai_logs_custom_id ON openai_request_logs(custom_id);
+CREATE INDEX IF NOT EXISTS idx_openai_logs_status ON openai_request_logs(status);
+CREATE INDEX IF NOT EXISTS idx_openai_logs_created_at ON openai_request_logs(created_at);
+CREATE INDEX IF NOT EXISTS idx_openai_logs_post_link ON openai_request_logs(post_link);
+
+-- Create monthly partitions (openai_request_logs_yYYYYmMM) for the current
+-- month and the next months_ahead months. No-op for a non-partitioned table.
+-- Rows of a month that already landed in the default partition are moved
+-- into its new partition; PARTITION OF would fail on them.
+CREATE OR REPLACE FUNCTION ensure_openai_request_log_partitions(months_ahead INTEGER)
+RETURNS void AS $$
+DECLARE
+    month_start TIMESTAMP := date_trunc('month', CURRENT_TIMESTAMP);
+    range_start TIMESTAMP;
+    range_end TIMESTAMP;
+    partition_name TEXT;
+    i INTEGER;
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_partitioned_table
+        WHERE partrelid = 'openai_request_logs'::regclass
+    ) THEN
+        RETURN;
+    END IF;
+
+    -- Concurrent callers would race to create the same partitions
+    PERFORM pg_advisory_xact_lock(hashtext('ensure_openai_request_log_partitions'));
+
+    FOR i IN 0..months_ahead LOOP
+        range_start := month_start + make_interval(months => i);
+        range_end := range_start + INTERVAL '1 month';
+        partition_name := 'openai_request_logs_' || to_char(range_start, '"y"YYYY"m"MM');
+        CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+
+        EXECUTE format(
+            'CREATE TABLE %I (LIKE openai_request_logs INCLUDING ALL)', partition_name
+        );
+        IF to_regclass('openai_request_logs_default') IS NOT NULL THEN
+            EXECUTE format(
+                'WITH moved AS ('
+                '    DELETE FROM openai_request_logs_default'
+                '    WHERE created_at >= %L AND created_at < %L RETURNING *'
+                ') INSERT INTO %I SELECT * FROM moved',
+                range_start, range_end, partition_name
+            );
+        END IF;
+        EXECUTE format(
+            'ALTER TABLE openai_request_logs ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+            partition_name, range_start, range_end
+        );
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT ensure_openai_request_log_partitions(2);
+"""
+
+# Trigram indexes so EventRepository.search's ILIKE '%...%' filters use an
+# index instead of a sequential scan. Skipped when the events table is absent.
+CREATE_EVENT_SEARCH_INDEXES = """
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+DO $$
+BEGIN
+    IF to_regclass('events') IS NOT NULL THEN
+        CREATE INDEX IF NOT EXISTS idx_events_title_trgm
+            ON events USING gin (title gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_events_summary_trgm
+            ON events USING gin (summary gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_events_location_trgm
+            ON events USING gin (location gin_trgm_ops);
+    END IF;
+END
+$$;
+"""
+
+
+def _use_lz4_compression(table: str, *columns: str) -> str:
+    """Return a DO block switching the given columns to lz4 TOAST compression.
+
+    Skipped on PostgreSQL builds without lz4 support (SET COMPRESSION lz4
+    fails there) and for columns that are missing or already use lz4.
+    """
+    names = ", ".join(f"'{column}'" for column in columns)
+    return f"""
+DO $$
+DECLARE
+    col NAME;
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_settings
+        WHERE name = 'default_toast_compression' AND 'lz4' = ANY(enumvals)
+    ) THEN
+        FOR col IN
+            SELECT attname FROM pg_attribute
+            WHERE attrelid = '{table}'::regclass AND attname IN ({names})
+                AND NOT attisdropped AND attcompression <> 'l'
+        LOOP
+            EXECUTE format('ALTER TABLE {table} ALTER COLUMN %I SET COMPRESSION lz4', col);
+        END LOOP;
+    END IF;
+END $$;
+"""
+
+
+# lz4 TOAST compression for the large text/JSONB columns (docker-compose also
+# sets default_toast_compression=lz4 for every other column)
+USE_LZ4_COMPRESSION = _use_lz4_compression(
+    "rss_posts", "content", "classification_data"
+) + _use_lz4_compression("openai_request_logs", "request_data", "response_data")
@@ -1,9 +1,54 @@
 """Database connection and session management using asyncpg."""
 
 import asyncpg
-from typing import Optional
+import orjson
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, List, Optional, Tuple
 from .config import settings
-from .schema import CREATE_POSTS_TABLE, CREATE_INDEXES
+from .schema import (
+    CREATE_POSTS_TABLE,
+    CREATE_EVENT_SEARCH_INDEXES,
+    CREATE_INDEXES,
+    CREATE_REQUEST_LOGS_TABLE,
+    CREATE_STATS_TABLE,
+    USE_LZ4_COMPRESSION,
+)
+
+
+# Binary JSONB values are prefixed with a one-byte format version
+_JSONB_VERSION = b"\x01"
+
+
+def _encode_jsonb(value) -> bytes:
+    """Serialize a value to the binary JSONB wire format."""
+    return _JSONB_VERSION + orjson.dumps(value)
+
+
+def _decode_jsonb(data: bytes):
+    """Parse a value from the binary JSONB wire format."""
+    return orjson.loads(data[1:])
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Encode and decode JSON/JSONB columns with orjson in binary format.
+
+    Repositories pass plain dicts/lists for JSON columns and get them back
+    already parsed, without a text round trip on either side.
+    """
+    await conn.set_type_codec(
+        "json",
+        encoder=orjson.dumps,
+        decoder=orjson.loads,
+        schema="pg_catalog",
+        format="binary",
+    )
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema="pg_catalog",
+        format="binary",
+    )
 
 
 class Database:
@@ -11,18 +56,49 @@ class Database:
 
     def __init__(self):
         self.pool: Optional[asyncpg.Pool] = None
-
-    async def connect(self) -> None:
-        """Create connection pool."""
+        # LISTEN runs on its own connection: pooled connections drop their
+        # listeners when they are released
+        self.listener: Optional[asyncpg.Connection] = None
+        self._listeners: List[Tuple[str, Callable]] = []
+
+    def add_listener(self, channel: str, callback: Callable) -> None:
+        """Subscribe a callback to a NOTIFY channel from the next connect() on.
+
+        Args:
+            channel: NOTIFY channel name
+            callback: asyncpg listener, called as (connection, pid, channel, payload)
+        """
+        self._listeners.append((channel, callback))
+
+    async def connect(self, min_size: int = 5, max_size: int = 20) -> None:
+        """Create connection pool.
+
+        Args:
+            min_size: Connections opened up front and kept open
+            max_size: Upper bound on connections under load
+        """
         self.pool = await asyncpg.create_pool(
             dsn=settings.get_dsn(),
-            min_size=5,
-            max_size=20,
+            min_size=min_size,
+            max_size=max_size,
             command_timeout=60,
+            # Pooled connections are long-lived; keep every repository query
+            # prepared so repeat calls skip Parse/Describe
+            statement_cache_size=1024,
+            max_cached_statement_lifetime=0,
+            init=_init_connection,
         )
 
+        if self._listeners:
+            self.listener = await asyncpg.connect(dsn=settings.get_dsn())
+            for channel, callback in self._listeners:
+                await self.listener.add_listener(channel, callback)
+
     async def disconnect(self) -> None:
-        """Close connection pool."""
+        """Close connection pool and the listener connection."""
+        if self.listener:
+            await self.listener.close()
+            self.listener = None
         if self.pool:
             await self.pool.close()
 
@@ -36,14 +112,48 @@ class Database:
             await conn.execute(CREATE_POSTS_TABLE)
             # Create indexes
             await conn.execute(CREATE_INDEXES)
+            # Create stats counters and their triggers
+            await conn.execute(CREATE_STATS_TABLE)
+            # Create the partitioned request log table
+            await conn.execute(CREATE_REQUEST_LOGS_TABLE)
+            # Switch large columns to lz4 where the server supports it
+            await conn.execute(USE_LZ4_COMPRESSION)
+            # Create trigram indexes for event search
+            await conn.execute(CREATE_EVENT_SEARCH_INDEXES)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[asyncpg.Connection]:
+        """Acquire a connection and run the enclosed statements in one transaction.
+
+        Statements executed on the yielded connection are committed together,
+        paying a single commit instead of one per statement.
+        """
+        if not self.pool:
+            raise RuntimeError("Database not connected. Call connect() first.")
+
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                yield conn
+
+    async def execute(self, query: str, *args) -> str:
+        """Execute a query without returning rows.
+
+        Returns:
+            Command status tag, e.g. "DELETE 5"
+        """
+        if not self.pool:
+            raise RuntimeError("Database not connected. Call connect() first.")
+
+        async with self.pool.acquire() as conn:
+            return await conn.execute(query, *args)
 
-    async def execute(self, query: str, *args) -> None:
-        """Execute a query without returning results."""
+    async def executemany(self, query: str, args) -> None:
+        """Execute a query once per argument tuple in a single round trip."""
         if not self.pool:
             raise RuntimeError("Database not connected. Call connect() first.")
 
         async with self.pool.acquire() as conn:
-            await conn.execute(query, *args)
+            await conn.executemany(query, args)
 
     async def fetch(self, query: str, *args) -> list:
         """Fetch multiple rows."""
@@ -12,6 +12,8 @@ logger = logging.getLogger(__name__)
 class RSSFeedManager:
     """Manage multiple RSS feeds."""
 
+    __slots__ = ("parser", "feeds")
+
     def __init__(self):
         self.parser = RSSParser()
         self.feeds: dict[str, RSSChannel] = {}
@@ -33,7 +35,7 @@ class RSSFeedManager:
 
     def list_feeds(self) -> List[str]:
         """List all feed names."""
-        return list(self.feeds.keys())
+        return list(self.feeds)
 
     def export_json(self, name: str) -> str:
         """Export feed as JSON."""
@@ -1,11 +1,11 @@
 """Data models for RSS feeds."""
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from typing import List, Optional
-import json
+import orjson
 
 
-@dataclass
+@dataclass(slots=True)
 class RSSItem:
     """Represents a single RSS feed item."""
 
@@ -20,14 +20,16 @@ class RSSItem:
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
-        return asdict(self)
+        data = {name: getattr(self, name) for name in _RSS_ITEM_FIELDS}
+        data["media_urls"] = list(self.media_urls)
+        return data
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2, default=str)
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
 
 
-@dataclass
+@dataclass(slots=True)
 class RSSChannel:
     """Represents RSS feed metadata."""
 
@@ -44,11 +46,16 @@ class RSSChannel:
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
-        data = asdict(self)
+        data = {name: getattr(self, name) for name in _RSS_CHANNEL_FIELDS}
         data["items"] = [item.to_dict() for item in self.items]
         data["item_count"] = len(self.items)
         return data
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2, default=str)
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
+
+
+# Field names, resolved once rather than by asdict() on every call
+_RSS_ITEM_FIELDS = tuple(f.name for f in fields(RSSItem))
+_RSS_CHANNEL_FIELDS = tuple(f.name for f in fields(RSSChannel))
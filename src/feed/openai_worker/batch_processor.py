@@ -1,17 +1,40 @@
 """OpenAI Batch API processor for event classification."""
 
-import json
+import asyncio
+import random
 import time
+import uuid
 import hashlib
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 from decimal import Decimal
-from openai import OpenAI
+import orjson
+from openai import AsyncOpenAI
 
 from .config import openai_settings
 from ..db.models import RSSPost, OpenAIRequestLog, Event
 from ..db.repository import RSSPostRepository, OpenAIRequestLogRepository, EventRepository
+from ..db.session import db
+
+
+def _legacy_link_hashes(link: str) -> Tuple[str, str]:
+    """Link hashes used by older "post_{i}_{link_hash}" custom_ids.
+
+    Returns:
+        Tuple of the BLAKE2b and the MD5 based 16-character hashes
+    """
+    data = link.encode()
+    return (
+        hashlib.blake2b(data, digest_size=8, usedforsecurity=False).hexdigest(),
+        hashlib.md5(data, usedforsecurity=False).hexdigest()[:16],
+    )
+
+
+def _load_results(path: Path) -> List[dict]:
+    """Read a batch results JSONL file and decode every non-blank line."""
+    data = path.read_bytes()
+    return [orjson.loads(line) for line in data.split(b"\n") if line.strip()]
 
 
 class BatchProcessor:
@@ -36,78 +59,114 @@ Date: {pub_date}
 
 Is this an event?"""
 
+    # USD per token (gpt-4o-mini pricing)
+    _INPUT_TOKEN_COST = 0.15 / 1_000_000
+    _OUTPUT_TOKEN_COST = 0.60 / 1_000_000
+
     def __init__(self):
         """Initialize the batch processor."""
-        self.client = OpenAI(api_key=openai_settings.api_key)
+        self.client = AsyncOpenAI(api_key=openai_settings.api_key)
         self.batch_dir = Path(__file__).parent.parent.parent.parent / "batch_data"
         self.batch_dir.mkdir(exist_ok=True)
 
-    async def create_batch_request_file(
-        self, posts: List[RSSPost], batch_id: Optional[str] = None
-    ) -> Path:
-        """Create a JSONL file with batch requests and log them to database.
+    @staticmethod
+    def _make_custom_id(batch_key: str, i: int) -> str:
+        """Build the custom_id for the i-th post of a batch.
+
+        Args:
+            batch_key: Time-sortable key shared by all requests of the batch
+            i: Position of the post in the batch
+
+        Returns:
+            custom_id in the form "{batch_key}_{i:06d}"
+        """
+        return f"{batch_key}_{i:06d}"
+
+    async def _build_jsonl(self, posts: List[RSSPost]) -> Tuple[Path, List[OpenAIRequestLog]]:
+        """Write a JSONL file with batch requests and collect their log entries.
 
         Args:
             posts: List of RSSPost instances to process
-            batch_id: Optional batch ID to associate with logs (for pre-logging)
 
         Returns:
-            Path to the created JSONL file
+            Tuple of the JSONL file path and unsaved log entries (batch_id unset)
         """
+        # UUIDv7 keeps custom_ids unique and sortable by submission time; it
+        # also tells apart the files of batches started in the same second
+        batch_key = uuid.uuid7().hex
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filepath = self.batch_dir / f"batch_request_{timestamp}.jsonl"
+        filepath = self.batch_dir / f"batch_request_{timestamp}_{batch_key[-8:]}.jsonl"
+
+        lines = []
+        logs = []
+        for i, post in enumerate(posts):
+            # Truncate content if too long (to stay within token limits)
+            content = post.content[:2000]
+
+            user_prompt = self.USER_PROMPT_TEMPLATE.format(
+                link=post.link,
+                content=content,
+                pub_date=post.pub_date.isoformat() if post.pub_date else "Unknown",
+            )
 
-        with open(filepath, "w") as f:
-            for i, post in enumerate(posts):
-                # Truncate content if too long (to stay within token limits)
-                content = post.content[:2000] if len(post.content) > 2000 else post.content
+            # Results are matched back to posts through the logged post_link
+            custom_id = self._make_custom_id(batch_key, i)
+
+            request_body = {
+                "model": openai_settings.model,
+                "messages": [
+                    {"role": "system", "content": self.SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt},
+                ],
+                "max_tokens": openai_settings.max_tokens,
+                "temperature": openai_settings.temperature,
+                "response_format": {"type": "json_object"},
+            }
+
+            request = {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": request_body,
+            }
+            lines.append(orjson.dumps(request, option=orjson.OPT_APPEND_NEWLINE))
+
+            # Collect the request log; the caller writes all entries in one COPY
+            log_entry = OpenAIRequestLog(
+                batch_id=None,
+                custom_id=custom_id,
+                request_type="batch",
+                model=openai_settings.model,
+                endpoint="/v1/chat/completions",
+                request_data={
+                    "messages": request_body["messages"],
+                    "max_tokens": request_body["max_tokens"],
+                    "temperature": request_body["temperature"],
+                },
+                status="pending",
+                post_link=post.link,
+            )
+            logs.append(log_entry)
 
-                user_prompt = self.USER_PROMPT_TEMPLATE.format(
-                    link=post.link,
-                    content=content,
-                    pub_date=post.pub_date.isoformat() if post.pub_date else "Unknown",
-                )
+        # One write for the whole file instead of one per request
+        await asyncio.to_thread(filepath.write_bytes, b"".join(lines))
 
-                # Create a unique custom_id using hash of the link
-                link_hash = hashlib.md5(post.link.encode()).hexdigest()[:16]
-                custom_id = f"post_{i}_{link_hash}"
+        return filepath, logs
 
-                request_body = {
-                    "model": openai_settings.model,
-                    "messages": [
-                        {"role": "system", "content": self.SYSTEM_PROMPT},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    "max_tokens": openai_settings.max_tokens,
-                    "temperature": openai_settings.temperature,
-                    "response_format": {"type": "json_object"},
-                }
+    async def create_batch_request_file(
+        self, posts: List[RSSPost], batch_id: Optional[str] = None
+    ) -> Path:
+        """Create a JSONL file with batch requests and log them to database.
 
-                request = {
-                    "custom_id": custom_id,
-                    "method": "POST",
-                    "url": "/v1/chat/completions",
-                    "body": request_body,
-                }
-                f.write(json.dumps(request) + "\n")
-
-                # Log the request to database
-                log_entry = OpenAIRequestLog(
-                    batch_id=batch_id,
-                    custom_id=custom_id,
-                    request_type="batch",
-                    model=openai_settings.model,
-                    endpoint="/v1/chat/completions",
-                    request_data={
-                        "messages": request_body["messages"],
-                        "max_tokens": request_body["max_tokens"],
-                        "temperature": request_body["temperature"],
-                    },
-                    status="pending",
-                    post_link=post.link,
-                )
-                await OpenAIRequestLogRepository.create(log_entry)
+        Args:
+            posts: List of RSSPost instances to process
+            batch_id: Optional batch ID to associate with logs (for pre-logging)
 
+        Returns:
+            Path to the created JSONL file
+        """
+        filepath, logs = await self._build_jsonl(posts)
+        await OpenAIRequestLogRepository.create_many(logs, batch_id=batch_id)
         return filepath
 
     async def submit_batch(self, posts: List[RSSPost]) -> str:
@@ -122,15 +181,17 @@ Is this an event?"""
         if not posts:
             raise ValueError("No posts provided for batch processing")
 
-        # Create batch request file (this will log individual requests with batch_id=None initially)
-        request_file_path = await self.create_batch_request_file(posts)
+        # Build the request file; logs are saved once the batch_id is known
+        request_file_path, logs = await self._build_jsonl(posts)
 
         # Upload file to OpenAI
-        with open(request_file_path, "rb") as f:
-            batch_input_file = self.client.files.create(file=f, purpose="batch")
+        request_file = await asyncio.to_thread(request_file_path.read_bytes)
+        batch_input_file = await self.client.files.create(
+            file=(request_file_path.name, request_file), purpose="batch"
+        )
 
         # Create batch
-        batch = self.client.batches.create(
+        batch = await self.client.batches.create(
             input_file_id=batch_input_file.id,
             endpoint="/v1/chat/completions",
             completion_window="24h",
@@ -140,29 +201,19 @@ Is this an event?"""
             },
         )
 
-        # Update all pending logs with the batch_id
-        for post in posts:
-            link_hash = hashlib.md5(post.link.encode()).hexdigest()[:16]
-            # Find log entries by custom_id pattern
-            for i in range(len(posts)):
-                custom_id = f"post_{i}_{link_hash}"
-                log = await OpenAIRequestLogRepository.get_by_custom_id(custom_id)
-                if log and log.batch_id is None:
-                    # Update with batch_id
-                    query = "UPDATE openai_request_logs SET batch_id = $1 WHERE id = $2"
-                    from ..db.session import db
-
-                    await db.execute(query, batch.id, log.id)
-                    break
-
-        print(f"Batch submitted: {batch.id}")
-        print(f"Status: {batch.status}")
-        print(f"Request file saved: {request_file_path}")
-        print(f"Logged {len(posts)} requests to database")
+        # Log all requests with the batch_id in a single write
+        await OpenAIRequestLogRepository.create_many(logs, batch_id=batch.id)
+
+        print(
+            f"Batch submitted: {batch.id}\n"
+            f"Status: {batch.status}\n"
+            f"Request file saved: {request_file_path}\n"
+            f"Logged {len(posts)} requests to database"
+        )
 
         return batch.id
 
-    def check_batch_status(self, batch_id: str) -> Dict:
+    async def check_batch_status(self, batch_id: str) -> Dict:
         """Check the status of a batch.
 
         Args:
@@ -171,7 +222,7 @@ Is this an event?"""
         Returns:
             Dictionary with batch status information
         """
-        batch = self.client.batches.retrieve(batch_id)
+        batch = await self.client.batches.retrieve(batch_id)
 
         return {
             "id": batch.id,
@@ -188,7 +239,7 @@ Is this an event?"""
             },
         }
 
-    def download_results(self, batch_id: str) -> Optional[Path]:
+    async def download_results(self, batch_id: str) -> Optional[Path]:
         """Download batch results.
 
         Args:
@@ -197,7 +248,7 @@ Is this an event?"""
         Returns:
             Path to downloaded results file, or None if not ready
         """
-        batch = self.client.batches.retrieve(batch_id)
+        batch = await self.client.batches.retrieve(batch_id)
 
         if batch.status != "completed":
             print(f"Batch {batch_id} not completed yet. Status: {batch.status}")
@@ -208,233 +259,317 @@ Is this an event?"""
             return None
 
         # Download results
-        file_content = self.client.files.content(batch.output_file_id)
+        file_content = await self.client.files.content(batch.output_file_id)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_path = self.batch_dir / f"batch_results_{batch_id}_{timestamp}.jsonl"
 
-        with open(output_path, "wb") as f:
-            f.write(file_content.content)
+        await asyncio.to_thread(output_path.write_bytes, file_content.content)
 
         print(f"Results downloaded: {output_path}")
         return output_path
 
-    async def process_results(self, results_file: Path, posts: List[RSSPost]) -> Dict:
+    @staticmethod
+    async def _find_log(
+        custom_id: str, logs_by_custom_id: Optional[Dict[str, OpenAIRequestLog]]
+    ) -> Optional[OpenAIRequestLog]:
+        """Look up a request log, from the prefetched map when there is one."""
+        if logs_by_custom_id is not None:
+            return logs_by_custom_id.get(custom_id)
+        return await OpenAIRequestLogRepository.get_by_custom_id(custom_id)
+
+    async def process_results(
+        self, results_file: Path, posts: List[RSSPost], batch_id: Optional[str] = None
+    ) -> Dict:
         """Process batch results and update database.
 
         Args:
             results_file: Path to the results JSONL file
             posts: Original list of posts (for reference)
+            batch_id: OpenAI batch ID; when given, its request logs are loaded
+                up front instead of being looked up one by one
 
         Returns:
             Dictionary with processing statistics
         """
         stats = {"total": 0, "success": 0, "failed": 0, "events_found": 0}
 
-        # Create a mapping of posts by their link hash for quick lookup
-        posts_by_hash = {}
-        for post in posts:
-            link_hash = hashlib.md5(post.link.encode()).hexdigest()[:16]
-            posts_by_hash[link_hash] = post
+        posts_by_link = {post.link: post for post in posts}
+        # Built on first use, for custom_ids of the older "post_{i}_{link_hash}" form
+        posts_by_hash = None
 
-        with open(results_file, "r") as f:
-            for line in f:
-                stats["total"] += 1
-                result = json.loads(line)
+        logs_by_custom_id = None
+        if batch_id:
+            logs_by_custom_id = {
+                log.custom_id: log
+                for log in await OpenAIRequestLogRepository.get_by_batch_id(batch_id)
+            }
 
-                try:
-                    # Extract custom_id to find the corresponding post
-                    custom_id = result["custom_id"]
-                    # custom_id format: "post_{i}_{link_hash}"
+        # Per-result output is printed in one go after the loop
+        messages = []
 
-                    # Extract the hash from custom_id
-                    parts = custom_id.split("_")
-                    if len(parts) < 3:
-                        print(f"Invalid custom_id format: {custom_id}")
-                        stats["failed"] += 1
-                        continue
+        # One timestamp for the whole results file
+        classified_at = datetime.now().isoformat()
 
-                    link_hash = parts[2]
+        # All database writes are collected here and flushed after the file is read
+        processed_updates = []
+        log_updates = []
+        events_to_create = []
 
-                    # Get the response
-                    response = result["response"]
-                    status_code = response["status_code"]
+        # Read and decode the whole file in a worker thread, off the event loop
+        results = await asyncio.to_thread(_load_results, results_file)
+        for result in results:
+            stats["total"] += 1
 
-                    if status_code != 200:
-                        stats["failed"] += 1
-                        print(f"Failed response for {custom_id}: {response}")
+            try:
+                # The request log for custom_id records which post it was for
+                custom_id = result["custom_id"]
+                log = await self._find_log(custom_id, logs_by_custom_id)
 
-                        # Log the failure
-                        log = await OpenAIRequestLogRepository.get_by_custom_id(custom_id)
-                        if log:
-                            await OpenAIRequestLogRepository.update_status(
-                                log_id=log.id,
-                                status="failed",
-                                status_code=status_code,
-                                response_data=response,
-                                error_message=response.get("body", {})
+                # Get the response
+                response = result["response"]
+                status_code = response["status_code"]
+
+                if status_code != 200:
+                    stats["failed"] += 1
+                    messages.append(f"Failed response for {custom_id}: {response}")
+
+                    # Log the failure
+                    if log:
+                        log_updates.append(
+                            {
+                                "log_id": log.id,
+                                "status": "failed",
+                                "status_code": status_code,
+                                "response_data": response,
+                                "error_message": response.get("body", {})
                                 .get("error", {})
                                 .get("message", "Unknown error"),
-                            )
-                        continue
+                            }
+                        )
+                    continue
 
-                    # Parse the classification result
-                    message_content = response["body"]["choices"][0]["message"]["content"]
-                    classification = json.loads(message_content)
+                # Parse the classification result
+                message_content = response["body"]["choices"][0]["message"]["content"]
+                classification = orjson.loads(message_content)
 
-                    # Calculate tokens used
-                    usage = response["body"].get("usage", {})
-                    tokens_used = usage.get("total_tokens", 0)
+                # Calculate tokens used
+                usage = response["body"].get("usage", {})
+                tokens_used = usage.get("total_tokens", 0)
 
-                    # Estimate cost (gpt-4o-mini pricing: ~$0.15 per 1M input tokens, ~$0.60 per 1M output tokens)
-                    prompt_tokens = usage.get("prompt_tokens", 0)
-                    completion_tokens = usage.get("completion_tokens", 0)
-                    cost_estimate = Decimal(
-                        (prompt_tokens * 0.15 / 1_000_000) + (completion_tokens * 0.60 / 1_000_000)
-                    )
+                # Estimate cost (gpt-4o-mini pricing: ~$0.15 per 1M input tokens, ~$0.60 per 1M output tokens)
+                prompt_tokens = usage.get("prompt_tokens", 0)
+                completion_tokens = usage.get("completion_tokens", 0)
+                cost_estimate = (
+                    prompt_tokens * self._INPUT_TOKEN_COST
+                    + completion_tokens * self._OUTPUT_TOKEN_COST
+                )
 
-                    # Find the matching post using the hash
-                    matching_post = posts_by_hash.get(link_hash)
+                # Find the matching post
+                matching_post = posts_by_link.get(log.post_link) if log else None
+                if not matching_post and custom_id.startswith("post_"):
+                    if posts_by_hash is None:
+                        posts_by_hash = {
+                            link_hash: post
+                            for post in posts
+                            for link_hash in _legacy_link_hashes(post.link)
+                        }
+                    matching_post = posts_by_hash.get(custom_id.rsplit("_", 1)[-1])
+
+                if not matching_post:
+                    messages.append(f"Could not find matching post for custom_id {custom_id}")
+                    stats["failed"] += 1
 
-                    if not matching_post:
-                        print(
-                            f"Could not find matching post for hash {link_hash} (custom_id: {custom_id})"
+                    # Still log the response
+                    if log:
+                        log_updates.append(
+                            {
+                                "log_id": log.id,
+                                "status": "completed",
+                                "status_code": status_code,
+                                "response_data": response["body"],
+                                "tokens_used": tokens_used,
+                                "cost_estimate": cost_estimate,
+                                "error_message": "Post not found in current batch",
+                            }
                         )
-                        stats["failed"] += 1
+                    continue
 
-                        # Still log the response
-                        log = await OpenAIRequestLogRepository.get_by_custom_id(custom_id)
-                        if log:
-                            await OpenAIRequestLogRepository.update_status(
-                                log_id=log.id,
-                                status="completed",
-                                status_code=status_code,
-                                response_data=response["body"],
-                                tokens_used=tokens_used,
-                                cost_estimate=cost_estimate,
-                                error_message="Post not found in current batch",
-                            )
-                        continue
-
-                    # Update the database
-                    is_event = classification.get("is_event", False)
-                    classification_data = {
-                        "confidence": classification.get("confidence", 0.0),
-                        "event_details": classification.get("event_details", {}),
-                        "model": openai_settings.model,
-                        "classified_at": datetime.now().isoformat(),
-                    }
-
-                    await RSSPostRepository.mark_as_processed(
-                        link=matching_post.link,
-                        is_event=is_event,
-                        classification_data=classification_data,
-                    )
+                # Update the database
+                is_event = classification.get("is_event", False)
+                classification_data = {
+                    "confidence": classification.get("confidence", 0.0),
+                    "event_details": classification.get("event_details", {}),
+                    "model": openai_settings.model,
+                    "classified_at": classified_at,
+                }
 
-                    # If it's an event, create an entry in the events table
-                    if is_event:
-                        event_details = classification.get("event_details", {})
-
-                        # Extract and parse event date if available
-                        event_date = None
-                        event_date_str = event_details.get("date")
-                        if event_date_str:
-                            try:
-                                # Try to parse the date
-                                event_date = datetime.fromisoformat(
-                                    event_date_str.replace("Z", "+00:00")
-                                )
-                                if event_date.tzinfo is not None:
-                                    event_date = event_date.replace(tzinfo=None)
-                            except (ValueError, AttributeError):
-                                # If parsing fails, leave it as None
-                                pass
-
-                        # Extract title from link (simple extraction)
-                        title = (
-                            matching_post.link.split("/")[-1][:500] if matching_post.link else None
-                        )
+                # Queue the post update and log completion for the bulk write below
+                processed_updates.append((matching_post.link, is_event, classification_data))
+                if log:
+                    log_updates.append(
+                        {
+                            "log_id": log.id,
+                            "status": "completed",
+                            "status_code": status_code,
+                            "response_data": response["body"],
+                            "tokens_used": tokens_used,
+                            "cost_estimate": cost_estimate,
+                        }
+                    )
 
-                        # Create event
-                        event = Event(
-                            post_link=matching_post.link,
-                            title=title,
-                            summary=matching_post.content[:1000] if matching_post.content else None,
-                            event_date=event_date,
-                            event_date_is_approximate=event_date is None or not event_date_str,
-                            location=event_details.get("location"),
-                            event_type=event_details.get("type"),
-                            confidence=Decimal(str(classification.get("confidence", 0.0))),
-                            additional_data={
-                                "classification_model": openai_settings.model,
-                                "original_content_length": len(matching_post.content),
-                                "pub_date": matching_post.pub_date.isoformat()
-                                if matching_post.pub_date
-                                else None,
-                            },
-                        )
+                # If it's an event, create an entry in the events table
+                if is_event:
+                    event_details = classification.get("event_details", {})
 
+                    # Extract and parse event date if available
+                    event_date = None
+                    event_date_str = event_details.get("date")
+                    if event_date_str:
                         try:
-                            event_id = await EventRepository.create(event)
-                            print(f"  → Created event #{event_id} in events table")
-                        except Exception as e:
-                            print(f"  ⚠ Failed to create event: {e}")
+                            # Try to parse the date
+                            event_date = datetime.fromisoformat(
+                                event_date_str.replace("Z", "+00:00")
+                            )
+                            if event_date.tzinfo is not None:
+                                event_date = event_date.replace(tzinfo=None)
+                        except (ValueError, AttributeError):
+                            # If parsing fails, leave it as None
+                            pass
+
+                    # Extract title from link (simple extraction)
+                    title = matching_post.link.split("/")[-1][:500] if matching_post.link else None
+
+                    # Create event
+                    event = Event(
+                        post_link=matching_post.link,
+                        title=title,
+                        summary=matching_post.content[:1000] if matching_post.content else None,
+                        event_date=event_date,
+                        event_date_is_approximate=event_date is None or not event_date_str,
+                        location=event_details.get("location"),
+                        event_type=event_details.get("type"),
+                        confidence=Decimal(str(classification.get("confidence", 0.0))),
+                        additional_data={
+                            "classification_model": openai_settings.model,
+                            "original_content_length": len(matching_post.content),
+                            "pub_date": matching_post.pub_date.isoformat()
+                            if matching_post.pub_date
+                            else None,
+                        },
+                    )
 
-                    # Log the successful response
-                    log = await OpenAIRequestLogRepository.get_by_custom_id(custom_id)
-                    if log:
-                        await OpenAIRequestLogRepository.update_status(
-                            log_id=log.id,
-                            status="completed",
-                            status_code=status_code,
-                            response_data=response["body"],
-                            tokens_used=tokens_used,
-                            cost_estimate=cost_estimate,
-                        )
+                    events_to_create.append(event)
 
-                    stats["success"] += 1
-                    if is_event:
-                        stats["events_found"] += 1
-                        print(f"✓ Event found: {matching_post.link[:80]}")
-                    else:
-                        print(f"○ Not an event: {matching_post.link[:80]}")
+                stats["success"] += 1
+                if is_event:
+                    stats["events_found"] += 1
+                    messages.append(f"✓ Event found: {matching_post.link[:80]}")
+                else:
+                    messages.append(f"○ Not an event: {matching_post.link[:80]}")
 
-                except Exception as e:
-                    stats["failed"] += 1
-                    print(f"Error processing result: {e}")
-
-                    # Try to log the error
-                    try:
-                        custom_id = result.get("custom_id")
-                        if custom_id:
-                            log = await OpenAIRequestLogRepository.get_by_custom_id(custom_id)
-                            if log:
-                                await OpenAIRequestLogRepository.update_status(
-                                    log_id=log.id, status="failed", error_message=str(e)
-                                )
-                    except Exception:
-                        pass
-                    continue
+            except Exception as e:
+                stats["failed"] += 1
+                messages.append(f"Error processing result: {e}")
+
+                # Try to log the error
+                try:
+                    custom_id = result.get("custom_id")
+                    if custom_id:
+                        log = await self._find_log(custom_id, logs_by_custom_id)
+                        if log:
+                            log_updates.append(
+                                {"log_id": log.id, "status": "failed", "error_message": str(e)}
+                            )
+                except Exception:
+                    pass
+                continue
+
+        if messages:
+            print("\n".join(messages))
+
+        # Mark all classified posts and update their logs in one transaction.
+        # Bulk operations should open a transaction explicitly: each statement
+        # run outside one commits (and fsyncs the WAL) on its own.
+        saved = True
+        if processed_updates or log_updates:
+            try:
+                async with db.transaction() as conn:
+                    await RSSPostRepository.mark_many_processed(processed_updates, conn=conn)
+                    await OpenAIRequestLogRepository.update_status_many(log_updates, conn=conn)
+            except Exception as e:
+                saved = False
+                print(f"Failed to save classification results: {e}")
+                stats["success"] -= len(processed_updates)
+                stats["failed"] += len(processed_updates)
+
+        # Events are written separately so a failure here keeps the classifications
+        if saved and events_to_create:
+            try:
+                # events.post_link is not unique, so skip posts that already got
+                # an event (e.g. when a finished batch is completed again)
+                existing = await EventRepository.get_by_post_link_many(
+                    [event.post_link for event in events_to_create]
+                )
+                events_to_create = [
+                    event for event in events_to_create if event.post_link not in existing
+                ]
+                created = await EventRepository.create_many(events_to_create)
+                print(f"  → Created {created} events in events table")
+            except Exception as e:
+                print(f"  ⚠ Failed to create events: {e}")
 
         return stats
 
+    async def run_one_batch(self, posts: List[RSSPost]) -> Dict:
+        """Submit one batch and see it through to processed results.
+
+        Args:
+            posts: List of RSSPost instances to process
+
+        Returns:
+            Dictionary with the batch ID, final status and, once processed,
+            the process_results() statistics
+        """
+        batch_id = await self.submit_batch(posts)
+        result = {"batch_id": batch_id, "status": "submitted"}
+
+        print(f"\nWaiting for batch {batch_id} to complete...")
+        if not await self.wait_for_completion(batch_id):
+            result["status"] = "failed"
+            return result
+
+        results_file = await self.download_results(batch_id)
+        if not results_file:
+            result["status"] = "download_failed"
+            return result
+
+        print(f"\nProcessing results of batch {batch_id} and updating database...")
+        result["stats"] = await self.process_results(results_file, posts, batch_id)
+        result["status"] = "completed"
+        return result
+
     async def wait_for_completion(
         self, batch_id: str, poll_interval: int = 30, max_wait: int = 3600
     ) -> bool:
         """Wait for batch to complete.
 
+        Polls start at up to 10 seconds apart and back off exponentially,
+        with jitter, to at most poll_interval.
+
         Args:
             batch_id: OpenAI batch ID
-            poll_interval: Seconds between status checks
+            poll_interval: Maximum seconds between status checks
             max_wait: Maximum seconds to wait
 
         Returns:
             True if completed successfully, False otherwise
         """
-        start_time = time.time()
+        start_time = time.monotonic()
+        delay = min(10, poll_interval)
 
-        while time.time() - start_time < max_wait:
-            status_info = self.check_batch_status(batch_id)
+        while time.monotonic() - start_time < max_wait:
+            status_info = await self.check_batch_status(batch_id)
             status = status_info["status"]
 
             print(f"Batch {batch_id} status: {status}")
@@ -450,7 +585,8 @@ Is this an event?"""
                 return False
 
             # Still processing
-            time.sleep(poll_interval)
+            await asyncio.sleep(delay + random.uniform(0, 0.1 * delay))
+            delay = min(delay * 2, poll_interval)
 
         print("✗ Timeout waiting for batch completion")
         return False
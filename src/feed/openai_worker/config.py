@@ -20,8 +20,12 @@ class OpenAISettings:
 
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
         self.batch_size = int(os.getenv("OPENAI_BATCH_SIZE", 100))
+        # Posts per OpenAI batch; larger runs are split and submitted concurrently
+        self.shard_size = int(os.getenv("OPENAI_SHARD_SIZE", 10000))
         self.max_tokens = int(os.getenv("OPENAI_MAX_TOKENS", 500))
         self.temperature = float(os.getenv("OPENAI_TEMPERATURE", 0.3))
+        # Days of request logs to keep; 0 keeps them forever
+        self.log_retention_days = int(os.getenv("OPENAI_LOG_RETENTION_DAYS", 0))
 
 
 openai_settings = OpenAISettings()
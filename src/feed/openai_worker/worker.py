@@ -6,7 +6,7 @@ from datetime import datetime
 
 from .batch_processor import BatchProcessor
 from .config import openai_settings
-from ..db.repository import RSSPostRepository
+from ..db.repository import OpenAIRequestLogRepository, RSSPostRepository
 from ..db.session import db
 
 
@@ -44,32 +44,51 @@ class OpenAIWorker:
         print(f"Found {len(posts)} unprocessed posts")
         print("Submitting batch to OpenAI...")
 
-        # Submit batch
-        batch_id = await self.processor.submit_batch(posts)
+        # Split into shards that are submitted and awaited concurrently
+        shard_size = openai_settings.shard_size
+        shards = [posts[i : i + shard_size] for i in range(0, len(posts), shard_size)]
+        submitted_at = datetime.now().isoformat()
 
+        # Let every shard settle: a shard that raises is reported as failed
+        # instead of abandoning the others mid-flight
+        if wait_for_completion:
+            outcomes = await asyncio.gather(
+                *(self.processor.run_one_batch(shard) for shard in shards),
+                return_exceptions=True,
+            )
+        else:
+            outcomes = await asyncio.gather(
+                *(self.processor.submit_batch(shard) for shard in shards),
+                return_exceptions=True,
+            )
+            outcomes = [
+                outcome
+                if isinstance(outcome, BaseException)
+                else {"batch_id": outcome, "status": "submitted"}
+                for outcome in outcomes
+            ]
+
+        batch_results = []
+        for shard_number, outcome in enumerate(outcomes, 1):
+            if isinstance(outcome, BaseException):
+                print(f"Shard {shard_number}/{len(shards)} failed: {outcome!r}")
+                outcome = {"batch_id": None, "status": "failed", "error": str(outcome)}
+            batch_results.append(outcome)
+
+        statuses = {r["status"] for r in batch_results}
+        batch_ids = [r["batch_id"] for r in batch_results if r["batch_id"]]
         result = {
-            "status": "submitted",
+            "status": statuses.pop() if len(statuses) == 1 else "partial",
             "posts_count": len(posts),
-            "batch_id": batch_id,
-            "submitted_at": datetime.now().isoformat(),
+            "batch_id": batch_ids[0] if batch_ids else None,
+            "batch_ids": batch_ids,
+            "shards": batch_results,
+            "submitted_at": submitted_at,
         }
 
-        if wait_for_completion:
-            print("\nWaiting for batch to complete...")
-            success = await self.processor.wait_for_completion(batch_id)
-
-            if success:
-                # Download and process results
-                results_file = self.processor.download_results(batch_id)
-                if results_file:
-                    print("\nProcessing results and updating database...")
-                    stats = await self.processor.process_results(results_file, posts)
-                    result["status"] = "completed"
-                    result["stats"] = stats
-                else:
-                    result["status"] = "download_failed"
-            else:
-                result["status"] = "failed"
+        shard_stats = [r["stats"] for r in batch_results if "stats" in r]
+        if shard_stats:
+            result["stats"] = {key: sum(s[key] for s in shard_stats) for key in shard_stats[0]}
 
         return result
 
@@ -82,7 +101,7 @@ class OpenAIWorker:
         Returns:
             Dictionary with batch status
         """
-        return self.processor.check_batch_status(batch_id)
+        return await self.processor.check_batch_status(batch_id)
 
     async def complete_batch(self, batch_id: str, posts_links: list[str]) -> dict:
         """Download and process results for a completed batch.
@@ -95,19 +114,16 @@ class OpenAIWorker:
             Dictionary with processing statistics
         """
         # Download results
-        results_file = self.processor.download_results(batch_id)
+        results_file = await self.processor.download_results(batch_id)
         if not results_file:
             return {"status": "not_ready"}
 
-        # Get posts from database
-        posts = []
-        for link in posts_links:
-            post = await RSSPostRepository.get_by_link(link)
-            if post:
-                posts.append(post)
+        # Get posts from database in one query, keeping the batch order
+        found = await RSSPostRepository.get_by_link_many(posts_links)
+        posts = [found[link] for link in posts_links if link in found]
 
         # Process results
-        stats = await self.processor.process_results(results_file, posts)
+        stats = await self.processor.process_results(results_file, posts, batch_id)
         return {"status": "completed", "stats": stats}
 
     async def run(self):
@@ -127,6 +143,19 @@ class OpenAIWorker:
             await db.connect()
 
         try:
+            # Keep monthly log partitions ahead of this run's inserts and
+            # drop expired logs when a retention period is configured
+            if openai_settings.log_retention_days > 0:
+                deleted = await OpenAIRequestLogRepository.delete_old_logs(
+                    days=openai_settings.log_retention_days
+                )
+                print(
+                    f"Deleted {deleted} request logs older than "
+                    f"{openai_settings.log_retention_days} days"
+                )
+            else:
+                await OpenAIRequestLogRepository.ensure_partitions()
+
             result = await self.process_unprocessed_posts(wait_for_completion=True)
 
             print("\n" + "=" * 80)
@@ -134,8 +163,11 @@ class OpenAIWorker:
             print("=" * 80)
             print(f"Status: {result['status']}")
             print(f"Posts processed: {result['posts_count']}")
-            if result.get("batch_id"):
-                print(f"Batch ID: {result['batch_id']}")
+            if result.get("batch_ids"):
+                print(f"Batch ID: {', '.join(result['batch_ids'])}")
+            if len(result.get("shards", [])) > 1:
+                for shard_number, shard in enumerate(result["shards"], 1):
+                    print(f"Shard {shard_number}: {shard['status']} ({shard['batch_id']})")
             if result.get("stats"):
                 stats = result["stats"]
                 print("\nResults:")
@@ -146,8 +178,9 @@ class OpenAIWorker:
             print("=" * 80)
 
         finally:
-            # Close database connection
+            # Close database connection once batched writes are flushed
             if db.pool:
+                await RSSPostRepository.flush_pending()
                 await db.disconnect()
 
 
@@ -6,11 +6,11 @@ Run with:
     python -m src.pipeline --help             # Show help
 """
 
-import asyncio
 import argparse
 import sys
 import logging
 
+from common.utils import event_loop
 from .orchestrator import PipelineOrchestrator
 from .config import PipelineConfig
 
@@ -127,34 +127,33 @@ Environment Variables:
 
 def create_config(args) -> PipelineConfig:
     """Create config from command line arguments."""
-    config = PipelineConfig()
+    overrides = {}
 
     # Override with command line args if provided
     if args.interval is not None:
-        config.run_interval_minutes = args.interval
+        overrides["run_interval_minutes"] = args.interval
 
     if args.schedule:
-        config.schedule_enabled = True
+        overrides["schedule_enabled"] = True
 
     if args.skip_rss_reader:
-        config.skip_rss_reader = True
+        overrides["skip_rss_reader"] = True
 
-    if args.skip_summarizer:
-        config.skip_summarizer = True
+    # --skip-summarizer is accepted for compatibility; there is no summarizer agent
 
     if args.skip_digest_publisher:
-        config.skip_digest_publisher = True
+        overrides["skip_digest_publisher"] = True
 
     if args.log_level:
-        config.log_level = args.log_level
+        overrides["log_level"] = args.log_level
 
     if args.max_retries is not None:
-        config.max_retries = args.max_retries
+        overrides["max_retries"] = args.max_retries
 
     if args.retry_delay is not None:
-        config.retry_delay_seconds = args.retry_delay
+        overrides["retry_delay_seconds"] = args.retry_delay
 
-    return config
+    return PipelineConfig(**overrides)
 
 
 async def main():
@@ -194,4 +193,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop.run(main())
@@ -2,34 +2,42 @@
 
 import os
 from dataclasses import dataclass
+from types import MappingProxyType
 
+# Read-only snapshot of the environment, taken once when the module is imported
+_ENV = MappingProxyType(dict(os.environ))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PipelineConfig:
-    """Pipeline configuration settings."""
+    """Pipeline configuration settings.
+
+    Instances are immutable; use ``dataclasses.replace`` to derive an
+    overridden copy. Call ``validate()`` before use.
+    """
 
     # Scheduling
-    run_interval_minutes: int = int(os.getenv("PIPELINE_INTERVAL_MINUTES", "60"))
-    schedule_enabled: bool = os.getenv("PIPELINE_SCHEDULE_ENABLED", "false").lower() == "true"
+    run_interval_minutes: int = int(_ENV.get("PIPELINE_INTERVAL_MINUTES", "60"))
+    schedule_enabled: bool = _ENV.get("PIPELINE_SCHEDULE_ENABLED", "false").lower() == "true"
 
     # Agent timeouts (in seconds)
-    rss_reader_timeout: int = int(os.getenv("RSS_READER_TIMEOUT", "300"))
-    digest_publisher_timeout: int = int(os.getenv("DIGEST_PUBLISHER_TIMEOUT", "120"))
+    rss_reader_timeout: int = int(_ENV.get("RSS_READER_TIMEOUT", "300"))
+    digest_publisher_timeout: int = int(_ENV.get("DIGEST_PUBLISHER_TIMEOUT", "120"))
 
     # Retry settings
-    max_retries: int = int(os.getenv("PIPELINE_MAX_RETRIES", "3"))
-    retry_delay_seconds: int = int(os.getenv("PIPELINE_RETRY_DELAY", "30"))
+    max_retries: int = int(_ENV.get("PIPELINE_MAX_RETRIES", "3"))
+    retry_delay_seconds: int = int(_ENV.get("PIPELINE_RETRY_DELAY", "30"))
 
     # Agent control
-    skip_rss_reader: bool = os.getenv("SKIP_RSS_READER", "false").lower() == "true"
-    skip_digest_publisher: bool = os.getenv("SKIP_DIGEST_PUBLISHER", "false").lower() == "true"
+    skip_rss_reader: bool = _ENV.get("SKIP_RSS_READER", "false").lower() == "true"
+    skip_digest_publisher: bool = _ENV.get("SKIP_DIGEST_PUBLISHER", "false").lower() == "true"
 
     # Logging
-    log_level: str = os.getenv("PIPELINE_LOG_LEVEL", "INFO")
+    log_level: str = _ENV.get("PIPELINE_LOG_LEVEL", "INFO")
 
     # Database
-    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "10"))
-    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    db_pool_size: int = int(_ENV.get("DB_POOL_SIZE", "10"))
+    db_max_overflow: int = int(_ENV.get("DB_MAX_OVERFLOW", "20"))
 
     def validate(self) -> None:
         """Validate configuration values."""
@@ -45,7 +53,3 @@ class PipelineConfig:
         valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         if self.log_level.upper() not in valid_log_levels:
             raise ValueError(f"log_level must be one of {valid_log_levels}")
-
-    def __post_init__(self):
-        """Validate config after initialization."""
-        self.validate()
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import sys
+import time
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from enum import Enum
@@ -20,6 +21,14 @@ class AgentStatus(Enum):
     SKIPPED = "skipped"
 
 
+# Summary icon for each final agent status
+_STATUS_ICON = {
+    AgentStatus.SUCCESS: "✅",
+    AgentStatus.FAILED: "❌",
+    AgentStatus.SKIPPED: "⏭️",
+}
+
+
 class AgentResult:
     """Result from an agent execution."""
 
@@ -55,6 +64,14 @@ class PipelineOrchestrator:
         self.logger = self._setup_logger()
         self.results: List[AgentResult] = []
 
+        # Resolve agent entry points up front, so their import time is not
+        # counted in the first run's agent durations
+        from rss_reader.__main__ import main as rss_reader_main
+        from digest_publisher.__main__ import main as publisher_main
+
+        self._rss_reader_main = rss_reader_main
+        self._publisher_main = publisher_main
+
     def _setup_logger(self) -> logging.Logger:
         """Setup logger with configured log level."""
         logger = logging.getLogger("pipeline")
@@ -86,62 +103,47 @@ class PipelineOrchestrator:
             return AgentResult(agent_name, AgentStatus.SKIPPED)
 
         self.logger.info(f"🚀 Starting {agent_name}")
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.monotonic()
 
         for attempt in range(self.config.max_retries + 1):
             try:
                 result = await agent_func()
-                duration = asyncio.get_event_loop().time() - start_time
-
-                self.logger.info(f"✅ {agent_name} completed in {duration:.2f}s")
-                return AgentResult(
-                    agent_name, AgentStatus.SUCCESS, duration=duration, metadata=result
-                )
-
-            except asyncio.TimeoutError:
-                error_msg = f"{agent_name} timed out"
-                self.logger.error(f"⏱️  {error_msg}")
-
-                if attempt < self.config.max_retries:
-                    self.logger.info(
-                        f"🔄 Retrying {agent_name} (attempt {attempt + 2}/{self.config.max_retries + 1})"
-                    )
-                    await asyncio.sleep(self.config.retry_delay_seconds)
-                else:
-                    duration = asyncio.get_event_loop().time() - start_time
-                    return AgentResult(
-                        agent_name, AgentStatus.FAILED, duration=duration, error=error_msg
-                    )
-
             except Exception as e:
-                error_msg = f"{agent_name} failed: {str(e)}"
-                self.logger.error(f"❌ {error_msg}", exc_info=True)
-
-                if attempt < self.config.max_retries:
-                    self.logger.info(
-                        f"🔄 Retrying {agent_name} (attempt {attempt + 2}/{self.config.max_retries + 1})"
-                    )
-                    await asyncio.sleep(self.config.retry_delay_seconds)
+                if isinstance(e, asyncio.TimeoutError):
+                    error_msg = f"{agent_name} timed out"
+                    self.logger.error(f"⏱️  {error_msg}")
                 else:
-                    duration = asyncio.get_event_loop().time() - start_time
+                    error_msg = f"{agent_name} failed: {str(e)}"
+                    self.logger.error(f"❌ {error_msg}", exc_info=True)
+
+                # No point waiting after the final attempt
+                if attempt == self.config.max_retries:
+                    duration = time.monotonic() - start_time
                     return AgentResult(
                         agent_name, AgentStatus.FAILED, duration=duration, error=error_msg
                     )
 
+                self.logger.info(
+                    f"🔄 Retrying {agent_name} (attempt {attempt + 2}/{self.config.max_retries + 1})"
+                )
+                await asyncio.sleep(self.config.retry_delay_seconds)
+            else:
+                duration = time.monotonic() - start_time
+                self.logger.info(f"✅ {agent_name} completed in {duration:.2f}s")
+                return AgentResult(
+                    agent_name, AgentStatus.SUCCESS, duration=duration, metadata=result
+                )
+
     async def _run_rss_reader(self) -> Dict[str, Any]:
         """Run the RSS Reader agent."""
-        from rss_reader.__main__ import main as rss_reader_main
-
         async with asyncio.timeout(self.config.rss_reader_timeout):
-            result = await rss_reader_main()
+            result = await self._rss_reader_main()
             return {"posts_saved": result.get("saved_count", 0)} if result else {}
 
     async def _run_digest_publisher(self) -> Dict[str, Any]:
         """Run the Digest Publisher agent."""
-        from digest_publisher.__main__ import main as publisher_main
-
         async with asyncio.timeout(self.config.digest_publisher_timeout):
-            result = await publisher_main()
+            result = await self._publisher_main()
             return {"digests_published": result.get("published_count", 0)} if result else {}
 
     async def run_pipeline(self) -> List[AgentResult]:
@@ -154,14 +156,23 @@ class PipelineOrchestrator:
         self.logger.info("🎬 Starting Pipeline Execution")
         self.logger.info("=" * 80)
 
+        # Run new tasks eagerly up to their first suspension; agents that finish
+        # without blocking then skip a trip through the event loop
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
         # Import db here to avoid circular imports
         from common.db.session import db
 
-        # Connect to database once for all agents
-        await db.connect()
+        # Connect to database once for all agents; they reuse this pool.
+        # db_pool_size connections stay open and up to db_max_overflow more
+        # are opened under load.
+        await db.connect(
+            min_size=self.config.db_pool_size,
+            max_size=self.config.db_pool_size + self.config.db_max_overflow,
+        )
         self.logger.info("📊 Connected to database")
 
-        pipeline_start = asyncio.get_event_loop().time()
+        pipeline_start = time.monotonic()
         self.results = []
 
         # Agent 1: RSS Reader
@@ -182,7 +193,7 @@ class PipelineOrchestrator:
         self.results.append(result)
 
         # Summary
-        pipeline_duration = asyncio.get_event_loop().time() - pipeline_start
+        pipeline_duration = time.monotonic() - pipeline_start
         self._print_summary(pipeline_duration)
 
         # Disconnect from database
@@ -199,12 +210,12 @@ class PipelineOrchestrator:
         self.logger.info("📊 Pipeline Execution Summary")
         self.logger.info("=" * 80)
 
+        counts = {AgentStatus.SUCCESS: 0, AgentStatus.FAILED: 0, AgentStatus.SKIPPED: 0}
         for result in self.results:
-            status_icon = {
-                AgentStatus.SUCCESS: "✅",
-                AgentStatus.FAILED: "❌",
-                AgentStatus.SKIPPED: "⏭️",
-            }.get(result.status, "❓")
+            if result.status in counts:
+                counts[result.status] += 1
+
+            status_icon = _STATUS_ICON.get(result.status, "❓")
 
             duration_str = f"{result.duration:.2f}s" if result.duration else "N/A"
             self.logger.info(f"{status_icon} {result.agent_name:20} | {duration_str:>10}")
@@ -219,12 +230,9 @@ class PipelineOrchestrator:
         self.logger.info("-" * 80)
         self.logger.info(f"Total Duration: {duration:.2f}s")
 
-        success_count = sum(1 for r in self.results if r.status == AgentStatus.SUCCESS)
-        failed_count = sum(1 for r in self.results if r.status == AgentStatus.FAILED)
-        skipped_count = sum(1 for r in self.results if r.status == AgentStatus.SKIPPED)
-
         self.logger.info(
-            f"Results: {success_count} succeeded, {failed_count} failed, {skipped_count} skipped"
+            f"Results: {counts[AgentStatus.SUCCESS]} succeeded, "
+            f"{counts[AgentStatus.FAILED]} failed, {counts[AgentStatus.SKIPPED]} skipped"
         )
         self.logger.info("=" * 80)
 
@@ -234,11 +242,15 @@ class PipelineOrchestrator:
             f"📅 Starting scheduled pipeline (interval: {self.config.run_interval_minutes}m)"
         )
 
+        loop = asyncio.get_running_loop()
+        interval = self.config.run_interval_minutes * 60
+        # Runs are spaced from the start of the previous run, not its end
+        next_run = loop.time()
+
         while True:
+            next_run += interval
             try:
                 await self.run_pipeline()
-                self.logger.info(f"⏰ Next run in {self.config.run_interval_minutes} minutes")
-                await asyncio.sleep(self.config.run_interval_minutes * 60)
 
             except KeyboardInterrupt:
                 self.logger.info("⏹️  Stopping scheduled pipeline")
@@ -246,5 +258,10 @@ class PipelineOrchestrator:
 
             except Exception as e:
                 self.logger.error(f"💥 Unexpected error in scheduled pipeline: {e}", exc_info=True)
-                self.logger.info(f"⏰ Retrying in {self.config.run_interval_minutes} minutes")
-                await asyncio.sleep(self.config.run_interval_minutes * 60)
+
+            # Skip slots missed while an overlong run was still going
+            now = loop.time()
+            if next_run < now:
+                next_run += (now - next_run) // interval * interval + interval
+            self.logger.info(f"⏰ Next run in {(next_run - now) / 60:.1f} minutes")
+            await asyncio.sleep(next_run - now)
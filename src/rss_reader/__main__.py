@@ -5,13 +5,15 @@ Run with: python -m src.rss_reader
 
 import asyncio
 import logging
-import json
+import os
+import orjson
 from typing import Tuple
 
 from common.db.session import db
 from common.db.repository import RSSPostRepository, TelegramChannelRepository
 from common.db.models import RSSPost, TelegramChannel
 from common.utils.rss_bridge import build_rss_bridge_url
+from common.utils import event_loop
 from .core.parser import RSSParser
 
 logging.basicConfig(
@@ -19,6 +21,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Channels processed at once; keep within the DB pool (20) and the feed
+# fetcher's connection pool (32)
+CHANNEL_CONCURRENCY = int(os.getenv("RSS_CONCURRENCY", "16"))
+
 
 async def process_channel(
     channel: TelegramChannel, parser: RSSParser
@@ -43,13 +49,17 @@ async def process_channel(
         rss_url = build_rss_bridge_url(channel.channel_name)
         logger.info(f"Processing channel: {channel.channel_name} ({rss_url})")
 
-        # Parse the RSS feed
-        feed = parser.parse_url(rss_url)
+        # Parse the RSS feed in a thread so other channels can proceed meanwhile
+        feed = await asyncio.to_thread(parser.parse_url, rss_url)
         logger.info(
             f"✓ Channel: {channel.channel_name} - Feed: {feed.title} - Items: {len(feed.items)}"
         )
 
-        # Save items to database
+        # Look up which items are already stored in one query
+        existing = await RSSPostRepository.filter_existing([item.link for item in feed.items])
+
+        # Collect new items, then save them in one batch
+        new_posts = {}
         for item in feed.items:
             try:
                 # Skip if content is empty
@@ -58,31 +68,33 @@ async def process_channel(
                     empty_count += 1
                     continue
 
-                # Check if item already exists
-                existing = await RSSPostRepository.get_by_link(item.link)
-                if existing:
+                # Check if item already exists (in the database or earlier in this feed)
+                if item.link in new_posts or item.link in existing:
                     logger.debug(f"Skipping existing item: {item.link}")
                     skipped_count += 1
                     continue
 
                 # Convert RSSItem to RSSPost
-                media_json = json.dumps(item.media_urls) if item.media_urls else None
-                post = RSSPost(
+                media_json = orjson.dumps(item.media_urls).decode() if item.media_urls else None
+                new_posts[item.link] = RSSPost(
                     link=item.link,
                     content=item.description,
                     pub_date=item.pub_date,
                     media=media_json,
                 )
 
-                # Save to database
-                await RSSPostRepository.create(post)
-                saved_count += 1
-                logger.debug(f"Saved: {item.link}")
-
             except Exception as e:
-                logger.error(f"Failed to save item {item.link}: {e}")
+                logger.error(f"Failed to prepare item {item.link}: {e}")
                 error_count += 1
 
+        # Save to database
+        try:
+            saved_count = await RSSPostRepository.create_many(list(new_posts.values()))
+            logger.debug(f"Saved {saved_count} items for {channel.channel_name}")
+        except Exception as e:
+            logger.error(f"Failed to save items for {channel.channel_name}: {e}")
+            error_count += len(new_posts)
+
     except Exception as e:
         logger.error(f"Failed to process channel {channel.channel_name}: {e}", exc_info=True)
         error_count += 1
@@ -113,8 +125,14 @@ async def main():
         # Create parser instance
         parser = RSSParser()
 
-        # Process all channels in parallel
-        tasks = [process_channel(channel, parser) for channel in channels]
+        # Process channels in parallel, at most CHANNEL_CONCURRENCY at a time
+        semaphore = asyncio.Semaphore(CHANNEL_CONCURRENCY)
+
+        async def process_bounded(channel: TelegramChannel):
+            async with semaphore:
+                return await process_channel(channel, parser)
+
+        tasks = [process_bounded(channel) for channel in channels]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Calculate totals and display summary
@@ -123,9 +141,8 @@ async def main():
         total_empty = 0
         total_errors = 0
 
-        print("\n" + "=" * 80)
-        print("SUMMARY BY CHANNEL")
-        print("=" * 80)
+        # Build the summary and write it in one go
+        lines = ["\n" + "=" * 80, "SUMMARY BY CHANNEL", "=" * 80]
 
         for result in results:
             if isinstance(result, Exception):
@@ -139,25 +156,26 @@ async def main():
             total_empty += empty
             total_errors += errors
 
-            print(f"\n{channel_name}:")
-            print(f"  ✓ Saved: {saved}")
-            print(f"  ⊘ Skipped (already exists): {skipped}")
+            lines.append(f"\n{channel_name}:")
+            lines.append(f"  ✓ Saved: {saved}")
+            lines.append(f"  ⊘ Skipped (already exists): {skipped}")
             if empty > 0:
-                print(f"  ⊘ Skipped (empty content): {empty}")
+                lines.append(f"  ⊘ Skipped (empty content): {empty}")
             if errors > 0:
-                print(f"  ✗ Errors: {errors}")
+                lines.append(f"  ✗ Errors: {errors}")
 
-        print("\n" + "=" * 80)
-        print("OVERALL TOTALS")
-        print("=" * 80)
-        print(f"✓ Total Saved: {total_saved}")
-        print(f"⊘ Total Skipped (already exists): {total_skipped}")
+        lines.append("\n" + "=" * 80)
+        lines.append("OVERALL TOTALS")
+        lines.append("=" * 80)
+        lines.append(f"✓ Total Saved: {total_saved}")
+        lines.append(f"⊘ Total Skipped (already exists): {total_skipped}")
         if total_empty > 0:
-            print(f"⊘ Total Skipped (empty content): {total_empty}")
+            lines.append(f"⊘ Total Skipped (empty content): {total_empty}")
         if total_errors > 0:
-            print(f"✗ Total Errors: {total_errors}")
-        print(f"📡 Channels Processed: {len(channels)}")
-        print("=" * 80)
+            lines.append(f"✗ Total Errors: {total_errors}")
+        lines.append(f"📡 Channels Processed: {len(channels)}")
+        lines.append("=" * 80)
+        print("\n".join(lines))
 
         logger.info("RSS Reader service completed successfully")
 
@@ -170,4 +188,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop.run(main())
@@ -1,5 +1,7 @@
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from typing import Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -7,11 +9,17 @@ logger = logging.getLogger(__name__)
 class FeedFetcher:
     """Handles HTTP requests for RSS feeds."""
 
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, max_connections: int = 32):
         self.timeout = timeout
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "RSS-Parser/1.0"})
 
+        # Feeds are fetched from worker threads and mostly share one host (the
+        # RSS bridge); the default pool keeps only 10 connections per host
+        adapter = HTTPAdapter(pool_maxsize=max_connections)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def fetch(self, url: str) -> str:
         if not url:
             raise ValueError("URL cannot be empty")
@@ -29,3 +37,18 @@ class FeedFetcher:
         response = self.session.get(url, timeout=self.timeout)
         response.raise_for_status()
         return response.text
+
+    def stream(self, url: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Stream the raw response body in chunks, without decoding it to text."""
+        if not url:
+            raise ValueError("URL cannot be empty")
+
+        logger.info(f"Streaming RSS feed from {url}")
+
+        try:
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                yield from response.iter_content(chunk_size=chunk_size)
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch URL {url}: {e}")
+            raise
@@ -1,13 +1,20 @@
 import logging
 from xml.etree import ElementTree as ET
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Union
+
+try:
+    from lxml import etree as LET
+except ImportError:
+    LET = None
 
 from common.models.feed import RSSChannel, RSSItem
-from common.utils.html import clean_content, extract_media_urls
+from common.utils.html import clean_and_extract
 from .fetcher import FeedFetcher
 
 logger = logging.getLogger(__name__)
 
+_XML_SYNTAX_ERRORS = (ET.ParseError, LET.XMLSyntaxError) if LET is not None else (ET.ParseError,)
+
 
 class RSSParser:
     """Production-grade RSS parser with error handling."""
@@ -19,6 +26,22 @@ class RSSParser:
         "dc": "http://purl.org/dc/elements/1.1/",
     }
 
+    # Qualified tag names, built once instead of per element
+    _ATOM_ENTRY = f"{{{NAMESPACES['atom']}}}entry"
+    _ATOM_TITLE = f"{{{NAMESPACES['atom']}}}title"
+    _ATOM_LINK = f"{{{NAMESPACES['atom']}}}link"
+    _ATOM_SUBTITLE = f"{{{NAMESPACES['atom']}}}subtitle"
+    _ATOM_UPDATED = f"{{{NAMESPACES['atom']}}}updated"
+    _ATOM_CONTENT = f"{{{NAMESPACES['atom']}}}content"
+    _ATOM_SUMMARY = f"{{{NAMESPACES['atom']}}}summary"
+    _ATOM_PUBLISHED = f"{{{NAMESPACES['atom']}}}published"
+    _CONTENT_ENCODED = f"{{{NAMESPACES['content']}}}encoded"
+    _MEDIA_CONTENT = f"{{{NAMESPACES['media']}}}content"
+
+    # Child tags read from each item/entry in a single pass over its children
+    _RSS_ITEM_TAGS = frozenset(("link", "description", "pubDate", _CONTENT_ENCODED))
+    _ATOM_ENTRY_TAGS = frozenset((_ATOM_CONTENT, _ATOM_SUMMARY, _ATOM_PUBLISHED))
+
     def __init__(self, timeout: int = 10):
         """
         Initialize RSS parser.
@@ -43,39 +66,106 @@ class RSSParser:
             requests.RequestException: If HTTP request fails
         """
         try:
-            content = self.fetcher.fetch(url)
-            return self.parse_content(content)
+            return self.parse_stream(self.fetcher.stream(url))
         except Exception as e:
             logger.error(f"Failed to parse feed from {url}: {e}")
             raise ValueError(f"Failed to parse RSS feed: {e}")
 
-    def parse_content(self, xml_content: str) -> RSSChannel:
+    def parse_content(self, xml_content: Union[str, bytes]) -> RSSChannel:
         """
         Parse RSS feed from XML string.
 
         Args:
-            xml_content: XML content as string
+            xml_content: XML content as string, or raw bytes decoded according
+                to the document's declared encoding
 
         Returns:
             RSSChannel with parsed feed data
         """
-        try:
-            root = ET.fromstring(xml_content)
-            logger.info("Successfully parsed XML content")
+        if isinstance(xml_content, bytes):
+            return self.parse_stream((xml_content,))
+
+        # Pull-parse the text like a stream so only one item's subtree is
+        # alive at a time. The text is already decoded, so the declared
+        # encoding is ignored: libxml2 is handed UTF-8 bytes (faster than a
+        # str) and the stdlib parser takes the str as is.
+        if LET is None:
+            return self._parse_elements(self._iter_elements((xml_content,)))
+        chunks = (xml_content.encode("utf-8"),)
+        return self._parse_elements(self._iter_elements(chunks, encoding="utf-8"))
+
+    def parse_stream(self, chunks: Iterable[bytes]) -> RSSChannel:
+        """
+        Parse RSS feed incrementally from raw XML bytes.
+
+        Items are built as soon as their closing tag is read and their elements
+        are cleared afterwards, so the full document is never held in memory.
+        The bytes are decoded according to the document's declared encoding.
 
-            if root.tag.endswith("rss"):
-                return self._parse_rss(root)
-            elif root.tag.endswith("feed"):
-                return self._parse_atom(root)
-            else:
-                raise ValueError(f"Unknown feed format: {root.tag}")
+        Args:
+            chunks: Iterable of XML byte chunks, e.g. an HTTP response body
 
-        except ET.ParseError as e:
+        Returns:
+            RSSChannel with parsed feed data
+        """
+        return self._parse_elements(self._iter_elements(chunks))
+
+    def _parse_elements(self, elements: Iterator[ET.Element]) -> RSSChannel:
+        """Build a feed from pull-parsed elements, clearing each item once read."""
+        items: List[RSSItem] = []
+        root = None
+        try:
+            for elem in elements:
+                if elem.tag == "item":
+                    items.append(self._parse_rss_item(elem))
+                    elem.clear()
+                elif elem.tag == self._ATOM_ENTRY:
+                    items.append(self._parse_atom_entry(elem))
+                    elem.clear()
+                # The document element is the last one to close
+                root = elem
+        except _XML_SYNTAX_ERRORS as e:
             logger.error(f"XML parsing error: {e}")
             raise ValueError(f"Invalid XML format: {e}")
 
-    def _parse_rss(self, root: ET.Element) -> RSSChannel:
-        """Parse RSS 2.0 format."""
+        if root is None:
+            raise ValueError("Invalid XML format: empty document")
+        logger.info("Successfully parsed XML content")
+
+        if root.tag.endswith("rss"):
+            return self._parse_rss(root, items)
+        elif root.tag.endswith("feed"):
+            return self._parse_atom(root, items)
+        else:
+            raise ValueError(f"Unknown feed format: {root.tag}")
+
+    @staticmethod
+    def _iter_elements(
+        chunks: Iterable[Union[bytes, str]], encoding: Optional[str] = None
+    ) -> Iterator[ET.Element]:
+        """Yield elements from XML chunks as their closing tags are read.
+
+        Args:
+            chunks: XML byte chunks, or str chunks for the stdlib parser
+            encoding: Encoding to use instead of the declared one (lxml only)
+        """
+        if LET is None:
+            parser = ET.XMLPullParser(events=("end",))
+        else:
+            parser = LET.XMLPullParser(
+                events=("end",), encoding=encoding, resolve_entities=False, no_network=True
+            )
+
+        for chunk in chunks:
+            parser.feed(chunk)
+            for _, elem in parser.read_events():
+                yield elem
+        parser.close()
+        for _, elem in parser.read_events():
+            yield elem
+
+    def _parse_rss(self, root: ET.Element, items: Optional[List[RSSItem]] = None) -> RSSChannel:
+        """Parse RSS 2.0 format, reusing already parsed items if given."""
         channel = root.find("channel")
         if channel is None:
             raise ValueError("Invalid RSS: no channel element found")
@@ -88,78 +178,86 @@ class RSSParser:
             last_build_date=self._get_text(channel, "lastBuildDate"),
         )
 
-        for item_elem in channel.findall("item"):
-            item = self._parse_rss_item(item_elem)
-            feed.items.append(item)
+        if items is not None:
+            feed.items.extend(items)
+        else:
+            for item_elem in channel.findall("item"):
+                item = self._parse_rss_item(item_elem)
+                feed.items.append(item)
 
         logger.info(f"Parsed RSS feed: {feed.title} with {len(feed.items)} items")
         return feed
 
-    def _parse_atom(self, root: ET.Element) -> RSSChannel:
-        """Parse Atom format."""
-        ns = self.NAMESPACES["atom"]
-
+    def _parse_atom(self, root: ET.Element, items: Optional[List[RSSItem]] = None) -> RSSChannel:
+        """Parse Atom format, reusing already parsed entries if given."""
         feed = RSSChannel(
-            title=self._get_text(root, f"{{{ns}}}title", "Unknown Feed"),
-            link=self._get_attr(root.find(f"{{{ns}}}link"), "href", ""),
-            description=self._get_text(root, f"{{{ns}}}subtitle", ""),
-            last_build_date=self._get_text(root, f"{{{ns}}}updated"),
+            title=self._get_text(root, self._ATOM_TITLE, "Unknown Feed"),
+            link=self._get_attr(root.find(self._ATOM_LINK), "href", ""),
+            description=self._get_text(root, self._ATOM_SUBTITLE, ""),
+            last_build_date=self._get_text(root, self._ATOM_UPDATED),
         )
 
-        for entry in root.findall(f"{{{ns}}}entry"):
-            item = self._parse_atom_entry(entry)
-            feed.items.append(item)
+        if items is not None:
+            feed.items.extend(items)
+        else:
+            for entry in root.findall(self._ATOM_ENTRY):
+                item = self._parse_atom_entry(entry)
+                feed.items.append(item)
 
         logger.info(f"Parsed Atom feed: {feed.title} with {len(feed.items)} items")
         return feed
 
     def _parse_rss_item(self, item_elem: ET.Element) -> RSSItem:
         """Parse individual RSS item."""
-        description = self._get_text(item_elem, "description", "")
-        content_encoded = self._get_text_with_ns(item_elem, "content", "encoded")
-        if content_encoded:
-            description = content_encoded
-
-        # Extract media URLs
+        # Walk the children once instead of searching them per field; the
+        # first occurrence of a tag wins, as with find()
+        texts = {}
         media_urls = []
-
-        # 1. Extract from media:content tags (namespace support)
-        media_ns = self.NAMESPACES.get("media", "")
-        if media_ns:
-            for media_elem in item_elem.findall(f"{{{media_ns}}}content"):
-                media_url = media_elem.get("url", "")
+        for child in item_elem:
+            tag = child.tag
+            if tag == self._MEDIA_CONTENT:
+                # 1. Extract from media:content tags (namespace support)
+                media_url = child.get("url", "")
                 if media_url:
                     media_urls.append(media_url)
+            elif tag in self._RSS_ITEM_TAGS and tag not in texts:
+                texts[tag] = child.text or ""
+
+        description = texts.get(self._CONTENT_ENCODED) or texts.get("description", "")
 
         # 2. Extract from HTML description (img src and video poster)
-        media_urls.extend(extract_media_urls(description))
+        text, description_media_urls = clean_and_extract(description)
+        media_urls.extend(description_media_urls)
 
         return RSSItem(
-            link=self._get_text(item_elem, "link", ""),
-            description=clean_content(description),
-            pub_date=self._get_text(item_elem, "pubDate"),
+            link=texts.get("link", ""),
+            description=text,
+            pub_date=texts.get("pubDate", ""),
             media_urls=media_urls,
         )
 
     def _parse_atom_entry(self, entry: ET.Element) -> RSSItem:
         """Parse individual Atom entry."""
-        ns = self.NAMESPACES["atom"]
-
-        link_elem = entry.find(f"{{{ns}}}link")
-        link = self._get_attr(link_elem, "href", "") if link_elem is not None else ""
-
-        content = self._get_text(entry, f"{{{ns}}}content", "")
-        if not content:
-            content = self._get_text(entry, f"{{{ns}}}summary", "")
+        link = None
+        texts = {}
+        for child in entry:
+            tag = child.tag
+            if tag == self._ATOM_LINK:
+                if link is None:
+                    link = child.get("href", "")
+            elif tag in self._ATOM_ENTRY_TAGS and tag not in texts:
+                texts[tag] = child.text or ""
+
+        content = texts.get(self._ATOM_CONTENT) or texts.get(self._ATOM_SUMMARY, "")
 
         # Extract media URLs from content
-        media_urls = extract_media_urls(content)
+        text, media_urls = clean_and_extract(content)
 
         return RSSItem(
-            link=link,
-            description=clean_content(content),
-            pub_date=self._get_text(entry, f"{{{ns}}}published"),
-            media_urls=media_urls,
+            link=link or "",
+            description=text,
+            pub_date=texts.get(self._ATOM_PUBLISHED, ""),
+            media_urls=list(media_urls),
         )
 
     @staticmethod
@@ -170,16 +268,6 @@ class RSSParser:
         child = elem.find(tag)
         return child.text or default if child is not None else default
 
-    def _get_text_with_ns(
-        self, elem: Optional[ET.Element], ns_key: str, tag: str, default: str = ""
-    ) -> str:
-        """Get text with namespace support."""
-        if elem is None:
-            return default
-        ns = self.NAMESPACES.get(ns_key, "")
-        child = elem.find(f"{{{ns}}}{tag}") if ns else elem.find(tag)
-        return child.text or default if child is not None else default
-
     @staticmethod
     def _get_attr(elem: Optional[ET.Element], attr: str, default: str = "") -> str:
         """Safely get attribute from element."""
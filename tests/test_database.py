@@ -2,29 +2,47 @@
 
 import pytest
 import pytest_asyncio
-from datetime import datetime
-from src.feed.db import db, RSSPost, RSSPostRepository
+from contextlib import asynccontextmanager
+from src.feed.db import RSSPost, RSSPostRepository
 
 
-@pytest_asyncio.fixture(autouse=True)
-async def setup_database():
-    """Set up database connection and clean for each test."""
-    # Create a new connection pool for each test to avoid event loop issues
-    if db.pool is not None:
-        await db.disconnect()
+# Run every test on the session loop so they can share the session-scoped pool
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-    await db.connect()
 
-    # Clean database before test
-    await db.execute("TRUNCATE TABLE rss_posts RESTART IDENTITY CASCADE")
+class _PinnedPool:
+    """Pool stand-in that hands out the same connection on every acquire()."""
 
-    yield
+    def __init__(self, conn):
+        self._conn = conn
 
-    # Disconnect after each test
-    await db.disconnect()
+    @asynccontextmanager
+    async def acquire(self):
+        yield self._conn
+
+
+@pytest_asyncio.fixture(autouse=True, loop_scope="session")
+async def setup_database(db_pool, monkeypatch):
+    """Run each test inside a transaction that is rolled back afterwards."""
+    async with db_pool.pool.acquire() as conn:
+        tx = conn.transaction()
+        await tx.start()
+        # The tests share the main database and count rows, so start each one
+        # from an empty table. TRUNCATE is transactional and is undone by the
+        # rollback below; its trigger also zeroes the rss_post_stats counters.
+        # No CASCADE: a table referencing rss_posts should fail loudly here
+        # rather than be emptied along with it
+        await conn.execute("TRUNCATE TABLE rss_posts RESTART IDENTITY")
+        # Route every repository call through the pinned connection so the
+        # whole test sees (and discards) its own uncommitted writes
+        monkeypatch.setattr(db_pool, "pool", _PinnedPool(conn))
+        try:
+            yield
+        finally:
+            monkeypatch.undo()
+            await tx.rollback()
 
 
-@pytest.mark.asyncio
 async def test_create_post():
     """Test creating a new post."""
     post = RSSPost(
@@ -38,7 +56,14 @@ async def test_create_post():
     assert link == post.link
 
 
-@pytest.mark.asyncio
+async def test_create_duplicate_post():
+    """Test that creating a post with an existing link is skipped."""
+    post = RSSPost(link="https://example.com/test-dup", content="Test post content")
+
+    assert await RSSPostRepository.create(post) == post.link
+    assert await RSSPostRepository.create(post) is None
+
+
 async def test_create_post_with_media():
     """Test creating a post with media URLs."""
     post = RSSPost(
@@ -54,7 +79,31 @@ async def test_create_post_with_media():
     assert retrieved.media == post.media
 
 
-@pytest.mark.asyncio
+async def test_create_many():
+    """Test creating posts in bulk via executemany and COPY."""
+    small = [RSSPost(link=f"https://example.com/small-{i}", content="Test") for i in range(3)]
+    large = [RSSPost(link=f"https://example.com/large-{i}", content="Test") for i in range(120)]
+
+    assert await RSSPostRepository.create_many(small) == 3
+    assert await RSSPostRepository.create_many(large) == 120
+    assert await RSSPostRepository.create_many([]) == 0
+
+    retrieved = await RSSPostRepository.get_by_link("https://example.com/large-7")
+    assert retrieved is not None
+    assert retrieved.is_processed is False
+
+
+async def test_create_many_counts_only_inserted_rows():
+    """Test that links already stored are skipped and not counted."""
+    small = [RSSPost(link=f"https://example.com/small-{i}", content="Test") for i in range(3)]
+    large = [RSSPost(link=f"https://example.com/large-{i}", content="Test") for i in range(120)]
+    await RSSPostRepository.create_many(small[:1] + large[:20])
+
+    assert await RSSPostRepository.create_many(small) == 2
+    assert await RSSPostRepository.create_many(large) == 100
+    assert await RSSPostRepository.create_many(small + large) == 0
+
+
 async def test_get_by_link():
     """Test retrieving a post by link."""
     post = RSSPost(
@@ -71,14 +120,26 @@ async def test_get_by_link():
     assert retrieved.content == post.content
 
 
-@pytest.mark.asyncio
+async def test_get_by_link_many():
+    """Test retrieving several posts by link in one call."""
+    for i in range(3):
+        await RSSPostRepository.create(
+            RSSPost(link=f"https://example.com/many-{i}", content="Test")
+        )
+
+    found = await RSSPostRepository.get_by_link_many(
+        ["https://example.com/many-0", "https://example.com/many-2", "https://nonexistent.com"]
+    )
+    assert set(found) == {"https://example.com/many-0", "https://example.com/many-2"}
+    assert found["https://example.com/many-2"].content == "Test"
+
+
 async def test_get_nonexistent_post():
     """Test retrieving a nonexistent post."""
     retrieved = await RSSPostRepository.get_by_link("https://nonexistent.com")
     assert retrieved is None
 
 
-@pytest.mark.asyncio
 async def test_exists_by_link():
     """Test checking if post exists by link."""
     post = RSSPost(
@@ -95,28 +156,50 @@ async def test_exists_by_link():
     assert exists_after is True
 
 
-@pytest.mark.asyncio
 async def test_get_unprocessed():
     """Test retrieving unprocessed posts."""
     # Create some posts
-    for i in range(5):
-        post = RSSPost(
-            link=f"https://example.com/test-{i}",
-            content=f"Test {i}",
-        )
-        await RSSPostRepository.create(post)
+    links = [f"https://example.com/test-{i}" for i in range(5)]
+    await RSSPostRepository.create_many(
+        [RSSPost(link=link, content=f"Test {i}") for i, link in enumerate(links)]
+    )
 
     # Mark some as processed
-    posts = await RSSPostRepository.get_all()
-    await RSSPostRepository.mark_as_processed(posts[0].link, is_event=True)
-    await RSSPostRepository.mark_as_processed(posts[1].link, is_event=False)
+    await RSSPostRepository.mark_many_processed([(links[0], True, None), (links[1], False, None)])
 
     # Get unprocessed
     unprocessed = await RSSPostRepository.get_unprocessed()
     assert len(unprocessed) == 3
 
 
-@pytest.mark.asyncio
+async def test_iter_unprocessed():
+    """Test streaming unprocessed posts through a cursor."""
+    await RSSPostRepository.create_many(
+        [RSSPost(link=f"https://example.com/test-{i}", content=f"Test {i}") for i in range(5)]
+    )
+
+    await RSSPostRepository.mark_as_processed("https://example.com/test-0", is_event=False)
+
+    streamed = [post async for post in RSSPostRepository.iter_unprocessed(prefetch=2)]
+    assert len(streamed) == 4
+    assert all(not post.is_processed for post in streamed)
+
+    limited = [post async for post in RSSPostRepository.iter_unprocessed(limit=2)]
+    assert len(limited) == 2
+
+
+async def test_get_unprocessed_links():
+    """Test retrieving only links of unprocessed posts."""
+    await RSSPostRepository.create_many(
+        [RSSPost(link=f"https://example.com/test-{i}", content=f"Test {i}") for i in range(3)]
+    )
+
+    await RSSPostRepository.mark_as_processed("https://example.com/test-1", is_event=False)
+
+    links = await RSSPostRepository.get_unprocessed_links()
+    assert sorted(links) == ["https://example.com/test-0", "https://example.com/test-2"]
+
+
 async def test_mark_as_processed():
     """Test marking a post as processed."""
     post = RSSPost(
@@ -142,7 +225,32 @@ async def test_mark_as_processed():
     assert retrieved.classified_at is not None
 
 
-@pytest.mark.asyncio
+async def test_mark_many_processed():
+    """Test marking several posts as processed in one call."""
+    await RSSPostRepository.create_many(
+        [RSSPost(link=f"https://example.com/bulk-{i}", content="Test") for i in range(3)]
+    )
+
+    await RSSPostRepository.mark_many_processed(
+        [
+            ("https://example.com/bulk-0", True, {"confidence": 0.9}),
+            ("https://example.com/bulk-1", False, None),
+        ]
+    )
+
+    first = await RSSPostRepository.get_by_link("https://example.com/bulk-0")
+    assert first.is_processed is True
+    assert first.is_event is True
+    assert first.classification_data == {"confidence": 0.9}
+
+    second = await RSSPostRepository.get_by_link("https://example.com/bulk-1")
+    assert second.is_processed is True
+    assert second.is_event is False
+
+    untouched = await RSSPostRepository.get_by_link("https://example.com/bulk-2")
+    assert untouched.is_processed is False
+
+
 async def test_mark_as_unprocessed():
     """Test marking a post as unprocessed."""
     post = RSSPost(
@@ -161,7 +269,6 @@ async def test_mark_as_unprocessed():
     assert retrieved.is_processed is False
 
 
-@pytest.mark.asyncio
 async def test_update_classification():
     """Test updating classification data."""
     post = RSSPost(
@@ -185,7 +292,6 @@ async def test_update_classification():
     assert retrieved.classification_data == new_classification
 
 
-@pytest.mark.asyncio
 async def test_get_all_with_filters():
     """Test retrieving posts with filters."""
     # Create various posts
@@ -196,11 +302,12 @@ async def test_get_all_with_filters():
         ("https://example.com/unprocessed-1", False, None),
     ]
 
-    for link, processed, is_event in posts_data:
-        post = RSSPost(link=link, content="Test")
-        created_link = await RSSPostRepository.create(post)
-        if processed:
-            await RSSPostRepository.mark_as_processed(created_link, is_event=is_event)
+    await RSSPostRepository.create_many(
+        [RSSPost(link=link, content="Test") for link, _, _ in posts_data]
+    )
+    await RSSPostRepository.mark_many_processed(
+        [(link, is_event, None) for link, processed, is_event in posts_data if processed]
+    )
 
     # Test filters
     all_posts = await RSSPostRepository.get_all()
@@ -216,16 +323,12 @@ async def test_get_all_with_filters():
     assert len(unprocessed) == 1
 
 
-@pytest.mark.asyncio
 async def test_get_all_pagination():
     """Test pagination in get_all."""
     # Create 10 posts
-    for i in range(10):
-        post = RSSPost(
-            link=f"https://example.com/test-{i}",
-            content=f"Test {i}",
-        )
-        await RSSPostRepository.create(post)
+    await RSSPostRepository.create_many(
+        [RSSPost(link=f"https://example.com/test-{i}", content=f"Test {i}") for i in range(10)]
+    )
 
     # Test pagination
     page1 = await RSSPostRepository.get_all(limit=3, offset=0)
@@ -240,7 +343,6 @@ async def test_get_all_pagination():
     assert page1_links.isdisjoint(page2_links)
 
 
-@pytest.mark.asyncio
 async def test_delete_post():
     """Test deleting a post."""
     post = RSSPost(
@@ -262,21 +364,17 @@ async def test_delete_post():
     assert retrieved_after is None
 
 
-@pytest.mark.asyncio
 async def test_get_stats():
     """Test getting database statistics."""
     # Create various posts
-    for i in range(10):
-        post = RSSPost(
-            link=f"https://example.com/test-{i}",
-            content=f"Test {i}",
-        )
-        link = await RSSPostRepository.create(post)
+    await RSSPostRepository.create_many(
+        [RSSPost(link=f"https://example.com/test-{i}", content=f"Test {i}") for i in range(10)]
+    )
 
-        # Mark some as processed
-        if i < 7:
-            is_event = i < 4
-            await RSSPostRepository.mark_as_processed(link, is_event=is_event)
+    # Mark some as processed
+    await RSSPostRepository.mark_many_processed(
+        [(f"https://example.com/test-{i}", i < 4, None) for i in range(7)]
+    )
 
     # Get stats
     stats = await RSSPostRepository.get_stats()
@@ -285,37 +383,3 @@ async def test_get_stats():
     assert stats["processed"] == 7
     assert stats["unprocessed"] == 3
     assert stats["events"] == 4
-
-
-@pytest.mark.asyncio
-async def test_post_dataclass_conversions():
-    """Test RSSPost dataclass conversions."""
-    post = RSSPost(
-        link="https://example.com/test",
-        content="Test content",
-        media="https://example.com/image.jpg",
-    )
-
-    # Test to_dict
-    post_dict = post.to_dict()
-    assert "link" in post_dict
-    assert "content" in post_dict
-
-    # Test from_row
-    row_data = {
-        "link": "https://example.com/test",
-        "content": "Test",
-        "pub_date": "2026-01-10",
-        "media": "test.jpg",
-        "is_processed": True,
-        "is_event": False,
-        "classification_data": {"confidence": 0.9},
-        "created_at": datetime.now(),
-        "updated_at": datetime.now(),
-        "classified_at": None,
-    }
-
-    post_from_row = RSSPost.from_row(row_data)
-    assert post_from_row.link == row_data["link"]
-    assert post_from_row.is_processed is True
-    assert post_from_row.is_event is False
@@ -0,0 +1,38 @@
+"""Tests for database model conversions that need no database."""
+
+from datetime import datetime
+
+from src.feed.db import RSSPost
+
+
+def test_post_dataclass_conversions():
+    """Test RSSPost dataclass conversions."""
+    post = RSSPost(
+        link="https://example.com/test",
+        content="Test content",
+        media="https://example.com/image.jpg",
+    )
+
+    # Test to_dict
+    post_dict = post.to_dict()
+    assert "link" in post_dict
+    assert "content" in post_dict
+
+    # Test from_row
+    row_data = {
+        "link": "https://example.com/test",
+        "content": "Test",
+        "pub_date": "2026-01-10",
+        "media": "test.jpg",
+        "is_processed": True,
+        "is_event": False,
+        "classification_data": {"confidence": 0.9},
+        "created_at": datetime.now(),
+        "updated_at": datetime.now(),
+        "classified_at": None,
+    }
+
+    post_from_row = RSSPost.from_row(row_data)
+    assert post_from_row.link == row_data["link"]
+    assert post_from_row.is_processed is True
+    assert post_from_row.is_event is False
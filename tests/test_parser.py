@@ -1,9 +1,34 @@
 """Tests for RSS parser."""
 
+import os
+
+import pytest
+
 from feed import RSSParser, RSSChannel, RSSItem
 
+CENTRALBANK_FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "centralbank_russia.xml")
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """Share one parser (and its HTTP session) across the module's tests."""
+    return RSSParser()
+
+
+@pytest.fixture(scope="module")
+def centralbank_xml():
+    """Raw bytes of the Central Bank of Russia fixture, read once."""
+    with open(CENTRALBANK_FIXTURE, "rb") as f:
+        return f.read()
+
+
+@pytest.fixture(scope="module")
+def centralbank_feed(parser, centralbank_xml):
+    """Parse the Central Bank of Russia fixture once for every test that reads it."""
+    return parser.parse_content(centralbank_xml)
 
-def test_parse_rss_content():
+
+def test_parse_rss_content(parser):
     """Test parsing basic RSS content."""
     rss_xml = """<?xml version="1.0" encoding="UTF-8"?>
     <rss version="2.0">
@@ -20,7 +45,6 @@ def test_parse_rss_content():
         </channel>
     </rss>"""
 
-    parser = RSSParser()
     feed = parser.parse_content(rss_xml)
 
     assert feed.title == "Test Feed"
@@ -28,7 +52,7 @@ def test_parse_rss_content():
     assert len(feed.items) == 1
 
 
-def test_parse_atom_content():
+def test_parse_atom_content(parser):
     """Test parsing Atom feed content."""
     atom_xml = """<?xml version="1.0" encoding="UTF-8"?>
     <feed xmlns="http://www.w3.org/2005/Atom">
@@ -44,14 +68,13 @@ def test_parse_atom_content():
         </entry>
     </feed>"""
 
-    parser = RSSParser()
     feed = parser.parse_content(atom_xml)
 
     assert feed.title == "Test Atom Feed"
     assert len(feed.items) == 1
 
 
-def test_parse_media_urls():
+def test_parse_media_urls(parser):
     """Test parsing media URLs from RSS feed with media:content and HTML images."""
     rss_xml = """<?xml version="1.0" encoding="UTF-8"?>
     <rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/">
@@ -75,7 +98,6 @@ def test_parse_media_urls():
         </channel>
     </rss>"""
 
-    parser = RSSParser()
     feed = parser.parse_content(rss_xml)
 
     assert len(feed.items) == 1
@@ -115,18 +137,9 @@ def test_rss_channel_to_json():
     assert "item_count" in json_str
 
 
-def test_parse_centralbank_russia_fixture():
+def test_parse_centralbank_russia_fixture(centralbank_feed):
     """Test parsing the Central Bank of Russia RSS feed fixture."""
-    import os
-
-    # Load the fixture file
-    fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", "centralbank_russia.xml")
-    with open(fixture_path, "r", encoding="utf-8") as f:
-        rss_content = f.read()
-
-    # Parse the RSS feed
-    parser = RSSParser()
-    feed = parser.parse_content(rss_content)
+    feed = centralbank_feed
 
     # Verify channel metadata
     assert feed.title == "Банк России (@centralbank_russia) - Telegram"
@@ -156,18 +169,9 @@ def test_parse_centralbank_russia_fixture():
         assert item.link is not None
 
 
-def test_centralbank_media_extraction():
+def test_centralbank_media_extraction(centralbank_feed):
     """Test that media URLs are correctly extracted from the Central Bank RSS feed fixture."""
-    import os
-
-    # Load the fixture file
-    fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", "centralbank_russia.xml")
-    with open(fixture_path, "r", encoding="utf-8") as f:
-        rss_content = f.read()
-
-    # Parse the RSS feed
-    parser = RSSParser()
-    feed = parser.parse_content(rss_content)
+    feed = centralbank_feed
 
     # Test first item - has image in description
     first_item = feed.items[0]
@@ -215,3 +219,37 @@ def test_centralbank_media_extraction():
             assert media_url.startswith("https://"), f"Invalid media URL: {media_url}"
             # Most should be from cdn4.telesco.pe
             assert "telesco.pe" in media_url or "telegram.org" in media_url
+
+
+def test_parse_content_with_declared_encoding(parser):
+    """Test that already-decoded text parses regardless of the declared encoding."""
+    rss_xml = """<?xml version="1.0" encoding="windows-1251"?>
+    <rss version="2.0">
+        <channel>
+            <title>Новости</title>
+            <link>https://example.com</link>
+            <item>
+                <link>https://example.com/item1</link>
+                <description>Описание</description>
+            </item>
+        </channel>
+    </rss>"""
+
+    feed = parser.parse_content(rss_xml)
+
+    assert feed.title == "Новости"
+    assert feed.items[0].description == "Описание"
+
+
+def test_parse_stream_matches_parse_content(parser, centralbank_xml, centralbank_feed):
+    """Test that parsing the fixture in small byte chunks yields the same feed."""
+    raw = centralbank_xml
+    chunks = (raw[i : i + 1024] for i in range(0, len(raw), 1024))
+    streamed = parser.parse_stream(chunks)
+    expected = centralbank_feed
+
+    assert streamed.title == expected.title
+    assert streamed.link == expected.link
+    assert [item.to_dict() for item in streamed.items] == [
+        item.to_dict() for item in expected.items
+    ]